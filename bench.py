@@ -0,0 +1,4 @@
+import os
+import sys
+
+os.system(" ".join(["python", "source/bench.py", *sys.argv[1:]]))
@@ -0,0 +1,148 @@
+"""
+Images that are only decoded the first time they are used.
+
+The data modules describe their images with ImageAsset handles instead of loading them on import, so starting the
+game only decodes what the main menu draws. Every file is loaded once however many handles point at it, and scaled
+images are kept in a texture cache on disk, keyed by the modification time of the file they were scaled from, so later
+runs skip both the decode and the rescale. New entries are written once the main menu is drawn and when the game exits.
+"""
+import atexit
+import os
+import pickle
+import time
+
+import pygame
+
+TEXTURE_CACHE_PATH = "assets/texture_cache.dat"
+TEXTURE_CACHE_VERSION = 1
+
+# Converted images keyed by path, and scaled images keyed by path and size
+loaded_images: dict[str, pygame.Surface] = {}
+scaled_images: dict[tuple[str, tuple[int, int]], pygame.Surface] = {}
+
+texture_cache: dict | None = None
+texture_cache_dirty = False  # Whether textures were added since the cache was last written
+
+image_load_count = 0
+texture_cache_hits = 0
+image_load_time = 0.0
+
+
+class ImageAsset:
+    """
+    A handle to an image file, optionally scaled to a fixed size, that is loaded when it is first asked for. A handle
+    without a path stands for an empty image
+    """
+
+    def __init__(self, path: str | None, size: tuple[int, int] | None = None) -> None:
+        self.path: str | None = path
+        self.size: tuple[int, int] | None = size
+        self.surface: pygame.Surface | None = None
+
+    def get(self) -> pygame.Surface:
+        if self.surface is None:
+            if self.path is None:
+                self.surface = pygame.Surface((0, 0))
+            elif self.size is None:
+                self.surface = load_image(self.path)
+            else:
+                self.surface = load_scaled_image(self.path, self.size)
+        return self.surface
+
+
+def asset_property(field_name: str) -> property:
+    """
+    Returns a property that loads the ImageAsset stored in the given field of a data class
+    """
+
+    def get_image(self) -> pygame.Surface | None:
+        asset = getattr(self, field_name)
+        return None if asset is None else asset.get()
+
+    return property(get_image)
+
+
+def load_image(path: str) -> pygame.Surface:
+    """
+    Returns the image at the path converted for fast blitting, decoding it the first time
+    """
+    global image_load_count, image_load_time
+    image = loaded_images.get(path)
+    if image is None:
+        start_time = time.perf_counter()
+        image = pygame.image.load(path).convert_alpha()
+        image_load_time += time.perf_counter() - start_time
+        image_load_count += 1
+        loaded_images[path] = image
+    return image
+
+
+def get_texture_cache() -> dict:
+    """
+    Returns the texture cache, reading it from disk the first time
+    """
+    global texture_cache
+    if texture_cache is None:
+        texture_cache = {"version": TEXTURE_CACHE_VERSION, "textures": {}}
+        if os.path.isfile(TEXTURE_CACHE_PATH):
+            try:
+                loaded_cache = pickle.load(open(TEXTURE_CACHE_PATH, "rb"))
+                if loaded_cache.get("version") == TEXTURE_CACHE_VERSION:
+                    texture_cache = loaded_cache
+            except (pickle.UnpicklingError, EOFError, AttributeError):
+                pass
+    return texture_cache
+
+
+def write_texture_cache() -> None:
+    """
+    Writes the texture cache to disk if textures were added to it since it was last written
+    """
+    global texture_cache_dirty
+    if texture_cache_dirty:
+        pickle.dump(get_texture_cache(), open(TEXTURE_CACHE_PATH, "wb"))
+        texture_cache_dirty = False
+
+
+atexit.register(write_texture_cache)
+
+
+def load_scaled_image(path: str, size: tuple[int, int]) -> pygame.Surface:
+    """
+    Returns the image at the path scaled to the size, taking it from the texture cache when the file hasn't changed
+    since it was cached
+    """
+    global image_load_count, texture_cache_hits, image_load_time, texture_cache_dirty
+    key = (path, size)
+    image = scaled_images.get(key)
+    if image is not None:
+        return image
+
+    modified_time = os.path.getmtime(path)
+    textures = get_texture_cache()["textures"]
+    entry = textures.get(key)
+    if entry is not None and entry["modified_time"] == modified_time:
+        start_time = time.perf_counter()
+        image = pygame.image.frombytes(entry["pixels"], size, "RGBA").convert_alpha()
+        image_load_time += time.perf_counter() - start_time
+        image_load_count += 1
+        texture_cache_hits += 1
+    else:
+        source_image = load_image(path)
+        start_time = time.perf_counter()
+        image = pygame.transform.scale(source_image, size)
+        image_load_time += time.perf_counter() - start_time
+        textures[key] = {"modified_time": modified_time, "pixels": pygame.image.tobytes(image, "RGBA")}
+        texture_cache_dirty = True
+    scaled_images[key] = image
+    return image
+
+
+def print_load_report(stage: str, start_time: float) -> None:
+    """
+    Prints how long it took to reach a stage and how much of that was spent loading images
+    """
+    print(
+        f"{stage} after {time.perf_counter() - start_time:.2f}s, {image_load_count} images loaded "
+        f"({texture_cache_hits} from the texture cache) in {image_load_time:.2f}s"
+    )
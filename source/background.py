@@ -4,8 +4,8 @@ from random import randint
 from typing import Generator
 
 from pygame import Surface
-from pygame.image import load
 
+from asset_manager import load_image
 from commons import WINDOW_HEIGHT, WINDOW_WIDTH, screen
 
 
@@ -27,8 +27,14 @@ class Background:
         self.frame: int = 0
         self.animation_delay: float = animation_delay
         self.animation_interval: float = 0
-        self.surfaces: tuple[Surface, ...] = tuple(load(image).convert_alpha() for image in self.images)
-        self.position: float = randint(0, min(surface.get_width() for surface in self.surfaces))
+        # The images are only loaded once the background is shown
+        self.surfaces: tuple[Surface, ...] = ()
+        self.position: float = 0
+
+    def load(self) -> None:
+        if len(self.surfaces) == 0:
+            self.surfaces = tuple(load_image(image) for image in self.images)
+            self.position = randint(0, min(surface.get_width() for surface in self.surfaces))
 
     def get_width(self) -> int:
         return self.surfaces[self.frame].get_width()
@@ -61,6 +67,7 @@ class BackgroundData:
 
     def __iter__(self) -> Generator[Background, None, None]:
         for parallax in self.parallaxes[self.biome][self.selected]:
+            parallax.load()
             yield parallax
 
     def randomize_selected(self) -> None:
@@ -80,7 +87,7 @@ class BackgroundData:
             self.randomize_selected()
 
     def render(self, offset_x: float = 0, offset_y: float = 0, magnitude: float = 1) -> None:
-        for number, background in enumerate(self.parallaxes[self.biome][self.selected]):
+        for number, background in enumerate(self):
             for tile in range(ceil(WINDOW_WIDTH * 2 / background.get_width())):
                 screen.blit(
                     background.get_surface(),
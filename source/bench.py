@@ -0,0 +1,259 @@
+"""
+Headless benchmark of world generation, entity simulation, mining, lighting, saving and loading.
+
+Run `python bench.py` from the repository root, the timings of every scenario are printed as JSON.
+"""
+import argparse
+import contextlib
+import json
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ["TERRARIA_HEADLESS"] = "1"
+os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+
+import numpy as np
+import pygame
+
+import commons
+import entity_manager
+import game_constants
+import game_data
+import lighting
+import main_utils  # Sets up the render distances the game derives from the window size
+import save_index
+import world
+from game_state import GameState
+from item import Item
+
+pygame.mixer.pre_init(48000, -16, 2, 1024)
+pygame.init()
+pygame.mixer.init()
+
+BENCH_WORLD_NAME = "benchmark"
+
+
+class Timings:
+    """
+    Collects how long each named subsystem took every time it was measured
+    """
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = {}
+
+    @contextlib.contextmanager
+    def measure(self, name: str):
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.samples.setdefault(name, []).append(time.perf_counter() - start_time)
+
+    def to_dict(self) -> dict:
+        """
+        Returns the count, total, mean and worst time in milliseconds of every subsystem
+        """
+        return {
+            name: {
+                "count": len(samples),
+                "total_ms": round(sum(samples) * 1000, 3),
+                "mean_ms": round(sum(samples) / len(samples) * 1000, 4),
+                "max_ms": round(max(samples) * 1000, 3),
+            }
+            for name, samples in self.samples.items()
+        }
+
+
+def prepare_world_for_play() -> None:
+    """
+    Sets up the loaded world, the client player and the camera the way the world selection menu does
+    """
+    world.WORLD_SIZE_X, world.WORLD_SIZE_Y = world.world.tile_grid.width, world.world.tile_grid.height
+    world.biome_border_x_1 = world.WORLD_SIZE_X * 0.333333
+    world.biome_border_x_2 = world.WORLD_SIZE_X * 0.666666
+    world.border_left = int(commons.BLOCK_SIZE)
+    world.border_right = int(world.WORLD_SIZE_X * commons.BLOCK_SIZE - commons.BLOCK_SIZE)
+    world.border_up = int(commons.BLOCK_SIZE * 1.5)
+    world.border_down = int(world.WORLD_SIZE_Y * commons.BLOCK_SIZE - commons.BLOCK_SIZE * 1.5)
+    world.compute_terrain_masks()
+
+    entity_manager.kill_all_entities()
+    commons.PLAYER_DATA["name"] = BENCH_WORLD_NAME
+    commons.PLAYER_DATA["hp"] = 100
+    commons.PLAYER_DATA["max_hp"] = 100
+    entity_manager.create_player()
+    client_player = entity_manager.get_client_player()
+    client_player.position = tuple(world.world.spawn_position)
+    client_player.previous_position = client_player.position
+    entity_manager.camera_position = client_player.position
+    entity_manager.old_camera_position = client_player.position
+    world.clear_terrain_chunks()
+    GameState.map_light = np.zeros((world.WORLD_SIZE_X, world.WORLD_SIZE_Y), dtype=np.int16)
+    commons.game_state = "PLAYING"
+
+
+def get_terrain_position() -> tuple[float, float]:
+    return (
+        commons.WINDOW_WIDTH * 0.5 - entity_manager.camera_position[0],
+        commons.WINDOW_HEIGHT * 0.5 - entity_manager.camera_position[1],
+    )
+
+
+def run_generate(timings: Timings, world_size: str, seed: int) -> None:
+    world.WORLD_SIZE_X, world.WORLD_SIZE_Y = game_constants.WORLD_SIZES[world_size]
+    world.WORLD_NAME = BENCH_WORLD_NAME
+    with timings.measure("generate_terrain"):
+        world.generate_terrain("DEFAULT", seed=seed)
+    with timings.measure("save_full"):
+        world.world.save()
+    with timings.measure("load"):
+        world.load(BENCH_WORLD_NAME)
+
+
+def run_simulate(timings: Timings, enemy_count: int, ticks: int) -> None:
+    """
+    Simulates and draws the area around the spawn point with the given number of enemies, the player firing arrows
+    and particles being spawned
+    """
+    client_player = entity_manager.get_client_player()
+    for _ in range(enemy_count):
+        entity_manager.spawn_enemy(
+            random.randint(1, 5),
+            (
+                client_player.position[0] + random.uniform(-0.5, 0.5) * commons.WINDOW_WIDTH,
+                client_player.position[1] - random.uniform(0, 0.5) * commons.WINDOW_HEIGHT,
+            ),
+        )
+    bow = Item(game_data.get_item_id_by_id_str("item.wood_bow"))
+    arrow_id = game_data.get_item_id_by_id_str("item.wooden_arrow")
+
+    commons.DELTA_TIME = commons.SIMULATION_DELTA_TIME
+    for tick in range(ticks):
+        if tick % 10 == 0:
+            entity_manager.spawn_projectile(client_player.position, random.uniform(-math.pi, 0), bow, arrow_id, "Player")
+        for _ in range(5):
+            entity_manager.spawn_particle(client_player.position, pygame.Color(200, 0, 0), magnitude=3, size=8, gravity=0.1)
+
+        # Keep the player alive so the ticks measure the simulation rather than dying and respawning
+        client_player.hp = client_player.max_hp
+
+        with timings.measure("tick"):
+            with timings.measure("enemies"):
+                entity_manager.update_enemies()
+            with timings.measure("projectiles"):
+                entity_manager.update_projectiles()
+            with timings.measure("particles"):
+                entity_manager.update_particles()
+            with timings.measure("physics_items"):
+                entity_manager.update_physics_items()
+            with timings.measure("dormancy"):
+                entity_manager.update_dormancy()
+            with timings.measure("player"):
+                client_player.previous_position = client_player.position
+                client_player.update()
+                client_player.animate()
+            entity_manager.old_camera_position = entity_manager.camera_position
+            entity_manager.camera_position = client_player.position
+
+        with timings.measure("draw"):
+            with timings.measure("draw_terrain"):
+                world.draw_terrain(get_terrain_position())
+            with timings.measure("draw_entities"):
+                entity_manager.draw_projectiles()
+                client_player.draw()
+                entity_manager.draw_particles()
+                entity_manager.draw_enemies()
+                entity_manager.draw_physics_items()
+            with timings.measure("lighting"):
+                lighting.render_light_job(lighting.LightJob(entity_manager.camera_position, commons.CURRENT_SKY_LIGHTING))
+
+
+def run_mine(timings: Timings, tunnel_length: int) -> None:
+    """
+    Digs a three tile high tunnel to the right of the spawn point, redrawing the terrain around each column
+    """
+    start_x = int(world.world.spawn_position[0] // commons.BLOCK_SIZE)
+    start_y = int(world.world.spawn_position[1] // commons.BLOCK_SIZE) + 8
+    for tile_x in range(start_x, min(start_x + tunnel_length, world.WORLD_SIZE_X - 1)):
+        entity_manager.camera_position = (tile_x * commons.BLOCK_SIZE, start_y * commons.BLOCK_SIZE)
+        world.draw_terrain(get_terrain_position())
+        for tile_y in range(start_y, start_y + 3):
+            tile_id = world.world.tile_grid.get_tile(tile_x, tile_y)
+            if tile_id == game_data.air_tile_id:
+                continue
+            with timings.measure("mine_tile"):
+                if commons.TileTag.MULTI_TILE in game_data.get_tile_by_id(tile_id).tags:
+                    world.remove_multitile(world.get_multitile_origin(tile_x, tile_y), drop_items=False)
+                else:
+                    world.world.tile_grid.set_tile(tile_x, tile_y, game_data.air_tile_id)
+                    world.update_terrain_surface(tile_x, tile_y)
+
+
+def run_save_and_load(timings: Timings) -> None:
+    with timings.measure("save_changed"):
+        world.world.save()
+    with timings.measure("load"):
+        world.load(BENCH_WORLD_NAME)
+
+
+def run_scenario(scenario, *scenario_arguments) -> dict:
+    timings = Timings()
+    with timings.measure("total"):
+        scenario(timings, *scenario_arguments)
+    return timings.to_dict()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Times the game's subsystems in scripted headless scenarios")
+    parser.add_argument("--world-size", choices=list(game_constants.WORLD_SIZES), default="LARGE")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--enemies", type=int, default=50)
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--tunnel-length", type=int, default=200)
+    parser.add_argument("--output", help="Also write the results to this file")
+    arguments = parser.parse_args()
+
+    random.seed(arguments.seed)
+    # The benchmark world and its save index entry go to a temporary directory so the player's saves are never touched
+    save_directory = tempfile.mkdtemp(prefix="terraria_bench_")
+    world.WORLD_SAVE_DIRECTORY = os.path.join(save_directory, "worlds")
+    os.makedirs(world.WORLD_SAVE_DIRECTORY)
+    save_index.SAVE_INDEX_PATH = os.path.join(save_directory, "save_index.dat")
+    save_index.save_index = None
+    scenarios = {}
+    # The game prints progress while generating and saving, which would mix with the results
+    with contextlib.redirect_stdout(sys.stderr):
+        try:
+            scenarios["generate"] = run_scenario(run_generate, arguments.world_size, arguments.seed)
+            prepare_world_for_play()
+            scenarios["simulate"] = run_scenario(run_simulate, arguments.enemies, arguments.ticks)
+            scenarios["mine"] = run_scenario(run_mine, arguments.tunnel_length)
+            scenarios["save_and_load"] = run_scenario(run_save_and_load)
+        finally:
+            shutil.rmtree(save_directory, ignore_errors=True)
+
+    results = {
+        "config": {
+            "world_size": arguments.world_size,
+            "seed": arguments.seed,
+            "enemies": arguments.enemies,
+            "ticks": arguments.ticks,
+            "tunnel_length": arguments.tunnel_length,
+            "simulation_rate": commons.SIMULATION_RATE,
+        },
+        "scenarios": scenarios,
+    }
+    output = json.dumps(results, indent=4)
+    print(output)
+    if arguments.output is not None:
+        with open(arguments.output, "w") as file:
+            file.write(output)
+
+
+if __name__ == "__main__":
+    main()
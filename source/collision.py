@@ -0,0 +1,75 @@
+"""
+Tile collision queries shared by everything that moves through the world.
+
+The tags of every tile id are folded into bitflags once, so a query only has to look the ids of the tiles under a
+box up in a flat list instead of scanning tag tuples and building a rect for every tile it checks.
+"""
+import commons
+import game_data
+import world
+
+SOLID = 1
+PLATFORM = 2
+DAMAGING = 4
+
+# Collision flags of every tile id, built from game_data on first use
+tile_collision_flags: list[int] | None = None
+
+
+def get_tile_collision_flags() -> list[int]:
+    """
+    Returns the collision flags of every tile id, indexed by the id
+    """
+    global tile_collision_flags
+    if tile_collision_flags is None:
+        tile_collision_flags = []
+        for tile_data in game_data.json_tile_data:
+            flags = 0
+            if commons.TileTag.NO_COLLIDE not in tile_data.tags:
+                flags |= SOLID
+            if commons.TileTag.PLATFORM in tile_data.tags:
+                flags |= PLATFORM
+            if commons.TileTag.DAMAGING in tile_data.tags:
+                flags |= DAMAGING
+            tile_collision_flags.append(flags)
+    return tile_collision_flags
+
+
+def overlapping_solids(left: int, top: int, width: int, height: int, ignore_flags: int = 0) -> list[tuple[int, int, int, int]]:
+    """
+    Returns the id, flags and top left pixel position of every solid tile overlapping the box, skipping tiles with any
+    of the ignored flags, ordered by column and then by row
+    """
+    if width <= 0 or height <= 0:
+        return []
+    block_size = commons.BLOCK_SIZE
+    min_x = max(0, int(left // block_size))
+    min_y = max(0, int(top // block_size))
+    max_x = min(world.WORLD_SIZE_X - 1, int((left + width - 1) // block_size))
+    max_y = min(world.WORLD_SIZE_Y - 1, int((top + height - 1) // block_size))
+    if min_x > max_x or min_y > max_y:
+        return []
+
+    flags_lookup = get_tile_collision_flags()
+    columns = world.world.tile_grid.tiles[min_x:max_x + 1, min_y:max_y + 1].tolist()
+    solids = []
+    for tile_x, column in enumerate(columns, min_x):
+        for tile_y, tile_id in enumerate(column, min_y):
+            flags = flags_lookup[tile_id]
+            if flags & SOLID and not flags & ignore_flags:
+                solids.append((tile_id, flags, tile_x * block_size, tile_y * block_size))
+    return solids
+
+
+def block_overlaps(block_left: int, block_top: int, left: float, top: float, width: float, height: float) -> bool:
+    """
+    Checks if the tile at the given pixel position overlaps the box, matching Rect.colliderect
+    """
+    return (
+            width > 0
+            and height > 0
+            and block_left < left + width
+            and left < block_left + commons.BLOCK_SIZE
+            and block_top < top + height
+            and top < block_top + commons.BLOCK_SIZE
+    )
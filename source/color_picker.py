@@ -37,14 +37,14 @@ class ColorPicker:
         self.selected_blue: int = 0
         self.selected_x: int = 0
         self.selected_y: int = height
-        self.surface: pygame.Surface = pygame.Surface((0, 0))
+        # Rendered the first time the picker is drawn
+        self.surface: pygame.Surface | None = None
         self.rect = Rect(
             self.position[0] + self.border_size,
             self.position[1] + self.border_size,
             width,
             height,
         )
-        self.render_surface()
 
     def render_surface(self):
         """
@@ -146,6 +146,8 @@ class ColorPicker:
         """
         Draws the color picker's surface and draws the location of the selected color
         """
+        if self.surface is None:
+            self.render_surface()
         commons.screen.blit(self.surface, self.position)
         pygame.draw.circle(
             commons.screen,
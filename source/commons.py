@@ -1,3 +1,4 @@
+import os
 from datetime import datetime
 from enum import Enum
 from typing import TextIO, TypedDict
@@ -81,6 +82,12 @@ class PlayerData(TypedDict):
     last_played_date: datetime
 
 
+# Headless mode runs without a window or an audio device, for benchmarks and machines without a display
+HEADLESS: bool = os.environ.get("TERRARIA_HEADLESS", "0") == "1"
+if HEADLESS:
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+
 pygame.init()
 
 BLOCK_SIZE: int = 16
@@ -121,6 +128,13 @@ AUTO_SAVE_FREQUENCY: float = float(config_data[17])
 EXPERIMENTAL_LIGHTING: bool = bool(int(config_data[18]))
 SMOOTH_CAM: bool = bool(int(config_data[19]))
 DRAW_UI: bool = bool(int(config_data[20]))
+# Config files written before the simulation rate was added don't have its line
+SIMULATION_RATE: int = int(config_data[21]) if len(config_data) > 21 else 60
+SIMULATION_DELTA_TIME: float = 1.0 / SIMULATION_RATE
+
+if HEADLESS:
+    RUN_FULLSCREEN = False
+    MUSIC = False
 
 if RUN_FULLSCREEN:
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.FULLSCREEN)
@@ -180,6 +194,8 @@ is_holding_item: bool = False
 
 OLD_TIME_MILLISECONDS: int = pygame.time.get_ticks()
 DELTA_TIME: int = 0
+FRAME_TIME: float = 0  # Real time the last frame took, DELTA_TIME is the fixed simulation step while ticking
+INTERPOLATION_ALPHA: float = 0  # How far between the previous and the current tick the frame is drawn
 
 CURRENT_SKY_LIGHTING: int = 255
 
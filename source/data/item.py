@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
+from asset_manager import ImageAsset, asset_property
 from commons import ItemPrefixGroup, ItemTag
-from pygame import Surface, image
 
 
 @dataclass
@@ -17,7 +17,9 @@ class ItemData:
     hold_offset: float
     pickup_sound: str
     drop_sound: str
-    surface: Surface
+    surface_asset: ImageAsset
+
+    surface = asset_property("surface_asset")
 
 
 @dataclass
@@ -44,7 +46,9 @@ class PickaxeItemData(ItemData):
     prefixes: tuple[ItemPrefixGroup, ...]
     pickaxe_power: float
     use_sound: str
-    world_override_image: Surface | None
+    world_override_image_asset: ImageAsset | None
+
+    world_override_image = asset_property("world_override_image_asset")
 
 
 @dataclass
@@ -56,7 +60,9 @@ class HammerItemData(ItemData):
     prefixes: tuple[ItemPrefixGroup, ...]
     use_sound: str
     hammer_power: float
-    world_override_image: Surface | None
+    world_override_image_asset: ImageAsset | None
+
+    world_override_image = asset_property("world_override_image_asset")
 
 
 @dataclass
@@ -68,7 +74,9 @@ class AxeItemData(ItemData):
     prefixes: tuple[ItemPrefixGroup, ...]
     axe_power: float
     use_sound: str
-    world_override_image: Surface | None
+    world_override_image_asset: ImageAsset | None
+
+    world_override_image = asset_property("world_override_image_asset")
 
 
 @dataclass
@@ -79,7 +87,9 @@ class SwordItemData(ItemData):
     crit_chance: float
     prefixes: tuple[ItemPrefixGroup, ...]
     use_sound: str
-    world_override_image: Surface | None
+    world_override_image_asset: ImageAsset | None
+
+    world_override_image = asset_property("world_override_image_asset")
 
 
 @dataclass
@@ -95,7 +105,9 @@ class RangedItemData(ItemData):
     ranged_accuracy: float
     ranged_num_projectiles: int
     use_sound: str
-    world_override_image: Surface | None
+    world_override_image_asset: ImageAsset | None
+
+    world_override_image = asset_property("world_override_image_asset")
 
 
 @dataclass
@@ -105,7 +117,9 @@ class AmmunitionItemData(ItemData):
     ammo_gravity_modifier: float
     ammo_knockback_modifier: float
     ricochet_amount: int
-    ammo_image: Surface
+    ammo_image_asset: ImageAsset
+
+    ammo_image = asset_property("ammo_image_asset")
 
 
 @dataclass
@@ -113,8 +127,11 @@ class GrapplingHookItemData(ItemData):
     grapple_speed: float
     grapple_chain_length: float
     grapple_max_chains: int
-    grapple_chain_image: Surface
-    grapple_claw_image: Surface
+    grapple_chain_image_asset: ImageAsset
+    grapple_claw_image_asset: ImageAsset
+
+    grapple_chain_image = asset_property("grapple_chain_image_asset")
+    grapple_claw_image = asset_property("grapple_claw_image_asset")
 
 
 @dataclass
@@ -126,7 +143,9 @@ class MagicalWeaponItemData(ItemData):
     crit_chance: float
     use_sound: str
     mana_cost: int
-    world_override_image: Surface | None
+    world_override_image_asset: ImageAsset | None
+
+    world_override_image = asset_property("world_override_image_asset")
 
 
 ITEM_DATA: tuple[ItemData, ...] = (
@@ -143,7 +162,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         tile_id_str="tile.UNNAMED",
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
-        surface=Surface((0, 0)),
+        surface_asset=ImageAsset(None),
     ),
     PickaxeItemData(
         id=1,
@@ -164,8 +183,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         use_sound="sound.swing",
         hold_offset=0.8,
-        surface=image.load("assets/images/items/iron_pickaxe.png").convert_alpha(),
-        world_override_image=None,
+        surface_asset=ImageAsset("assets/images/items/iron_pickaxe.png"),
+        world_override_image_asset=None,
     ),
     TileItemData(
         id=2,
@@ -180,7 +199,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         tile_id_str="tile.dirt",
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
-        surface=image.load("assets/images/items/dirt_block.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/dirt_block.png"),
     ),
     TileItemData(
         id=3,
@@ -195,7 +214,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         tile_id_str="tile.stone",
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
-        surface=image.load("assets/images/items/stone_block.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/stone_block.png"),
     ),
     SwordItemData(
         id=4,
@@ -219,8 +238,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         use_sound="sound.swing",
         hold_offset=0.8,
-        surface=image.load("assets/images/items/iron_broadsword.png").convert_alpha(),
-        world_override_image=None,
+        surface_asset=ImageAsset("assets/images/items/iron_broadsword.png"),
+        world_override_image_asset=None,
     ),
     TileItemData(
         id=5,
@@ -235,7 +254,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/mushroom.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/mushroom.png"),
     ),
     TileItemData(
         id=6,
@@ -250,7 +269,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/iron_ore.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/iron_ore.png"),
     ),
     WallItemData(
         id=7,
@@ -265,7 +284,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         wall_id_str="wall.dirt",
-        surface=image.load("assets/images/items/dirt_wall.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/dirt_wall.png"),
     ),
     WallItemData(
         id=8,
@@ -280,7 +299,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         wall_id_str="wall.stone",
-        surface=image.load("assets/images/items/stone_wall.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/stone_wall.png"),
     ),
     TileItemData(
         id=9,
@@ -295,7 +314,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/snow.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/snow.png"),
     ),
     WallItemData(
         id=10,
@@ -310,7 +329,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         hold_offset=0.0,
         wall_id_str="wall.snow",
-        surface=image.load("assets/images/items/snow_wall.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/snow_wall.png"),
     ),
     TileItemData(
         id=11,
@@ -325,7 +344,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/ice.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/ice.png"),
     ),
     WallItemData(
         id=12,
@@ -340,7 +359,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         hold_offset=0.0,
         wall_id_str="wall.ice",
-        surface=image.load("assets/images/items/ice_wall.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/ice_wall.png"),
     ),
     TileItemData(
         id=13,
@@ -355,7 +374,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/wood.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/wood.png"),
     ),
     WallItemData(
         id=14,
@@ -370,7 +389,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         wall_id_str="wall.wood",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/wood_wall.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/wood_wall.png"),
     ),
     TileItemData(
         id=15,
@@ -385,7 +404,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/copper_ore.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/copper_ore.png"),
     ),
     TileItemData(
         id=16,
@@ -400,7 +419,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/silver_ore.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/silver_ore.png"),
     ),
     TileItemData(
         id=17,
@@ -415,7 +434,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         hold_offset=0.0,
         tile_id_str="tile.sand",
-        surface=image.load("assets/images/items/sand.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/sand.png"),
     ),
     WallItemData(
         id=18,
@@ -430,7 +449,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         hold_offset=0.0,
         wall_id_str="wall.hardened_sand",
-        surface=image.load("assets/images/items/hardened_sand_wall.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/hardened_sand_wall.png"),
     ),
     TileItemData(
         id=19,
@@ -445,7 +464,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/sandstone.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/sandstone.png"),
     ),
     WallItemData(
         id=20,
@@ -460,7 +479,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         hold_offset=0.0,
         wall_id_str="wall.sandstone",
-        surface=image.load("assets/images/items/sandstone_wall.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/sandstone_wall.png"),
     ),
     TileItemData(
         id=21,
@@ -475,7 +494,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/wood_platform.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/wood_platform.png"),
     ),
     SwordItemData(
         id=22,
@@ -499,8 +518,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         use_sound="sound.swing",
         hold_offset=0.8,
-        surface=image.load("assets/images/items/copper_broadsword.png").convert_alpha(),
-        world_override_image=None,
+        surface_asset=ImageAsset("assets/images/items/copper_broadsword.png"),
+        world_override_image_asset=None,
     ),
     SwordItemData(
         id=23,
@@ -524,8 +543,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         use_sound="sound.swing",
         hold_offset=0.9,
-        surface=image.load("assets/images/items/excalibur.png").convert_alpha(),
-        world_override_image=None,
+        surface_asset=ImageAsset("assets/images/items/excalibur.png"),
+        world_override_image_asset=None,
     ),
     SwordItemData(
         id=24,
@@ -549,8 +568,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         use_sound="sound.swing",
         hold_offset=0.8,
-        surface=image.load("assets/images/items/wood_broadsword.png").convert_alpha(),
-        world_override_image=None,
+        surface_asset=ImageAsset("assets/images/items/wood_broadsword.png"),
+        world_override_image_asset=None,
     ),
     RangedItemData(
         id=25,
@@ -579,8 +598,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         use_sound="sound.bow",
         hold_offset=0.8,
-        surface=image.load("assets/images/items/wood_bow.png").convert_alpha(),
-        world_override_image=None,
+        surface_asset=ImageAsset("assets/images/items/wood_bow.png"),
+        world_override_image_asset=None,
     ),
     AmmunitionItemData(
         id=26,
@@ -599,8 +618,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         hold_offset=0.0,
         ricochet_amount=1,
-        surface=image.load("assets/images/items/wooden_arrow.png").convert_alpha(),
-        ammo_image=image.load("assets/images/projectiles/wooden_arrow.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/wooden_arrow.png"),
+        ammo_image_asset=ImageAsset("assets/images/projectiles/wooden_arrow.png"),
     ),
     RangedItemData(
         id=27,
@@ -629,8 +648,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         use_sound="sound.gun_shot",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/musket.png").convert_alpha(),
-        world_override_image=None,
+        surface_asset=ImageAsset("assets/images/items/musket.png"),
+        world_override_image_asset=None,
     ),
     AmmunitionItemData(
         id=28,
@@ -649,8 +668,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         hold_offset=0.0,
         ricochet_amount=1,
-        surface=image.load("assets/images/items/musket_ball.png").convert_alpha(),
-        ammo_image=image.load("assets/images/projectiles/musket_ball.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/musket_ball.png"),
+        ammo_image_asset=ImageAsset("assets/images/projectiles/musket_ball.png"),
     ),
     AmmunitionItemData(
         id=29,
@@ -669,8 +688,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.coins",
         hold_offset=0.0,
         ricochet_amount=1,
-        surface=image.load("assets/images/items/copper_coin.png").convert_alpha(),
-        ammo_image=image.load("assets/images/projectiles/musket_ball.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/copper_coin.png"),
+        ammo_image_asset=ImageAsset("assets/images/projectiles/musket_ball.png"),
     ),
     AmmunitionItemData(
         id=30,
@@ -689,8 +708,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.coins",
         hold_offset=0.0,
         ricochet_amount=1,
-        surface=image.load("assets/images/items/silver_coin.png").convert_alpha(),
-        ammo_image=image.load("assets/images/projectiles/musket_ball.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/silver_coin.png"),
+        ammo_image_asset=ImageAsset("assets/images/projectiles/musket_ball.png"),
     ),
     AmmunitionItemData(
         id=31,
@@ -709,8 +728,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.coins",
         hold_offset=0.0,
         ricochet_amount=1,
-        surface=image.load("assets/images/items/gold_coin.png").convert_alpha(),
-        ammo_image=image.load("assets/images/projectiles/musket_ball.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/gold_coin.png"),
+        ammo_image_asset=ImageAsset("assets/images/projectiles/musket_ball.png"),
     ),
     AmmunitionItemData(
         id=32,
@@ -729,8 +748,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.coins",
         hold_offset=0.0,
         ricochet_amount=1,
-        surface=image.load("assets/images/items/platinum_coin.png").convert_alpha(),
-        ammo_image=image.load("assets/images/projectiles/musket_ball.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/platinum_coin.png"),
+        ammo_image_asset=ImageAsset("assets/images/projectiles/musket_ball.png"),
     ),
     PickaxeItemData(
         id=33,
@@ -751,8 +770,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         use_sound="sound.swing",
         hold_offset=0.8,
-        surface=image.load("assets/images/items/copper_pickaxe.png").convert_alpha(),
-        world_override_image=None,
+        surface_asset=ImageAsset("assets/images/items/copper_pickaxe.png"),
+        world_override_image_asset=None,
     ),
     HammerItemData(
         id=34,
@@ -773,8 +792,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         use_sound="sound.swing",
         hammer_power=0,
         hold_offset=0.8,
-        surface=image.load("assets/images/items/copper_hammer.png").convert_alpha(),
-        world_override_image=None,
+        surface_asset=ImageAsset("assets/images/items/copper_hammer.png"),
+        world_override_image_asset=None,
     ),
     HammerItemData(
         id=35,
@@ -795,8 +814,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         use_sound="sound.swing",
         hammer_power=0,
         hold_offset=0.8,
-        surface=image.load("assets/images/items/wood_hammer.png").convert_alpha(),
-        world_override_image=None,
+        surface_asset=ImageAsset("assets/images/items/wood_hammer.png"),
+        world_override_image_asset=None,
     ),
     MaterialItemData(
         id=36,
@@ -810,7 +829,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/gel.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/gel.png"),
     ),
     TileItemData(
         id=37,
@@ -825,7 +844,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/wood_chest.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/wood_chest.png"),
     ),
     TileItemData(
         id=38,
@@ -840,7 +859,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/workbench.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/workbench.png"),
     ),
     TileItemData(
         id=39,
@@ -855,7 +874,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/wood_door.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/wood_door.png"),
     ),
     TileItemData(
         id=40,
@@ -870,7 +889,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/torch.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/torch.png"),
     ),
     TileItemData(
         id=41,
@@ -885,7 +904,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/spike.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/spike.png"),
     ),
     GrapplingHookItemData(
         id=42,
@@ -902,9 +921,9 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         hold_offset=0.0,
-        surface=image.load("assets/images/items/grappling_hook.png").convert_alpha(),
-        grapple_chain_image=image.load("assets/images/chains/grappling_hook_chain.png").convert_alpha(),
-        grapple_claw_image=image.load("assets/images/projectiles/grappling_hook_claw.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/grappling_hook.png"),
+        grapple_chain_image_asset=ImageAsset("assets/images/chains/grappling_hook_chain.png"),
+        grapple_claw_image_asset=ImageAsset("assets/images/projectiles/grappling_hook_claw.png"),
     ),
     MagicalWeaponItemData(
         id=43,
@@ -925,8 +944,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         hold_offset=0.0,
         use_sound="sound.swing",
         mana_cost=20,
-        surface=image.load("assets/images/items/water_bolt.png").convert_alpha(),
-        world_override_image=None,
+        surface_asset=ImageAsset("assets/images/items/water_bolt.png"),
+        world_override_image_asset=None,
     ),
     TileItemData(
         id=44,
@@ -941,7 +960,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         tile_id_str="tile.painting_a",
-        surface=image.load("assets/images/items/painting_a.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/painting_a.png"),
     ),
     TileItemData(
         id=45,
@@ -956,7 +975,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         tile_id_str="tile.painting_b",
-        surface=image.load("assets/images/items/painting_b.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/painting_b.png"),
     ),
     TileItemData(
         id=46,
@@ -971,7 +990,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         pickup_sound="sound.grab",
         drop_sound="sound.grab",
         tile_id_str="tile.painting_c",
-        surface=image.load("assets/images/items/painting_c.png").convert_alpha(),
+        surface_asset=ImageAsset("assets/images/items/painting_c.png"),
     ),
     AxeItemData(
         id=47,
@@ -992,8 +1011,8 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         use_sound="sound.swing",
         hold_offset=0.8,
-        surface=image.load("assets/images/items/copper_axe.png").convert_alpha(),
-        world_override_image=None,
+        surface_asset=ImageAsset("assets/images/items/copper_axe.png"),
+        world_override_image_asset=None,
     ),
     SwordItemData(
         id=48,
@@ -1017,7 +1036,7 @@ ITEM_DATA: tuple[ItemData, ...] = (
         drop_sound="sound.grab",
         use_sound="sound.swing",
         hold_offset=0.8,
-        surface=image.load("assets/images/items/iron_shortsword.png").convert_alpha(),
-        world_override_image=None,
+        surface_asset=ImageAsset("assets/images/items/iron_shortsword.png"),
+        world_override_image_asset=None,
     ),
 )
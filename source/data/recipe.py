@@ -0,0 +1,216 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class IngredientData:
+    item_id_str: str
+    amount: int
+
+
+@dataclass
+class RecipeData:
+    id: int
+    id_str: str
+    item_id_str: str
+    amount: int
+    ingredients: tuple[IngredientData, ...]
+
+
+RECIPE_DATA: tuple[RecipeData, ...] = (
+    RecipeData(
+        id=0,
+        id_str="recipe.wood_wall",
+        item_id_str="item.wood_wall",
+        amount=4,
+        ingredients=(IngredientData(item_id_str="item.wood", amount=1),),
+    ),
+    RecipeData(
+        id=1,
+        id_str="recipe.wood_platform",
+        item_id_str="item.wood_platform",
+        amount=2,
+        ingredients=(IngredientData(item_id_str="item.wood", amount=1),),
+    ),
+    RecipeData(
+        id=2,
+        id_str="recipe.workbench",
+        item_id_str="item.workbench",
+        amount=1,
+        ingredients=(IngredientData(item_id_str="item.wood", amount=10),),
+    ),
+    RecipeData(
+        id=3,
+        id_str="recipe.wood_chest",
+        item_id_str="item.wood_chest",
+        amount=1,
+        ingredients=(
+            IngredientData(item_id_str="item.wood", amount=8),
+            IngredientData(item_id_str="item.iron_ore", amount=2),
+        ),
+    ),
+    RecipeData(
+        id=4,
+        id_str="recipe.wood_door",
+        item_id_str="item.wood_door",
+        amount=1,
+        ingredients=(IngredientData(item_id_str="item.wood", amount=6),),
+    ),
+    RecipeData(
+        id=5,
+        id_str="recipe.torch",
+        item_id_str="item.torch",
+        amount=3,
+        ingredients=(
+            IngredientData(item_id_str="item.wood", amount=1),
+            IngredientData(item_id_str="item.gel", amount=1),
+        ),
+    ),
+    RecipeData(
+        id=6,
+        id_str="recipe.wooden_arrow",
+        item_id_str="item.wooden_arrow",
+        amount=10,
+        ingredients=(
+            IngredientData(item_id_str="item.wood", amount=1),
+            IngredientData(item_id_str="item.stone_block", amount=1),
+        ),
+    ),
+    RecipeData(
+        id=7,
+        id_str="recipe.wood_broadsword",
+        item_id_str="item.wood_broadsword",
+        amount=1,
+        ingredients=(IngredientData(item_id_str="item.wood", amount=7),),
+    ),
+    RecipeData(
+        id=8,
+        id_str="recipe.wood_bow",
+        item_id_str="item.wood_bow",
+        amount=1,
+        ingredients=(IngredientData(item_id_str="item.wood", amount=10),),
+    ),
+    RecipeData(
+        id=9,
+        id_str="recipe.wood_hammer",
+        item_id_str="item.wood_hammer",
+        amount=1,
+        ingredients=(IngredientData(item_id_str="item.wood", amount=8),),
+    ),
+    RecipeData(
+        id=10,
+        id_str="recipe.copper_pickaxe",
+        item_id_str="item.copper_pickaxe",
+        amount=1,
+        ingredients=(
+            IngredientData(item_id_str="item.copper_ore", amount=12),
+            IngredientData(item_id_str="item.wood", amount=4),
+        ),
+    ),
+    RecipeData(
+        id=11,
+        id_str="recipe.copper_axe",
+        item_id_str="item.copper_axe",
+        amount=1,
+        ingredients=(
+            IngredientData(item_id_str="item.copper_ore", amount=9),
+            IngredientData(item_id_str="item.wood", amount=3),
+        ),
+    ),
+    RecipeData(
+        id=12,
+        id_str="recipe.copper_hammer",
+        item_id_str="item.copper_hammer",
+        amount=1,
+        ingredients=(
+            IngredientData(item_id_str="item.copper_ore", amount=10),
+            IngredientData(item_id_str="item.wood", amount=3),
+        ),
+    ),
+    RecipeData(
+        id=13,
+        id_str="recipe.copper_broadsword",
+        item_id_str="item.copper_broadsword",
+        amount=1,
+        ingredients=(IngredientData(item_id_str="item.copper_ore", amount=8),),
+    ),
+    RecipeData(
+        id=14,
+        id_str="recipe.iron_pickaxe",
+        item_id_str="item.iron_pickaxe",
+        amount=1,
+        ingredients=(
+            IngredientData(item_id_str="item.iron_ore", amount=12),
+            IngredientData(item_id_str="item.wood", amount=3),
+        ),
+    ),
+    RecipeData(
+        id=15,
+        id_str="recipe.iron_broadsword",
+        item_id_str="item.iron_broadsword",
+        amount=1,
+        ingredients=(IngredientData(item_id_str="item.iron_ore", amount=8),),
+    ),
+    RecipeData(
+        id=16,
+        id_str="recipe.iron_shortsword",
+        item_id_str="item.iron_shortsword",
+        amount=1,
+        ingredients=(IngredientData(item_id_str="item.iron_ore", amount=7),),
+    ),
+    RecipeData(
+        id=17,
+        id_str="recipe.grappling_hook",
+        item_id_str="item.grappling_hook",
+        amount=1,
+        ingredients=(IngredientData(item_id_str="item.iron_ore", amount=15),),
+    ),
+    RecipeData(
+        id=18,
+        id_str="recipe.musket_ball",
+        item_id_str="item.musket_ball",
+        amount=70,
+        ingredients=(IngredientData(item_id_str="item.silver_ore", amount=1),),
+    ),
+    RecipeData(
+        id=19,
+        id_str="recipe.dirt_wall",
+        item_id_str="item.dirt_wall",
+        amount=4,
+        ingredients=(IngredientData(item_id_str="item.dirt_block", amount=1),),
+    ),
+    RecipeData(
+        id=20,
+        id_str="recipe.stone_wall",
+        item_id_str="item.stone_wall",
+        amount=4,
+        ingredients=(IngredientData(item_id_str="item.stone_block", amount=1),),
+    ),
+    RecipeData(
+        id=21,
+        id_str="recipe.snow_wall",
+        item_id_str="item.snow_wall",
+        amount=4,
+        ingredients=(IngredientData(item_id_str="item.snow", amount=1),),
+    ),
+    RecipeData(
+        id=22,
+        id_str="recipe.ice_wall",
+        item_id_str="item.ice_wall",
+        amount=4,
+        ingredients=(IngredientData(item_id_str="item.ice", amount=1),),
+    ),
+    RecipeData(
+        id=23,
+        id_str="recipe.sandstone_wall",
+        item_id_str="item.sandstone_wall",
+        amount=4,
+        ingredients=(IngredientData(item_id_str="item.sandstone", amount=1),),
+    ),
+    RecipeData(
+        id=24,
+        id_str="recipe.hardened_sand_wall",
+        item_id_str="item.hardened_sand_wall",
+        amount=4,
+        ingredients=(IngredientData(item_id_str="item.sand", amount=1),),
+    ),
+)
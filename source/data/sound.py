@@ -1,5 +1,4 @@
-from dataclasses import dataclass, field
-from pygame import mixer
+from dataclasses import dataclass
 
 
 @dataclass
@@ -8,7 +7,10 @@ class SoundData:
     id_str: str
     variation_paths: tuple[str, ...]
     volume: float
-    variations: tuple[mixer.Sound, ...] = field(default_factory=tuple)
+    # Plays of a sound with a lower priority make way for it when every channel is busy
+    priority: int = 1
+    # Channels the sound can be playing on at once
+    max_voices: int = 4
 
 
 SOUND_DATA: tuple[SoundData, ...] = (
@@ -22,6 +24,8 @@ SOUND_DATA: tuple[SoundData, ...] = (
             "assets/sounds/tink_2.wav",
         ),
         volume=1,
+        priority=0,
+        max_voices=3,
     ),
     SoundData(
         id=2,
@@ -32,6 +36,8 @@ SOUND_DATA: tuple[SoundData, ...] = (
             "assets/sounds/dig_2.wav",
         ),
         volume=1,
+        priority=0,
+        max_voices=3,
     ),
     SoundData(
         id=3,
@@ -48,18 +54,24 @@ SOUND_DATA: tuple[SoundData, ...] = (
             "assets/sounds/player_hit_2.wav",
         ),
         volume=1,
+        priority=2,
+        max_voices=2,
     ),
     SoundData(
         id=5,
         id_str="sound.grass",
         variation_paths=("assets/sounds/grass.wav",),
         volume=1,
+        priority=0,
+        max_voices=2,
     ),
     SoundData(
         id=6,
         id_str="sound.player_death",
         variation_paths=("assets/sounds/player_killed.wav",),
         volume=1,
+        priority=2,
+        max_voices=1,
     ),
     SoundData(
         id=7,
@@ -72,18 +84,23 @@ SOUND_DATA: tuple[SoundData, ...] = (
         id_str="sound.slime_hurt",
         variation_paths=("assets/sounds/npc_hit_0.wav",),
         volume=1,
+        priority=0,
+        max_voices=3,
     ),
     SoundData(
         id=9,
         id_str="sound.slime_death",
         variation_paths=("assets/sounds/npc_killed_0.wav",),
         volume=1,
+        max_voices=3,
     ),
     SoundData(
         id=10,
         id_str="sound.swing",
         variation_paths=("assets/sounds/swing.wav",),
         volume=1,
+        priority=0,
+        max_voices=2,
     ),
     SoundData(
         id=11,
@@ -102,12 +119,16 @@ SOUND_DATA: tuple[SoundData, ...] = (
         id_str="sound.bullet_hit",
         variation_paths=("assets/sounds/bullet_hit.wav",),
         volume=1,
+        priority=0,
+        max_voices=3,
     ),
     SoundData(
         id=14,
         id_str="sound.grab",
         variation_paths=("assets/sounds/grab.wav",),
         volume=1,
+        priority=0,
+        max_voices=3,
     ),
     SoundData(
         id=15,
@@ -118,36 +139,48 @@ SOUND_DATA: tuple[SoundData, ...] = (
             "assets/sounds/run_2.wav",
         ),
         volume=1,
+        priority=0,
+        max_voices=2,
     ),
     SoundData(
         id=16,
         id_str="sound.coins",
         variation_paths=("assets/sounds/coins.wav",),
         volume=0.3,
+        priority=0,
+        max_voices=2,
     ),
     SoundData(
         id=17,
         id_str="sound.menu_open",
         variation_paths=("assets/sounds/menu_open.wav",),
         volume=0.3,
+        priority=2,
+        max_voices=2,
     ),
     SoundData(
         id=18,
         id_str="sound.menu_close",
         variation_paths=("assets/sounds/menu_close.wav",),
         volume=0.3,
+        priority=2,
+        max_voices=2,
     ),
     SoundData(
         id=19,
         id_str="sound.menu_select",
         variation_paths=("assets/sounds/menu_select.wav",),
         volume=0.3,
+        priority=2,
+        max_voices=2,
     ),
     SoundData(
         id=20,
         id_str="sound.chat",
         variation_paths=("assets/sounds/chat.wav",),
         volume=0.3,
+        priority=2,
+        max_voices=2,
     ),
     SoundData(
         id=21,
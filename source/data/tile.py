@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
+from asset_manager import ImageAsset, asset_property
 from commons import BLOCK_SIZE, TileMaskType, TileStrengthType, TileTag
-from pygame import Surface, image, transform
 
 
 @dataclass
@@ -20,7 +20,9 @@ class TileData:
     item_count_range: tuple[int, int]
     place_sound: str
     hit_sound: str
-    image: Surface
+    image_asset: ImageAsset
+
+    image = asset_property("image_asset")
 
 
 @dataclass
@@ -75,7 +77,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="",
         hit_sound="",
-        image=Surface((0, 0)),
+        image_asset=ImageAsset(None),
     ),
     TileData(
         id=1,
@@ -92,7 +94,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(0, 0),
         place_sound="",
         hit_sound="",
-        image=Surface((0, 0)),
+        image_asset=ImageAsset(None),
     ),
     TileData(
         id=2,
@@ -117,10 +119,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/dirt.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/dirt.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     TileData(
         id=3,
@@ -137,10 +136,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="sound.tink",
         hit_sound="sound.tink",
-        image=transform.scale(
-            image.load("assets/images/tiles/stone.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/stone.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     TileData(
         id=4,
@@ -157,10 +153,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="sound.grass",
         hit_sound="sound.grass",
-        image=transform.scale(
-            image.load("assets/images/tiles/grass.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/grass.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     TileData(
         id=5,
@@ -177,10 +170,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/sand.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/sand.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     TileData(
         id=6,
@@ -197,10 +187,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="sound.tink",
         hit_sound="sound.tink",
-        image=transform.scale(
-            image.load("assets/images/tiles/sandstone.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/sandstone.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     TileData(
         id=7,
@@ -217,10 +204,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/snow.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/snow.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     TileData(
         id=8,
@@ -237,10 +221,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="sound.tink",
         hit_sound="sound.tink",
-        image=transform.scale(
-            image.load("assets/images/tiles/ice.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/ice.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     TileData(
         id=9,
@@ -257,10 +238,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/wood.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/wood.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     TileData(
         id=10,
@@ -282,10 +260,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/trunk.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/trunk.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     TileData(
         id=11,
@@ -302,10 +277,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="sound.grass",
         hit_sound="sound.grass",
-        image=transform.scale(
-            image.load("assets/images/tiles/leaves.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/leaves.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     TileData(
         id=12,
@@ -322,10 +294,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="sound.tink",
         hit_sound="sound.tink",
-        image=transform.scale(
-            image.load("assets/images/tiles/copper_ore.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/copper_ore.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     TileData(
         id=13,
@@ -342,10 +311,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="sound.tink",
         hit_sound="sound.tink",
-        image=transform.scale(
-            image.load("assets/images/tiles/silver.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/silver.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     DamagingTileData(
         id=14,
@@ -364,10 +330,7 @@ TILE_DATA: tuple[TileData, ...] = (
         tile_damage_name="spike",
         place_sound="sound.tink",
         hit_sound="sound.tink",
-        image=transform.scale(
-            image.load("assets/images/tiles/spike.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/spike.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     TileData(
         id=15,
@@ -384,10 +347,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/lamp.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/lamp.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     TileData(
         id=16,
@@ -404,10 +364,7 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/platform_wood.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/platform_wood.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     MultitileData(
         id=17,
@@ -431,10 +388,7 @@ TILE_DATA: tuple[TileData, ...] = (
         multitile_required_solids=((0, 2), (1, 2)),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/multitiles/chest_wood.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/multitiles/chest_wood.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     MultitileData(
         id=18,
@@ -458,10 +412,7 @@ TILE_DATA: tuple[TileData, ...] = (
         multitile_required_solids=((0, 1), (1, 1)),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/multitiles/crafting_table.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/multitiles/crafting_table.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     DoorTileData(
         id=19,
@@ -491,10 +442,7 @@ TILE_DATA: tuple[TileData, ...] = (
         multitile_required_solids=((1, 3), (1, -1)),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/multitiles/door_wood_open_left.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/multitiles/door_wood_open_left.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     DoorTileData(
         id=20,
@@ -519,10 +467,7 @@ TILE_DATA: tuple[TileData, ...] = (
         multitile_required_solids=((0, 3), (0, -1)),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/multitiles/door_wood_closed.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/multitiles/door_wood_closed.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     DoorTileData(
         id=21,
@@ -552,10 +497,7 @@ TILE_DATA: tuple[TileData, ...] = (
         multitile_required_solids=((0, 3), (0, -1)),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/multitiles/door_wood_open_right.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/multitiles/door_wood_open_right.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     LootMultitileData(
         id=22,
@@ -580,10 +522,7 @@ TILE_DATA: tuple[TileData, ...] = (
         multitile_required_solids=((0, 2),),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/multitiles/pot_tall_gray.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/multitiles/pot_tall_gray.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     LootMultitileData(
         id=23,
@@ -608,10 +547,7 @@ TILE_DATA: tuple[TileData, ...] = (
         multitile_required_solids=((0, 2),),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/multitiles/pot_tall_brown.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/multitiles/pot_tall_brown.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     LootMultitileData(
         id=24,
@@ -636,10 +572,7 @@ TILE_DATA: tuple[TileData, ...] = (
         loot_group_id_str="loot.pot",
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/multitiles/pot_thick_brown.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/multitiles/pot_thick_brown.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     LootMultitileData(
         id=25,
@@ -664,10 +597,7 @@ TILE_DATA: tuple[TileData, ...] = (
         loot_group_id_str="loot.pot",
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/multitiles/pot_thick_brown.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/multitiles/pot_thick_brown.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     LootTileData(
         id=26,
@@ -685,10 +615,7 @@ TILE_DATA: tuple[TileData, ...] = (
         loot_group_id_str="loot.pot",
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/pot_short_gray.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/pot_short_gray.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     LootTileData(
         id=27,
@@ -706,10 +633,7 @@ TILE_DATA: tuple[TileData, ...] = (
         loot_group_id_str="loot.pot",
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/pot_short_brown.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/pot_short_brown.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     MultitileData(
         id=28,
@@ -728,10 +652,7 @@ TILE_DATA: tuple[TileData, ...] = (
         multitile_required_solids=((2, 5),),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/multitiles/tree_canopy_a.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/multitiles/tree_canopy_a.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     MultitileData(
         id=29,
@@ -750,10 +671,7 @@ TILE_DATA: tuple[TileData, ...] = (
         hit_sound="sound.dig",
         multitile_dimensions=(3, 2),
         multitile_required_solids=(),
-        image=transform.scale(
-            image.load("assets/images/tiles/multitiles/painting_a.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/multitiles/painting_a.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     MultitileData(
         id=30,
@@ -772,10 +690,7 @@ TILE_DATA: tuple[TileData, ...] = (
         hit_sound="sound.dig",
         multitile_dimensions=(2, 2),
         multitile_required_solids=(),
-        image=transform.scale(
-            image.load("assets/images/tiles/multitiles/painting_b.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/multitiles/painting_b.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     MultitileData(
         id=31,
@@ -794,10 +709,7 @@ TILE_DATA: tuple[TileData, ...] = (
         hit_sound="sound.dig",
         multitile_dimensions=(3, 2),
         multitile_required_solids=(),
-        image=transform.scale(
-            image.load("assets/images/tiles/multitiles/painting_c.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/multitiles/painting_c.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     TileData(
         id=32,
@@ -814,9 +726,6 @@ TILE_DATA: tuple[TileData, ...] = (
         item_count_range=(1, 1),
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        image=transform.scale(
-            image.load("assets/images/tiles/mushroom.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        image_asset=ImageAsset("assets/images/tiles/mushroom.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
 )
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
+from asset_manager import ImageAsset, asset_property
 from commons import BLOCK_SIZE, TileMaskType
-from pygame import Surface, image, transform
 
 
 @dataclass
@@ -14,7 +14,9 @@ class WallData:
     item_id_str: str
     place_sound: str
     hit_sound: str
-    surface: Surface
+    surface_asset: ImageAsset
+
+    surface = asset_property("surface_asset")
 
 
 WALL_DATA: tuple[WallData, ...] = (
@@ -27,7 +29,7 @@ WALL_DATA: tuple[WallData, ...] = (
         item_id_str="item.INVALID",
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        surface=Surface((0, 0)),
+        surface_asset=ImageAsset(None),
     ),
     WallData(
         id=1,
@@ -38,7 +40,7 @@ WALL_DATA: tuple[WallData, ...] = (
         item_id_str="item.INVALID",
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        surface=Surface((0, 0)),
+        surface_asset=ImageAsset(None),
     ),
     WallData(
         id=2,
@@ -57,10 +59,7 @@ WALL_DATA: tuple[WallData, ...] = (
         item_id_str="item.dirt_wall",
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        surface=transform.scale(
-            image.load("assets/images/walls/dirt.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        surface_asset=ImageAsset("assets/images/walls/dirt.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     WallData(
         id=3,
@@ -71,10 +70,7 @@ WALL_DATA: tuple[WallData, ...] = (
         item_id_str="item.stone_wall",
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        surface=transform.scale(
-            image.load("assets/images/walls/stone.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        surface_asset=ImageAsset("assets/images/walls/stone.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     WallData(
         id=4,
@@ -85,10 +81,7 @@ WALL_DATA: tuple[WallData, ...] = (
         item_id_str="item.ice_wall",
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        surface=transform.scale(
-            image.load("assets/images/walls/ice.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        surface_asset=ImageAsset("assets/images/walls/ice.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     WallData(
         id=5,
@@ -106,10 +99,7 @@ WALL_DATA: tuple[WallData, ...] = (
         item_id_str="item.snow_wall",
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        surface=transform.scale(
-            image.load("assets/images/walls/snow.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        surface_asset=ImageAsset("assets/images/walls/snow.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     WallData(
         id=6,
@@ -120,10 +110,7 @@ WALL_DATA: tuple[WallData, ...] = (
         item_id_str="item.sandstone_wall",
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        surface=transform.scale(
-            image.load("assets/images/walls/sandstone.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        surface_asset=ImageAsset("assets/images/walls/sandstone.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     WallData(
         id=7,
@@ -140,10 +127,7 @@ WALL_DATA: tuple[WallData, ...] = (
         item_id_str="item.hardened_sand_wall",
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        surface=transform.scale(
-            image.load("assets/images/walls/hardened_sand.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        surface_asset=ImageAsset("assets/images/walls/hardened_sand.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
     WallData(
         id=8,
@@ -159,9 +143,6 @@ WALL_DATA: tuple[WallData, ...] = (
         item_id_str="item.wood_wall",
         place_sound="sound.dig",
         hit_sound="sound.dig",
-        surface=transform.scale(
-            image.load("assets/images/walls/wood.png").convert_alpha(),
-            (BLOCK_SIZE, BLOCK_SIZE),
-        ),
+        surface_asset=ImageAsset("assets/images/walls/wood.png", (BLOCK_SIZE, BLOCK_SIZE)),
     ),
 )
@@ -4,6 +4,7 @@ from random import randint, random
 import pygame
 from pygame.locals import Rect
 
+import collision
 import commons
 import entity_manager
 import game_data
@@ -11,8 +12,6 @@ import item
 import shared_methods
 import tilesets
 import world
-from data.tile import (DamagingTileData, DoorTileData, LootMultitileData,
-                       LootTileData, MultitileData, TileData)
 from data.entity import ENTITY_DATA
 
 
@@ -23,6 +22,8 @@ class Enemy:
 
     def __init__(self, position, enemy_id) -> None:
         self.position: tuple[float, float] = position
+        # Position before the last simulation tick, for drawing between ticks
+        self.previous_position: tuple[float, float] = position
         self.block_pos: tuple[int, int] = (0, 0)
         self.velocity: tuple[float, float] = (0, 0)
         self.enemy_id: int = enemy_id
@@ -47,7 +48,6 @@ class Enemy:
         self.moving_right: bool = False
         self.damage_tick: float = 0
         self.jump_tick: float = 1
-        self.despawn_tick: int = 5
         self.animation_frame: int = 0
         self.game_id: int = randint(1000, 9999)
         self.world_invincible_timer: float = 0
@@ -69,13 +69,6 @@ class Enemy:
             self.stop_left = False
             self.stop_right = False
 
-            if self.despawn_tick <= 0:
-                self.despawn_tick += 5
-                if self.despawn_radius():
-                    return
-            else:
-                self.despawn_tick -= commons.DELTA_TIME
-
             if self.moving_left:  # Moves enemy left
                 if not self.stop_left:
                     self.velocity = (-12.5, self.velocity[1])
@@ -134,107 +127,87 @@ class Enemy:
             else:
                 self.damage_tick -= commons.DELTA_TIME
 
-            for j in range(-2, 3):
-                for i in range(-2, 3):
-                    if world.tile_in_map(self.block_pos[1] + j, self.block_pos[0] + i):
-                        tile_id: int = world.world.tile_data[self.block_pos[1] + j][self.block_pos[0] + i][0]
-                        tile_data: (
-                                TileData
-                                | DamagingTileData
-                                | MultitileData
-                                | DoorTileData
-                                | LootTileData
-                                | LootMultitileData
-                        ) = game_data.get_tile_by_id(tile_id)
-                        if commons.TileTag.NO_COLLIDE not in tile_data.tags:
-                            block_rect = Rect(
-                                commons.BLOCK_SIZE * (self.block_pos[1] + j),
-                                commons.BLOCK_SIZE * (self.block_pos[0] + i),
-                                commons.BLOCK_SIZE,
-                                commons.BLOCK_SIZE,
-                            )
-                            if commons.TileTag.PLATFORM in tile_data.tags:
-                                platform = True
+            probe_top = int(self.rect.top + 2)
+            probe_height = int(self.rect.height - 4)
+            for _, flags, block_left, block_top in collision.overlapping_solids(
+                    self.rect.left - 1,
+                    self.rect.top,
+                    self.rect.width + 3,
+                    self.rect.height,
+            ):
+                platform = bool(flags & collision.PLATFORM)
+                if collision.block_overlaps(block_left, block_top, int(self.rect.left - 1), probe_top, 1, probe_height):
+                    self.stop_left = True  # Is there a solid block left
+                if collision.block_overlaps(block_left, block_top, int(self.rect.right + 1), probe_top, 1, probe_height):
+                    self.stop_right = True  # Is there a solid block right
+                if collision.block_overlaps(block_left, block_top, *self.rect):
+                    if not self.world_invincible and flags & collision.DAMAGING:
+                        # self.damage(tile_data.tile_damage, [tile_data.tile_damage_name, "World"])
+                        pass
+
+                    delta_x = self.position[0] - (block_left + commons.BLOCK_SIZE // 2)
+                    delta_y = self.position[1] - (block_top + commons.BLOCK_SIZE // 2)
+                    if abs(delta_x) > abs(delta_y):
+                        if not platform:
+                            if delta_x > 0:
+                                self.position = (
+                                    block_left + commons.BLOCK_SIZE + self.rect.width * 0.5,
+                                    self.position[1],
+                                )  # Move enemy right
+                                self.velocity = (
+                                    0,
+                                    self.velocity[1],
+                                )  # Stop enemy horizontally
                             else:
-                                platform = False
-                            if block_rect.colliderect(
-                                    int(self.rect.left - 1),
-                                    int(self.rect.top + 2),
-                                    1,
-                                    int(self.rect.height - 4),
-                            ):
-                                self.stop_left = True  # Is there a solid block left
-                            if block_rect.colliderect(
-                                    int(self.rect.right + 1),
-                                    int(self.rect.top + 2),
-                                    1,
-                                    int(self.rect.height - 4),
-                            ):
-                                self.stop_right = True  # Is there a solid block right
-                            if block_rect.colliderect(self.rect):
-                                if not self.world_invincible and commons.TileTag.DAMAGING in tile_data.tags:
-                                    # self.damage(tile_data.tile_damage, [tile_data.tile_damage_name, "World"])
-                                    pass
-
-                                delta_x = self.position[0] - block_rect.centerx
-                                delta_y = self.position[1] - block_rect.centery
-                                if abs(delta_x) > abs(delta_y):
-                                    if not platform:
-                                        if delta_x > 0:
-                                            self.position = (
-                                                block_rect.right + self.rect.width * 0.5,
-                                                self.position[1],
-                                            )  # Move enemy right
-                                            self.velocity = (
-                                                0,
-                                                self.velocity[1],
-                                            )  # Stop enemy horizontally
-                                        else:
-                                            self.position = (
-                                                block_rect.left - self.rect.width * 0.5,
-                                                self.position[1],
-                                            )  # Move enemy left
-                                            self.velocity = (
-                                                0,
-                                                self.velocity[1],
-                                            )  # Stop enemy horizontally
-                                else:
-                                    if delta_y > 0:
-                                        if self.velocity[1] < 0:
-                                            if not platform:
-                                                if Rect(
-                                                        self.rect.left + 3,
-                                                        self.rect.top,
-                                                        self.rect.width - 6,
-                                                        self.rect.height,
-                                                ).colliderect(block_rect):
-                                                    self.position = (
-                                                        self.position[0],
-                                                        block_rect.bottom + self.rect.height * 0.5,
-                                                    )  # Move enemy down
-                                                    self.velocity = (
-                                                        self.velocity[0],
-                                                        0,
-                                                    )  # Stop enemy vertically
-                                    else:
-                                        if self.velocity[1] > 0:
-                                            if Rect(
-                                                    self.rect.left + 3,
-                                                    self.rect.top,
-                                                    self.rect.width - 6,
-                                                    self.rect.height,
-                                            ).colliderect(block_rect):
-                                                self.position = (
-                                                    self.position[0],
-                                                    block_rect.top - self.rect.height * 0.5 + 1,
-                                                )  # Move enemy up
-                                                self.velocity = (
-                                                    self.velocity[0] * 0.5,
-                                                    0,
-                                                )  # Slow down enemy horizontally and stop player vertically
-                                                self.grounded = True
-                                                self.moving_right = False
-                                                self.moving_left = False
+                                self.position = (
+                                    block_left - self.rect.width * 0.5,
+                                    self.position[1],
+                                )  # Move enemy left
+                                self.velocity = (
+                                    0,
+                                    self.velocity[1],
+                                )  # Stop enemy horizontally
+                    else:
+                        if delta_y > 0:
+                            if self.velocity[1] < 0:
+                                if not platform:
+                                    if collision.block_overlaps(
+                                            block_left,
+                                            block_top,
+                                            self.rect.left + 3,
+                                            self.rect.top,
+                                            self.rect.width - 6,
+                                            self.rect.height,
+                                    ):
+                                        self.position = (
+                                            self.position[0],
+                                            block_top + commons.BLOCK_SIZE + self.rect.height * 0.5,
+                                        )  # Move enemy down
+                                        self.velocity = (
+                                            self.velocity[0],
+                                            0,
+                                        )  # Stop enemy vertically
+                        else:
+                            if self.velocity[1] > 0:
+                                if collision.block_overlaps(
+                                        block_left,
+                                        block_top,
+                                        self.rect.left + 3,
+                                        self.rect.top,
+                                        self.rect.width - 6,
+                                        self.rect.height,
+                                ):
+                                    self.position = (
+                                        self.position[0],
+                                        block_top - self.rect.height * 0.5 + 1,
+                                    )  # Move enemy up
+                                    self.velocity = (
+                                        self.velocity[0] * 0.5,
+                                        0,
+                                    )  # Slow down enemy horizontally and stop player vertically
+                                    self.grounded = True
+                                    self.moving_right = False
+                                    self.moving_left = False
             self.animate()
 
     def damage(
@@ -362,7 +335,7 @@ class Enemy:
 
             game_data.play_sound("sound.slime_death")  # Death sound
 
-            entity_manager.enemies.remove(self)
+            entity_manager.remove_enemy(self)
 
     def animate(self):
         """
@@ -378,43 +351,13 @@ class Enemy:
         else:
             self.animation_frame = 0
 
-    def despawn_radius(self):
-        """
-        Checks if the enemy has gone too far beyond the player's view, if so, return true
-        """
-        assert isinstance(entity_manager.get_client_player(), entity_manager.Player)
-        if (
-                self.position[0]
-                < entity_manager.get_client_player().position[0] - commons.MAX_ENEMY_SPAWN_TILES_X * 1.5 * commons.BLOCK_SIZE
-        ):
-            entity_manager.enemies.remove(self)
-            return True
-        elif (
-                self.position[0]
-                > entity_manager.get_client_player().position[0] + commons.MAX_ENEMY_SPAWN_TILES_X * 1.5 * commons.BLOCK_SIZE
-        ):
-            entity_manager.enemies.remove(self)
-            return True
-        elif (
-                self.position[1]
-                < entity_manager.get_client_player().position[1] - commons.MAX_ENEMY_SPAWN_TILES_Y * 1.5 * commons.BLOCK_SIZE
-        ):
-            entity_manager.enemies.remove(self)
-            return True
-        elif (
-                self.position[1]
-                > entity_manager.get_client_player().position[1] + commons.MAX_ENEMY_SPAWN_TILES_Y * 1.5 * commons.BLOCK_SIZE
-        ):
-            entity_manager.enemies.remove(self)
-            return True
-        return False
-
     def draw(self):
         """
         Draws the enemy instance at the current animation frame
         """
-        left = self.rect.left - entity_manager.camera_position[0] + commons.WINDOW_WIDTH * 0.5
-        top = self.rect.top - entity_manager.camera_position[1] + commons.WINDOW_HEIGHT * 0.5
+        offset = shared_methods.get_interpolation_offset(self.previous_position, self.position)
+        left = self.rect.left + offset[0] - entity_manager.camera_position[0] + commons.WINDOW_WIDTH * 0.5
+        top = self.rect.top + offset[1] - entity_manager.camera_position[1] + commons.WINDOW_HEIGHT * 0.5
         commons.screen.blit(
             tilesets.slimes[(self.enemy_id - 1) * 3 + self.animation_frame],
             (left, top),
@@ -6,17 +6,19 @@ import pygame
 from pygame.locals import Rect
 
 import commons
+import game_constants
 import game_data
 import shared_methods
 import world
 from color_picker import ColorPicker
 from enemy import Enemy
 from item import Item
-from particle import Particle
+from particle import ParticleSystem
 from physics_item import PhysicsItem
 from player import Player
 from projectile import Projectile
 from prompt import Prompt
+from spatial_hash import SpatialHash
 
 
 class Message(TypedDict):
@@ -26,8 +28,10 @@ class Message(TypedDict):
 
 class DamageNumber(TypedDict):
     position: tuple[float, float]
+    previous_position: tuple[float, float]
     rotation: tuple[float, float]
     surface: pygame.Surface
+    frames: dict[int, pygame.Surface]
     lifespan: float
 
 
@@ -41,13 +45,23 @@ class RecentPickup(TypedDict):
 
 
 enemies: list[Enemy] = []
-particles: list[Particle] = []
+particles = ParticleSystem()
 projectiles: list[Projectile] = []
 physics_items: list[PhysicsItem] = []
 messages: list[Message] = []
 damage_numbers: list[DamageNumber] = []
 recent_pickups: list[RecentPickup] = []
 
+# Spatial indexes over the entity lists, kept in sync by the spawn, update and remove functions below
+enemy_grid = SpatialHash(game_constants.ENTITY_GRID_CELL_SIZE)
+projectile_grid = SpatialHash(game_constants.ENTITY_GRID_CELL_SIZE)
+physics_item_grid = SpatialHash(game_constants.ENTITY_GRID_CELL_SIZE)
+
+# Enemies and physics items far from the camera are parked here by chunk, left untouched until the camera comes back
+dormant_entities: dict[tuple[int, int], list[Enemy | PhysicsItem]] = {}
+dormant_enemy_count = 0
+dormancy_check_tick = 0.0
+
 client_player: Player | None = None
 
 def get_client_player() -> Player:
@@ -121,7 +135,7 @@ def draw_enemy_hover_text():
         commons.MOUSE_POSITION[0] + camera_position[0] - commons.WINDOW_WIDTH * 0.5,
         commons.MOUSE_POSITION[1] + camera_position[1] - commons.WINDOW_HEIGHT * 0.5,
     )
-    for enemy in enemies:
+    for enemy in enemy_grid.query_point(transformed_mouse_position):
         if enemy.rect.collidepoint(transformed_mouse_position):
             text1 = commons.MEDIUM_FONT.render(
                 f"{enemy.name}: {math.ceil(enemy.health)}/{enemy.max_health}",
@@ -181,6 +195,10 @@ def kill_all_entities():
     particles.clear()
     projectiles.clear()
     physics_items.clear()
+    enemy_grid.clear()
+    projectile_grid.clear()
+    physics_item_grid.clear()
+    clear_dormant_entities()
     messages.clear()
     damage_numbers.clear()
     recent_pickups.clear()
@@ -190,23 +208,118 @@ def update_enemies():
     """
     Calls update on every entity in their respective list
     """
-    for enemy in enemies:
+    for enemy in enemies[:]:
+        enemy.previous_position = enemy.position
         enemy.update()
+        enemy_grid.move(enemy)
 
 
 def update_particles():
-    for particle in particles:
-        particle.update()
+    particles.update(commons.DELTA_TIME)
 
 
 def update_physics_items():
-    for physicsItem in physics_items:
+    for physicsItem in physics_items[:]:
+        physicsItem.previous_position = physicsItem.position
         physicsItem.update()
+        physics_item_grid.move(physicsItem)
 
 
 def update_projectiles():
-    for projectile in projectiles:
+    for projectile in projectiles[:]:
+        projectile.previous_position = projectile.position
         projectile.update()
+        projectile_grid.move(projectile)
+
+
+def get_dormant_chunk(position: tuple[float, float]) -> tuple[int, int]:
+    return (
+        int(position[0] // game_constants.DORMANT_CHUNK_SIZE),
+        int(position[1] // game_constants.DORMANT_CHUNK_SIZE),
+    )
+
+
+def get_dormancy_distance(scale: float) -> tuple[float, float]:
+    """
+    Returns the horizontal and vertical distance from the camera at the given multiple of the furthest enemy spawn distance
+    """
+    return (
+        commons.MAX_ENEMY_SPAWN_TILES_X * scale * commons.BLOCK_SIZE,
+        commons.MAX_ENEMY_SPAWN_TILES_Y * scale * commons.BLOCK_SIZE,
+    )
+
+
+def is_near_camera(position: tuple[float, float], distance: tuple[float, float]) -> bool:
+    return (
+            abs(position[0] - camera_position[0]) <= distance[0]
+            and abs(position[1] - camera_position[1]) <= distance[1]
+    )
+
+
+def park_entity(entity: Enemy | PhysicsItem):
+    """
+    Takes an enemy or physics item out of the simulation and stores it in the chunk it is in
+    """
+    global dormant_enemy_count
+    if isinstance(entity, Enemy):
+        remove_enemy(entity)
+        if dormant_enemy_count >= game_constants.DORMANT_ENEMY_LIMIT:
+            return
+        dormant_enemy_count += 1
+    else:
+        remove_physics_item(entity)
+    dormant_entities.setdefault(get_dormant_chunk(entity.position), []).append(entity)
+
+
+def wake_entity(entity: Enemy | PhysicsItem):
+    global dormant_enemy_count
+    if isinstance(entity, Enemy):
+        dormant_enemy_count -= 1
+        add_enemy(entity)
+    else:
+        add_physics_item(entity)
+
+
+def update_dormancy():
+    """
+    Parks the enemies and physics items that are far from the camera and wakes the parked ones the camera has come close to
+    """
+    global dormancy_check_tick
+    if dormancy_check_tick > 0:
+        dormancy_check_tick -= commons.DELTA_TIME
+        return
+    dormancy_check_tick += game_constants.DORMANCY_CHECK_INTERVAL
+
+    park_distance = get_dormancy_distance(game_constants.DORMANCY_PARK_DISTANCE_SCALE)
+    for entity in [*enemies, *physics_items]:
+        if not is_near_camera(entity.position, park_distance):
+            park_entity(entity)
+
+    wake_distance = get_dormancy_distance(game_constants.DORMANCY_WAKE_DISTANCE_SCALE)
+    min_chunk = get_dormant_chunk((camera_position[0] - wake_distance[0], camera_position[1] - wake_distance[1]))
+    max_chunk = get_dormant_chunk((camera_position[0] + wake_distance[0], camera_position[1] + wake_distance[1]))
+    for chunk_x in range(min_chunk[0], max_chunk[0] + 1):
+        for chunk_y in range(min_chunk[1], max_chunk[1] + 1):
+            chunk = dormant_entities.get((chunk_x, chunk_y))
+            if chunk is None:
+                continue
+            still_dormant = []
+            for entity in chunk:
+                if is_near_camera(entity.position, wake_distance):
+                    wake_entity(entity)
+                else:
+                    still_dormant.append(entity)
+            if still_dormant:
+                dormant_entities[(chunk_x, chunk_y)] = still_dormant
+            else:
+                del dormant_entities[(chunk_x, chunk_y)]
+
+
+def clear_dormant_entities():
+    global dormant_enemy_count, dormancy_check_tick
+    dormant_entities.clear()
+    dormant_enemy_count = 0
+    dormancy_check_tick = 0.0
 
 
 def update_messages():
@@ -219,6 +332,7 @@ def update_messages():
 
 def update_damage_numbers():
     for number in damage_numbers:
+        number["previous_position"] = number["position"]
         number["rotation"] = (
             number["rotation"][0] * 0.95,
             number["rotation"][1] * 0.95,
@@ -289,8 +403,7 @@ def draw_enemies():
 
 
 def draw_particles():
-    for particle in particles:
-        particle.draw()
+    particles.draw(commons.screen, camera_position)
 
 
 def draw_physics_items():
@@ -312,15 +425,20 @@ def draw_messages():
 
 def draw_damage_numbers():
     for damage_number in damage_numbers:
+        # The rotation settles as the number slows down, so most frames reuse an already rotated surface
+        angle_bucket = round(-damage_number["rotation"][0] * 35 / game_constants.DAMAGE_NUMBER_ANGLE_STEP)
+        surf = damage_number["frames"].get(angle_bucket)
+        if surf is None:
+            surf = shared_methods.rotate_surface(damage_number["surface"], angle_bucket * game_constants.DAMAGE_NUMBER_ANGLE_STEP)
+            damage_number["frames"][angle_bucket] = surf
         if damage_number["lifespan"] < 0.5:
-            damage_number["surface"].set_alpha(int(damage_number["lifespan"] * 510))
-        surf = damage_number["surface"].copy()
-        surf = shared_methods.rotate_surface(surf, -damage_number["rotation"][0] * 35)
+            surf.set_alpha(int(damage_number["lifespan"] * 510))
+        offset = shared_methods.get_interpolation_offset(damage_number["previous_position"], damage_number["position"])
         commons.screen.blit(
             surf,
             (
-                damage_number["position"][0] - surf.get_width() * 0.5,
-                damage_number["position"][1] - surf.get_height() * 0.5,
+                damage_number["position"][0] + offset[0] - surf.get_width() * 0.5,
+                damage_number["position"][1] + offset[1] - surf.get_height() * 0.5,
             ),
         )
 
@@ -393,13 +511,13 @@ def spawn_enemy(enemy_id: int, position=None):
                     )
             if world.tile_in_map(x, y, width=2):
                 if (
-                        world.world.tile_data[x][y][0] == game_data.air_tile_id
-                        and world.world.tile_data[x - 1][y][0] == game_data.air_tile_id
-                        and world.world.tile_data[x][y - 1][0] == game_data.air_tile_id
-                        and world.world.tile_data[x + 1][y][0] == game_data.air_tile_id
-                        and world.world.tile_data[x][y + 1][0] == game_data.air_tile_id
+                        world.world.tile_grid.get_tile(x, y) == game_data.air_tile_id
+                        and world.world.tile_grid.get_tile(x - 1, y) == game_data.air_tile_id
+                        and world.world.tile_grid.get_tile(x, y - 1) == game_data.air_tile_id
+                        and world.world.tile_grid.get_tile(x + 1, y) == game_data.air_tile_id
+                        and world.world.tile_grid.get_tile(x, y + 1) == game_data.air_tile_id
                 ):
-                    enemies.append(
+                    add_enemy(
                         Enemy(
                             (
                                 x * commons.BLOCK_SIZE,
@@ -410,7 +528,17 @@ def spawn_enemy(enemy_id: int, position=None):
                     )
                     return
     else:
-        enemies.append(Enemy(position, enemy_id))
+        add_enemy(Enemy(position, enemy_id))
+
+
+def add_enemy(enemy: Enemy):
+    enemies.append(enemy)
+    enemy_grid.insert(enemy, enemy.rect)
+
+
+def remove_enemy(enemy: Enemy):
+    enemies.remove(enemy)
+    enemy_grid.remove(enemy)
 
 
 def spawn_particle(
@@ -425,19 +553,17 @@ def spawn_particle(
         velocity: float = 0,
         outline: bool = True,
 ):
-    particles.append(
-        Particle(
-            position,
-            color,
-            life,
-            magnitude,
-            size,
-            angle,
-            spread,
-            gravity,
-            velocity,
-            outline,
-        )
+    particles.spawn(
+        position,
+        color,
+        life,
+        magnitude,
+        size,
+        angle,
+        spread,
+        gravity,
+        velocity,
+        outline,
     )
 
 
@@ -447,7 +573,17 @@ def spawn_physics_item(
         velocity: tuple[float, float] = (0, 0),
         pickup_delay: int = 100,
 ):
-    physics_items.append(PhysicsItem(item, position, velocity, pickup_delay))
+    add_physics_item(PhysicsItem(item, position, velocity, pickup_delay))
+
+
+def add_physics_item(physics_item: PhysicsItem):
+    physics_items.append(physics_item)
+    physics_item_grid.insert(physics_item, physics_item.rect)
+
+
+def remove_physics_item(physics_item: PhysicsItem):
+    physics_items.remove(physics_item)
+    physics_item_grid.remove(physics_item)
 
 
 def spawn_projectile(position, angle, weapon_item, ammo_item_id, source):
@@ -472,21 +608,26 @@ def spawn_projectile(position, angle, weapon_item, ammo_item_id, source):
             is_crit = True
 
         # Hack until we have projectile data loaded from the tool
-        projectiles.append(
-            Projectile(
-                position,
-                velocity,
-                source,
-                total_damage,
-                knockback,
-                is_crit,
-                ricochet_amount,
-                "arrow",
-                image,
-                gravity=ammo_gravity_modifier,
-                drag=ammo_drag,
-            )
+        projectile = Projectile(
+            position,
+            velocity,
+            source,
+            total_damage,
+            knockback,
+            is_crit,
+            ricochet_amount,
+            "arrow",
+            image,
+            gravity=ammo_gravity_modifier,
+            drag=ammo_drag,
         )
+        projectiles.append(projectile)
+        projectile_grid.insert(projectile, projectile.rect)
+
+
+def remove_projectile(projectile: Projectile):
+    projectiles.remove(projectile)
+    projectile_grid.remove(projectile)
 
 
 def add_message(
@@ -551,14 +692,17 @@ def add_damage_number(
 
     surf.blit(t1, (mid_x, mid_y))
 
+    position = (
+        pos[0] - camera_position[0] + commons.WINDOW_WIDTH * 0.5,
+        pos[1] - camera_position[1] + commons.WINDOW_HEIGHT * 0.5,
+    )
     damage_numbers.append(
         {
-            "position": (
-                pos[0] - camera_position[0] + commons.WINDOW_WIDTH * 0.5,
-                pos[1] - camera_position[1] + commons.WINDOW_HEIGHT * 0.5,
-            ),
+            "position": position,
+            "previous_position": position,
             "rotation": (random.random() * 4 - 2, -1 - random.random() * 4),
             "surface": surf,
+            "frames": {},
             "lifespan": 1.5,
         }
     )
@@ -9,6 +9,7 @@ UI_STATS_SURFACE_HEIGHT = 200
 UI_STAT_LINE_HEIGHT = 15
 UI_MENU_PADDING = 15
 UI_MENU_LINE_SPACING = 20
+DAMAGE_NUMBER_ANGLE_STEP = 2  # Degrees between the rotations a damage number's frames are cached at
 
 # Parallax background constants
 PARALLAX_BACKGROUND_WIDTH = 2048
@@ -32,6 +33,8 @@ GLOBAL_LIGHTING = 255
 SKY_DARKEN_FACTOR_START_Y = 55
 SKY_DARKEN_FACTOR_RANGE_Y = 110
 SKY_DARKEN_MAX_FACTOR = 0.7
+LIGHT_JOB_QUEUE_SIZE = 2
+LIGHT_LATENCY_SMOOTHING = 0.1
 
 # Item drop constants
 DEFAULT_ITEM_DROP_RATE = 25
@@ -41,6 +44,40 @@ CAMERA_SMOOTH_FACTOR = 4
 CAMERA_MOMENTUM_FACTOR = 8
 MAX_CAMERA_SPEED_MULTIPLIER = 200
 
+# Terrain chunk constants
+TERRAIN_CHUNK_SIZE = 32  # Tiles along each side of a terrain chunk surface
+TERRAIN_CHUNK_CACHE_BUDGET_BYTES = 96 * 1024 * 1024
+TERRAIN_CELL_CACHE_SIZE = 4096  # Composited tile over wall images kept for reuse
+
+# Text cache constants
+TEXT_CACHE_SIZE = 1024  # Rendered outlined strings kept for reuse
+TEXT_CACHE_BUDGET_BYTES = 8 * 1024 * 1024
+
+# Entity constants
+ENTITY_GRID_CELL_SIZE = 128  # Pixels along each side of a spatial hash cell
+DORMANT_CHUNK_SIZE = 512  # Pixels along each side of a chunk of parked entities
+DORMANCY_CHECK_INTERVAL = 0.5  # Seconds between checks for entities to park or wake
+DORMANCY_PARK_DISTANCE_SCALE = 1.5  # Entities further than this many furthest enemy spawn distances from the camera are parked
+DORMANCY_WAKE_DISTANCE_SCALE = 1.25  # Parked entities closer than this many furthest enemy spawn distances are woken
+DORMANT_ENEMY_LIMIT = 256  # Enemies parked beyond this are removed instead
+
+# World size constants
+WORLD_SIZES = {
+    "TINY": (100, 350),
+    "SMALL": (200, 400),
+    "MEDIUM": (400, 450),
+    "LARGE": (700, 550),
+}
+
+# World file constants
+WORLD_FILE_VERSION = 2
+WORLD_FILE_CHUNK_SIZE = 64  # Tiles along each side of a separately compressed save chunk
+WORLD_FILE_COMPRESSION_LEVEL = 6
+
+# World thumbnail constants
+WORLD_THUMBNAIL_SIZE = (50, 46)  # Largest thumbnail shown in the world selection menu
+WORLD_THUMBNAIL_SKY_COLOR = (135, 206, 234)
+
 # World snapshot constants
 WORLD_SNAPSHOT_TILE_SCALE = 2
 
@@ -64,6 +101,10 @@ TIME_BASE_FACTOR = 0.25
 ITEM_THROW_VELOCITY_X = 32
 ITEM_THROW_VELOCITY_Y_RANGE = 2
 
+# Simulation loop constants
+MAX_FRAME_TIME = 0.25  # Longer frames only advance the simulation by this much
+MAX_SIMULATION_STEPS_PER_FRAME = 5  # Ticks run in one frame at most, time beyond that is dropped
+
 # Menu positioning constants
 SAVE_SELECT_SURFACE_WIDTH = 315
 SAVE_SELECT_SURFACE_HEIGHT = 360
@@ -92,16 +133,30 @@ MENU_BACKGROUND_PARALLAX_SPEED = 0.2
 # FPS display update frequency
 FPS_UPDATE_FREQUENCY = 0.5
 
+# Profiler constants
+PROFILER_WINDOW_SIZE = 120  # Durations per section the overlay statistics are taken over
+PROFILER_TRACE_EVENT_LIMIT = 20000  # Sections kept for the trace export, older ones are dropped
+PROFILER_OVERLAY_UPDATE_INTERVAL = 0.5
+PROFILER_OVERLAY_TOP = 80
+PROFILER_OVERLAY_COLUMN_SPACING = 8
+PROFILER_TRACE_DIRECTORY = "assets/traces"
+
 # Animation and particle constants
 PARTICLE_COUNT_RESPAWN = 20
 PARTICLE_COUNT_RESPAWN_ARRIVE = 40
 PARTICLE_MAGNITUDE_BASE = 1
 PARTICLE_MAGNITUDE_RANGE = 6
 PARTICLE_SIZE = 15
+PARTICLE_CAPACITY = 1024  # Particles the particle arrays start with room for, they double when full
+PARTICLE_ANGLE_STEP = 15  # Degrees between the rotations particle sprites are cached at
+PARTICLE_SPRITE_CACHE_SIZE = 2048
 
 # Sound volume adjustment step
 SOUND_VOLUME_STEP = 0.05
 
+# Sound playback constants
+SOUND_CHANNEL_COUNT = 16  # Mixer channels shared by every sound effect
+
 # Menu text input limits
 PLAYER_NAME_MAX_LENGTH = 15
 WORLD_NAME_MAX_LENGTH = 27
\ No newline at end of file
@@ -5,12 +5,14 @@ from typing import TypedDict
 import pygame
 
 import commons
+import sound_bank
 from data.item import (ITEM_DATA, AmmunitionItemData, AxeItemData,
                        GrapplingHookItemData, HammerItemData,
                        TileItemData, MagicalWeaponItemData,
                        MaterialItemData, PickaxeItemData,
                        RangedItemData, SwordItemData, WallItemData)
 from data.loot import LOOT_DATA, LootData
+from data.recipe import RECIPE_DATA, RecipeData
 from data.sound import SOUND_DATA, SoundData
 from data.structure import STRUCTURE_DATA, StructureData
 from data.tile import (TILE_DATA, DamagingTileData, DoorTileData,
@@ -128,9 +130,12 @@ json_tile_data: list[TileData | DamagingTileData | MultitileData | DoorTileData
 tile_id_str_hash_table: dict[str, int] = {}
 tile_id_light_reduction_lookup: list[int] = []
 tile_id_light_emission_lookup: list[int] = []
+# Whether the tile or wall id merges with a neighboring id, indexed [id][neighbor id]
+tile_id_merge_lookup: list[list[bool]] = []
 
 json_wall_data: list[WallData] = []
 wall_id_str_hash_table: dict[str, int] = {}
+wall_id_merge_lookup: list[list[bool]] = []
 
 json_sound_data: list[SoundData] = []
 sound_id_str_hash_table: dict[str, int] = {}
@@ -141,6 +146,13 @@ structure_id_str_hash_table: dict[str, int] = {}
 json_loot_data: list[LootData] = []
 loot_id_str_hash_table: dict[str, int] = {}
 
+json_recipe_data: list[RecipeData] = []
+recipe_id_str_hash_table: dict[str, int] = {}
+# (item id, amount) pairs of the ingredients of each recipe, indexed by the recipe's id
+recipe_ingredient_ids: list[list[tuple[int, int]]] = []
+# Ids of the recipes that use each item, keyed by the item's id
+recipe_ingredient_index: dict[int, list[int]] = {}
+
 sound_volume_multiplier: float = commons.CONFIG_SOUND_VOLUME
 music_volume_multiplier: float = commons.CONFIG_MUSIC_VOLUME
 
@@ -1178,6 +1190,15 @@ def create_tile_light_emission_lookup():
         tile_id_light_emission_lookup.append(json_tile_data[tile_index].light_emission)
 
 
+def create_tile_merge_lookup():
+    global tile_id_merge_lookup
+    tile_id_merge_lookup.clear()
+    for tile in json_tile_data:
+        tile_id_merge_lookup.append(
+            [neighbor.id_str in tile.mask_merge_ids or neighbor.id_str == tile.id_str for neighbor in json_tile_data]
+        )
+
+
 def get_tile_by_id(
         tile_id: int,
 ) -> TileData | DamagingTileData | MultitileData | DoorTileData | LootTileData | LootMultitileData:
@@ -1215,6 +1236,15 @@ def create_wall_id_str_hash_table():
         wall_id_str_hash_table[json_wall_data[wall_index].id_str] = wall_index
 
 
+def create_wall_merge_lookup():
+    global wall_id_merge_lookup
+    wall_id_merge_lookup.clear()
+    for wall in json_wall_data:
+        wall_id_merge_lookup.append(
+            [neighbor.id_str in wall.mask_merge_ids or neighbor.id_str == wall.id_str for neighbor in json_wall_data]
+        )
+
+
 def get_wall_by_id(wall_id):
     if wall_id < len(json_wall_data):
         return json_wall_data[wall_id]
@@ -1243,15 +1273,13 @@ def parse_sound_data():
     json_sound_data = SOUND_DATA
     json_sound_data = sorted(json_sound_data, key=lambda x: x.id)
 
-    for sound_data in json_sound_data:
-        sound_data.variations = []
-        for sound_variation in sound_data.variation_paths:
-            try:
-                sound = pygame.mixer.Sound(sound_variation)
-                sound.set_volume(sound_data.volume)
-                sound_data.variations.append(sound)
-            except (FileNotFoundError, pygame.error):
-                pass
+    if commons.SOUND:
+        sound_paths = []
+        for sound_data in json_sound_data:
+            for sound_variation in sound_data.variation_paths:
+                if sound_variation not in sound_paths:
+                    sound_paths.append(sound_variation)
+        sound_bank.load_sounds_in_background(sound_paths)
 
 
 def create_sound_id_str_hash_table():
@@ -1297,11 +1325,14 @@ def play_sound(sound_id_str: str) -> None:
 
     if commons.SOUND:
         sound_data = get_sound_by_id_str(sound_id_str)
-        if sound_data is not None:
-            sound_index = random.randint(0, len(sound_data.variations) - 1)
-            sound = sound_data.variations[sound_index]
-            sound.set_volume(sound_data.volume * sound_volume_multiplier)
-            sound.play()
+        if sound_data is not None and len(sound_data.variation_paths) > 0:
+            sound_bank.play(
+                sound_data.id_str,
+                sound_data.variation_paths[random.randint(0, len(sound_data.variation_paths) - 1)],
+                sound_data.volume * sound_volume_multiplier,
+                sound_data.priority,
+                sound_data.max_voices,
+            )
 
 
 def play_tile_hit_sfx(tile_id):
@@ -1494,6 +1525,61 @@ def get_loot_by_id_str(loot_id_str):
     return get_loot_by_id(get_loot_id_by_id_str(loot_id_str))
 
 
+def parse_recipe_data():
+    global json_recipe_data
+
+    json_recipe_data = sorted(RECIPE_DATA, key=lambda x: x.id)
+
+
+def create_recipe_id_str_hash_table():
+    global recipe_id_str_hash_table
+    for recipe_index in range(len(json_recipe_data)):
+        recipe_id_str_hash_table[json_recipe_data[recipe_index].id_str] = recipe_index
+
+
+def create_recipe_ingredient_id_lookup():
+    """
+    Resolves the item id strings of the ingredients of every recipe once so crafting checks can compare item ids
+    """
+    global recipe_ingredient_ids
+    recipe_ingredient_ids = [
+        [(get_item_id_by_id_str(ingredient.item_id_str), ingredient.amount) for ingredient in recipe_data.ingredients]
+        for recipe_data in json_recipe_data
+    ]
+
+
+def create_recipe_ingredient_index():
+    global recipe_ingredient_index
+    for recipe_index in range(len(json_recipe_data)):
+        for ingredient_item_id, _ in recipe_ingredient_ids[recipe_index]:
+            recipe_ingredient_index.setdefault(ingredient_item_id, []).append(recipe_index)
+
+
+def get_recipe_by_id(recipe_id):
+    if recipe_id < len(json_recipe_data):
+        return json_recipe_data[recipe_id]
+    else:
+        raise ValueError("Inserted recipe ID greater than maximum recipe ID length.")
+
+
+def get_recipe_by_id_str(recipe_id_str):
+    return get_recipe_by_id(recipe_id_str_hash_table[recipe_id_str])
+
+
+def get_recipe_ingredient_ids(recipe_id) -> list[tuple[int, int]]:
+    """
+    Returns the (item id, amount) pairs of the ingredients of the recipe
+    """
+    return recipe_ingredient_ids[recipe_id]
+
+
+def get_recipes_using_item(item_id) -> list[int]:
+    """
+    Returns the ids of the recipes the item is an ingredient of
+    """
+    return recipe_ingredient_index.get(item_id, [])
+
+
 parse_item_data()
 create_item_id_str_hash_table()
 
@@ -1501,9 +1587,11 @@ parse_tile_data()
 create_tile_id_str_hash_table()
 create_tile_light_reduction_lookup()
 create_tile_light_emission_lookup()
+create_tile_merge_lookup()
 
 parse_wall_data()
 create_wall_id_str_hash_table()
+create_wall_merge_lookup()
 
 parse_sound_data()
 create_sound_id_str_hash_table()
@@ -1514,6 +1602,11 @@ create_structure_id_str_hash_table()
 parse_loot_data()
 create_loot_id_str_hash_table()
 
+parse_recipe_data()
+create_recipe_id_str_hash_table()
+create_recipe_ingredient_id_lookup()
+create_recipe_ingredient_index()
+
 air_tile_id = get_tile_id_by_id_str("tile.none")
 grass_tile_id = get_tile_id_by_id_str("tile.grass")
 
@@ -1,6 +1,7 @@
 """
 Game state management to replace scattered global variables.
 """
+import numpy as np
 import pygame
 
 
@@ -18,17 +19,7 @@ class GameState:
     last_hovered_item = None
 
     # Lighting system
-    light_surface: pygame.Surface = pygame.Surface((0, 0))
-    newest_light_surface: pygame.Surface = pygame.Surface((0, 0))
-    newest_light_surface_position: tuple[float, float] = (0, 0)
-    light_min_x: int = 0
-    light_max_x: int = 0
-    light_min_y: int = 0
-    light_max_y: int = 0
-    thread_active: bool = False
-    last_thread_time: float = 0.2
-    last_thread_start: float = pygame.time.get_ticks()
-    map_light: list[list[int]] = []
+    map_light: np.ndarray = np.zeros((0, 0), dtype=np.int16)
 
     # Menu system
     save_select_surface: pygame.Surface = pygame.Surface((315, 360), pygame.SRCALPHA)
@@ -20,13 +20,38 @@ class ItemSlotClickResult(Enum):
     SWAPPED = 2
 
 
-def get_random_item_prefix(prefix_category):
+# Item images scaled down to fit in a slot, keyed by item id
+resized_item_images: dict[int, pygame.Surface] = {}
+
+
+def get_resized_item_image(item_id: int) -> pygame.Surface:
+    """
+    Returns the item's image scaled down to at most 32 pixels along its longest side, scaling it the first time
+    """
+    image = resized_item_images.get(item_id)
+    if image is None:
+        image = game_data.get_item_by_id(item_id).surface
+        if type(image) is not pygame.Surface:
+            raise ValueError("Item image is not set.")
+        if max(image.get_width(), image.get_height()) > 32:
+            image = pygame.transform.scale(
+                image,
+                (
+                    image.get_width() * (32 / max(image.get_width(), image.get_height())),
+                    image.get_height() * (32 / max(image.get_width(), image.get_height())),
+                ),
+            )
+        resized_item_images[item_id] = image
+    return image
+
+
+def get_random_item_prefix(prefix_category, rng=random):
     """
     Gets a random prefix from the prefix category
     """
     return [
         prefix_category,
-        game_data.prefix_data[prefix_category][random.randint(0, len(game_data.prefix_data[prefix_category]) - 1)],
+        game_data.prefix_data[prefix_category][rng.randint(0, len(game_data.prefix_data[prefix_category]) - 1)],
     ]
 
 
@@ -36,7 +61,7 @@ class Item:
     Weapons, pickaxes, etc. will be automatically given a random prefix from the appropriate category when constructed
     """
 
-    def __init__(self, item_id, amount=1, auto_assign_prefix=False, prefix_name=None):
+    def __init__(self, item_id, amount=1, auto_assign_prefix=False, prefix_name=None, rng=random):
         self.json_item = game_data.get_item_by_id(item_id)
 
         self.item_id = item_id
@@ -49,9 +74,9 @@ class Item:
             if self.json_item is not None:
                 if auto_assign_prefix and ItemTag.WEAPON in self.json_item.tags:
                     # 15% chance to be given a prefix if it has a prefix category
-                    if len(self.json_item.prefixes) > 0 and random.random() < 0.85:
+                    if len(self.json_item.prefixes) > 0 and rng.random() < 0.85:
                         self.prefix_data = get_random_item_prefix(
-                            self.json_item.prefixes[random.randint(0, len(self.json_item.prefixes) - 1)]
+                            self.json_item.prefixes[rng.randint(0, len(self.json_item.prefixes) - 1)], rng
                         )
                         self.has_prefix = True
 
@@ -191,19 +216,7 @@ class Item:
         raise ValueError("Item image is not set.")
 
     def get_resized_image(self):
-        if type(self.json_item.surface) is pygame.Surface:
-            image = self.json_item.surface
-            if max(image.get_width(), image.get_height()) > 32:
-                image = pygame.transform.scale(
-                    image,
-                    (
-                        image.get_width() * (32 / max(image.get_width(), image.get_height())),
-                        image.get_height() * (32 / max(image.get_width(), image.get_height())),
-                    ),
-                )
-            return image
-        else:
-            raise ValueError("Item image is not set.")
+        return get_resized_item_image(self.item_id)
 
     def get_offset_x(self):
         if type(self.json_item.surface) is pygame.Surface:
@@ -387,10 +400,10 @@ def get_coins_from_int(coin_int: int) -> list[Item]:
     return item_list
 
 
-def generate_loot_items(loot_id_str, tile_pos, fill_with_none):
+def generate_loot_items(loot_id_str, tile_pos, fill_with_none, rng=random):
     loot_data = game_data.get_loot_by_id_str(loot_id_str)
     item_count_range = loot_data.item_spawn_count_range
-    item_count = random.randint(item_count_range[0], item_count_range[1])
+    item_count = rng.randint(item_count_range[0], item_count_range[1])
     possible_items = loot_data.item_list_data
 
     spawn_list = []
@@ -410,13 +423,13 @@ def generate_loot_items(loot_id_str, tile_pos, fill_with_none):
                     total_weight += possible_item[1]
                     possible_item_indices.append(possible_item_index)
 
-        random_num = random.randint(0, total_weight)
+        random_num = rng.randint(0, total_weight)
 
         for possible_item_index in possible_item_indices:
             if possible_item_index not in void_indices:
                 possible_item = possible_items[possible_item_index]
                 if random_num <= possible_item[1]:
-                    random_count = random.randint(possible_item[3][0], possible_item[3][1])
+                    random_count = rng.randint(possible_item[3][0], possible_item[3][1])
                     new_item_id = game_data.get_item_id_by_id_str(possible_item[0])
 
                     should_add_instance = True
@@ -444,13 +457,13 @@ def generate_loot_items(loot_id_str, tile_pos, fill_with_none):
     spawn_list = sorted(spawn_list, key=lambda x: int(x[2]))
     for item_index in range(len(spawn_list)):
         spawn_item_data = spawn_list[item_index]
-        spawn_list[item_index] = Item(spawn_item_data[0], spawn_item_data[1], auto_assign_prefix=True)
+        spawn_list[item_index] = Item(spawn_item_data[0], spawn_item_data[1], auto_assign_prefix=True, rng=rng)
 
     # Coins
     assert loot_data is not None
 
     random_coin_range = loot_data.coin_spawn_range
-    random_coin_count = random.randint(random_coin_range[0], random_coin_range[1])
+    random_coin_count = rng.randint(random_coin_range[0], random_coin_range[1])
     coin_items = get_coins_from_int(random_coin_count)
     for coin_item in coin_items:
         spawn_list.append(coin_item)
@@ -0,0 +1,277 @@
+import atexit
+import queue
+import threading
+import time
+
+import numpy as np
+import pygame
+
+import commons
+import game_constants
+import game_data
+import profiler
+import world
+from game_state import GameState
+
+# Per tile id light reduction and emission, built from game_data on first use
+light_reduction_lookup: np.ndarray | None = None
+light_emission_lookup: np.ndarray | None = None
+
+# Propagated light of the last computed window, reused until the window, sky light or terrain changes
+cached_window_key: tuple | None = None
+cached_window_light: np.ndarray | None = None
+cached_window_open_sky: np.ndarray | None = None
+
+# Jobs waiting for the lighting worker, a None job tells it to stop
+light_job_queue: queue.Queue = queue.Queue(maxsize=game_constants.LIGHT_JOB_QUEUE_SIZE)
+light_worker_thread: threading.Thread | None = None
+light_worker_exit_registered = False
+
+# The worker renders into the back buffer and swaps it with the front buffer under the lock when done
+light_overlay_lock = threading.Lock()
+light_front_buffer: pygame.Surface | None = None
+light_back_buffer: pygame.Surface | None = None
+light_front_buffer_position: tuple[float, float] = (0, 0)
+
+light_jobs_completed = 0
+light_jobs_dropped = 0
+light_last_latency = 0.0
+light_average_latency = game_constants.DEFAULT_THREAD_TIME
+
+
+class LightJob:
+    """
+    Snapshot of what the lighting worker needs to light the area around a camera position
+    """
+
+    def __init__(self, camera_position: tuple[float, float], sky_light: int):
+        self.camera_position = camera_position
+        self.sky_light = sky_light
+        self.submit_time = time.perf_counter()
+
+
+def get_light_lookups() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the light reduction and emission of every tile id as arrays
+    """
+    global light_reduction_lookup, light_emission_lookup
+    if light_reduction_lookup is None or light_emission_lookup is None:
+        light_reduction_lookup = np.array(game_data.tile_id_light_reduction_lookup, dtype=np.int32)
+        light_emission_lookup = np.array(game_data.tile_id_light_emission_lookup, dtype=np.int32)
+    return light_reduction_lookup, light_emission_lookup
+
+
+def sweep_light(light: np.ndarray, reduction: np.ndarray, axis: int) -> None:
+    """
+    Carries light forward along an axis in one pass, each tile passed through removes its reduction
+    """
+    # Light from j reaching i is light[j] + cost[j] - cost[i] where cost is the running sum of reductions
+    cost = np.cumsum(reduction, axis=axis)
+    np.maximum(light, np.maximum.accumulate(light + cost, axis=axis) - cost, out=light)
+
+
+def propagate_light(light: np.ndarray, reduction: np.ndarray) -> None:
+    """
+    Spreads light in place through the array in all four directions until it settles
+    """
+    flipped_x = (slice(None, None, -1), slice(None))
+    flipped_y = (slice(None), slice(None, None, -1))
+    while True:
+        previous = light.copy()
+        sweep_light(light, reduction, 0)
+        sweep_light(light[flipped_x], reduction[flipped_x], 0)
+        sweep_light(light, reduction, 1)
+        sweep_light(light[flipped_y], reduction[flipped_y], 1)
+        if np.array_equal(light, previous):
+            return
+
+
+def compute_window_light(min_x: int, max_x: int, min_y: int, max_y: int, sky_light: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the propagated light of a window of the world and a mask of the tiles open to the sky
+    """
+    global cached_window_key, cached_window_light, cached_window_open_sky
+    window_key = (min_x, max_x, min_y, max_y, sky_light, world.terrain_revision)
+    if window_key == cached_window_key:
+        return cached_window_light, cached_window_open_sky
+
+    reduction_lookup, emission_lookup = get_light_lookups()
+    tiles = world.world.tile_grid.tiles[min_x:max_x, min_y:max_y]
+    walls = world.world.tile_grid.walls[min_x:max_x, min_y:max_y]
+
+    reduction = reduction_lookup[tiles]
+    open_sky = (tiles == game_data.air_tile_id) & (walls == game_data.air_wall_id)
+
+    sources = emission_lookup[tiles]
+    sky_rows = max(0, min(max_y, game_constants.SURFACE_LIGHT_LEVEL_Y) - min_y)
+    sky_sources = sources[:, :sky_rows]
+    sky_sources[open_sky[:, :sky_rows]] = np.maximum(sky_sources[open_sky[:, :sky_rows]], sky_light)
+
+    # A source tile also dims its own light, like every tile the light passes through afterwards
+    light = np.where(sources > 0, np.maximum(sources - reduction, 0), 0)
+    propagate_light(light, reduction)
+
+    cached_window_key = window_key
+    cached_window_light = light
+    cached_window_open_sky = open_sky
+    return light, open_sky
+
+
+def apply_window_light(map_light: np.ndarray, min_x: int, max_x: int, min_y: int, max_y: int, light: np.ndarray) -> None:
+    """
+    Fades the stored light of a window towards darkness and brightens it where the new light is stronger.
+    The new light is propagated without looking at the stored light, so a tile that is still brighter from earlier
+    frames doesn't stop fresh light from passing through it like the old recursive fill did. Both give the same light
+    once the scene stops changing, but light that is fading out can reach a little further
+    """
+    window = map_light[min_x:max_x, min_y:max_y]
+    np.maximum(window - game_constants.LIGHT_REDUCTION_PER_FRAME, light, out=window, casting="unsafe")
+
+
+def build_light_surface(light: np.ndarray, open_sky: np.ndarray, sky_light: int) -> pygame.Surface:
+    """
+    Creates a black surface with one pixel per tile whose alpha darkens the tiles with little light
+    """
+    light_surface = pygame.Surface(light.shape, pygame.SRCALPHA)
+    light_surface.fill((0, 0, 0, 0))
+    alpha = pygame.surfarray.pixels_alpha(light_surface)
+    alpha[:] = np.where(open_sky, 255 - sky_light, 255 - np.clip(light, 0, 255))
+    del alpha
+    return light_surface
+
+
+def render_light_job(job: LightJob) -> tuple[pygame.Surface, tuple[float, float]] | None:
+    """
+    Lights the window around the job's camera position, returns the unscaled light surface and its world position
+    """
+    min_x = int(job.camera_position[0] // commons.BLOCK_SIZE - GameState.LIGHT_RENDER_DISTANCE_X)
+    max_x = int(job.camera_position[0] // commons.BLOCK_SIZE + GameState.LIGHT_RENDER_DISTANCE_X)
+    min_y = int(job.camera_position[1] // commons.BLOCK_SIZE - GameState.LIGHT_RENDER_DISTANCE_Y)
+    max_y = int(job.camera_position[1] // commons.BLOCK_SIZE + GameState.LIGHT_RENDER_DISTANCE_Y)
+
+    min_x = max(0, min_x)
+    min_y = max(0, min_y)
+    max_x = min(world.WORLD_SIZE_X, max_x)
+    max_y = min(world.WORLD_SIZE_Y, max_y)
+
+    if min_x >= max_x or min_y >= max_y:
+        return None
+
+    light, open_sky = compute_window_light(min_x, max_x, min_y, max_y, job.sky_light)
+    apply_window_light(GameState.map_light, min_x, max_x, min_y, max_y, light)
+    light_surface = build_light_surface(GameState.map_light[min_x:max_x, min_y:max_y], open_sky, job.sky_light)
+    return light_surface, (min_x * commons.BLOCK_SIZE, min_y * commons.BLOCK_SIZE)
+
+
+def run_light_worker() -> None:
+    """
+    Processes light jobs until told to stop, publishing each result by swapping the overlay buffers
+    """
+    global light_front_buffer, light_back_buffer, light_front_buffer_position
+    global light_jobs_completed, light_last_latency, light_average_latency
+    while True:
+        job = light_job_queue.get()
+        if job is None:
+            return
+
+        with profiler.section("light_job"):
+            result = render_light_job(job)
+        if result is None:
+            continue
+        light_surface, position = result
+
+        scaled_size = (light_surface.get_width() * commons.BLOCK_SIZE, light_surface.get_height() * commons.BLOCK_SIZE)
+        if light_back_buffer is None or light_back_buffer.get_size() != scaled_size:
+            light_back_buffer = pygame.Surface(scaled_size, pygame.SRCALPHA)
+        pygame.transform.scale(light_surface, scaled_size, light_back_buffer)
+
+        with light_overlay_lock:
+            light_front_buffer, light_back_buffer = light_back_buffer, light_front_buffer
+            light_front_buffer_position = position
+
+        light_jobs_completed += 1
+        light_last_latency = time.perf_counter() - job.submit_time
+        light_average_latency += (light_last_latency - light_average_latency) * game_constants.LIGHT_LATENCY_SMOOTHING
+
+
+def start_light_worker() -> None:
+    """
+    Starts the lighting worker thread if it is not already running
+    """
+    global light_worker_thread, light_worker_exit_registered
+    if light_worker_thread is not None:
+        return
+    light_worker_thread = threading.Thread(target=run_light_worker, name="LightingWorker", daemon=True)
+    light_worker_thread.start()
+    if not light_worker_exit_registered:
+        atexit.register(stop_light_worker)
+        light_worker_exit_registered = True
+
+
+def stop_light_worker() -> None:
+    """
+    Discards pending jobs, waits for the lighting worker to finish and drops the current overlay
+    """
+    global light_worker_thread, light_front_buffer, light_back_buffer
+    if light_worker_thread is None:
+        return
+    while True:
+        try:
+            light_job_queue.get_nowait()
+        except queue.Empty:
+            break
+    light_job_queue.put(None)
+    light_worker_thread.join()
+    light_worker_thread = None
+    with light_overlay_lock:
+        light_front_buffer = None
+        light_back_buffer = None
+
+
+def submit_light_job(camera_position: tuple[float, float], sky_light: int) -> None:
+    """
+    Queues a light job for the given camera position, replacing the oldest waiting job if the queue is full
+    """
+    global light_jobs_dropped
+    start_light_worker()
+    job = LightJob(camera_position, sky_light)
+    while True:
+        try:
+            light_job_queue.put_nowait(job)
+            return
+        except queue.Full:
+            try:
+                light_job_queue.get_nowait()
+                light_jobs_dropped += 1
+            except queue.Empty:
+                pass
+
+
+def draw_light_overlay(surface: pygame.Surface, camera_position: tuple[float, float]) -> None:
+    """
+    Draws the most recently finished light overlay relative to the camera
+    """
+    with light_overlay_lock:
+        if light_front_buffer is None:
+            return
+        surface.blit(
+            light_front_buffer,
+            (
+                light_front_buffer_position[0] - camera_position[0] + commons.WINDOW_WIDTH * 0.5,
+                light_front_buffer_position[1] - camera_position[1] + commons.WINDOW_HEIGHT * 0.5,
+            ),
+        )
+
+
+def get_light_worker_stats() -> dict:
+    """
+    Returns the lighting worker's queue depth, job counts and job latency in milliseconds
+    """
+    return {
+        "running": light_worker_thread is not None,
+        "queue_depth": light_job_queue.qsize(),
+        "jobs_completed": light_jobs_completed,
+        "jobs_dropped": light_jobs_dropped,
+        "last_latency_ms": light_last_latency * 1000,
+        "average_latency_ms": light_average_latency * 1000,
+    }
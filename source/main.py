@@ -3,11 +3,15 @@ import datetime
 import math
 import random
 import sys
+import time
 from typing import Any, List
 
+startup_start_time = time.perf_counter()
+
 import pygame
 import pygame.locals
 
+import asset_manager
 import commons
 import entity_manager
 import game_constants
@@ -15,6 +19,7 @@ import game_data
 import item
 import menu_manager
 import player
+import profiler
 import prompt
 import shared_methods
 import sound_manager
@@ -36,6 +41,8 @@ state_manager_instance = StateManager()
 state_manager_instance.add_state('PLAYING', PlayingState())
 state_manager_instance.add_state('MAIN_MENU', MainMenuState())
 
+simulation_time_accumulator = 0.0
+
 while True:
     commons.MOUSE_POSITION = pygame.mouse.get_pos()
     commons.HOVERED_TILE = (
@@ -49,12 +56,11 @@ while True:
         ),
     )
 
-    commons.DELTA_TIME = (pygame.time.get_ticks() - old_time_milliseconds) * 0.001
+    commons.FRAME_TIME = (pygame.time.get_ticks() - old_time_milliseconds) * 0.001
     old_time_milliseconds = pygame.time.get_ticks()
 
-    # If framerate is less than 30, simulate at a slower speed
-    if commons.DELTA_TIME > 0.033333:
-        commons.DELTA_TIME = 0.033333
+    # Very slow frames, like the one after loading a world, only advance the simulation by a capped amount
+    simulation_time_accumulator += min(commons.FRAME_TIME, game_constants.MAX_FRAME_TIME)
 
     if pygame.key.get_mods() & (pygame.KMOD_LSHIFT | pygame.KMOD_RSHIFT):
         commons.SHIFT_ACTIVE = True
@@ -65,8 +71,24 @@ while True:
     state_manager_instance.current_state = state_manager_instance.states.get(commons.game_state)
     events = pygame.event.get()
     state_manager_instance.handle_events(events)
-    state_manager_instance.update(commons.DELTA_TIME)
-    state_manager_instance.draw(commons.screen)
+
+    # Run the simulation in fixed steps, dropping the time left over if it falls too far behind
+    commons.DELTA_TIME = commons.SIMULATION_DELTA_TIME
+    simulation_steps = 0
+    while simulation_time_accumulator >= commons.SIMULATION_DELTA_TIME:
+        if simulation_steps == game_constants.MAX_SIMULATION_STEPS_PER_FRAME:
+            simulation_time_accumulator %= commons.SIMULATION_DELTA_TIME
+            break
+        with profiler.section("simulation_tick"):
+            state_manager_instance.update(commons.SIMULATION_DELTA_TIME)
+        simulation_time_accumulator -= commons.SIMULATION_DELTA_TIME
+        simulation_steps += 1
+    commons.INTERPOLATION_ALPHA = simulation_time_accumulator / commons.SIMULATION_DELTA_TIME
+
+    # Everything drawn from here on moves by the real frame time
+    commons.DELTA_TIME = min(commons.FRAME_TIME, game_constants.MAX_FRAME_TIME)
+    with profiler.section("draw"):
+        state_manager_instance.draw(commons.screen)
     # Draw a prompt if there is one
     if entity_manager.client_prompt is not None:
         entity_manager.client_prompt.update()
@@ -78,15 +100,16 @@ while True:
     if commons.DRAW_UI:
         if GameState.fps_tick <= 0:
             GameState.fps_tick += game_constants.FPS_UPDATE_FREQUENCY
-            if commons.DELTA_TIME > 0:
+            if commons.FRAME_TIME > 0:
                 fps_text = shared_methods.outline_text(
-                    str(int(1.0 / commons.DELTA_TIME)),
+                    str(int(1.0 / commons.FRAME_TIME)),
                     pygame.Color(255, 255, 255),
                     commons.DEFAULT_FONT,
                 )
         else:
             GameState.fps_tick -= commons.DELTA_TIME
         commons.screen.blit(fps_text, (commons.WINDOW_WIDTH - fps_text.get_width(), 0))
+    profiler.draw_overlay(commons.screen)
 
     # Reset some variables when the mouse button is lifted
     if not pygame.mouse.get_pressed()[0]:
@@ -118,5 +141,10 @@ while True:
                 sys.exit()
             commons.WAIT_TO_USE = True
 
-    pygame.display.flip()
+    with profiler.section("flip"):
+        pygame.display.flip()
+    if startup_start_time is not None:
+        asset_manager.print_load_report("Drew the main menu", startup_start_time)
+        asset_manager.write_texture_cache()
+        startup_start_time = None
     clock.tick(commons.TARGET_FPS)
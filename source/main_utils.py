@@ -1,4 +1,3 @@
-import _thread
 import datetime
 import math
 import random
@@ -54,12 +53,12 @@ def draw_death_message() -> None:
     Renders and draws a large death message to the screen
     """
     assert isinstance(entity_manager.get_client_player(), entity_manager.Player)
-    death_text = shared_methods.outline_text("You were slain...", pygame.Color(255, 127, 127), commons.LARGE_FONT)
+    death_text = shared_methods.outline_text("You were slain...", pygame.Color(255, 127, 127), commons.LARGE_FONT).copy()
     respawn_text = shared_methods.outline_text(
         str(int(entity_manager.get_client_player().respawn_time_remaining) + 1),
         pygame.Color(255, 127, 127),
         commons.LARGE_FONT,
-    )
+    ).copy()
     alpha = int((1 - entity_manager.get_client_player().death_message_alpha) * 255)
     death_text.set_alpha(alpha)
     respawn_text.set_alpha(alpha)
@@ -399,122 +398,6 @@ def render_stats_text(pos: List[Any]) -> bool:
     return False
 
 
-def update_light() -> None:
-    """
-    Run by the lighting thread to update the light surface and it's position in the world
-    """
-    GameState.thread_active = True
-
-    target_position = (
-        entity_manager.camera_position[0]
-        + (entity_manager.camera_position_difference[0] / commons.DELTA_TIME) * GameState.last_thread_time,
-        entity_manager.camera_position[1]
-        + (entity_manager.camera_position_difference[1] / commons.DELTA_TIME) * GameState.last_thread_time,
-    )
-
-    GameState.light_min_x = int(target_position[0] // commons.BLOCK_SIZE - GameState.LIGHT_RENDER_DISTANCE_X)
-    GameState.light_max_x = int(target_position[0] // commons.BLOCK_SIZE + GameState.LIGHT_RENDER_DISTANCE_X)
-    GameState.light_min_y = int(target_position[1] // commons.BLOCK_SIZE - GameState.LIGHT_RENDER_DISTANCE_Y)
-    GameState.light_max_y = int(target_position[1] // commons.BLOCK_SIZE + GameState.LIGHT_RENDER_DISTANCE_Y)
-
-    min_change_x = 0
-    min_change_y = 0
-
-    if GameState.light_min_x < 0:
-        min_change_x = -GameState.light_min_x
-        GameState.light_min_x = 0
-    if GameState.light_min_y < 0:
-        min_change_y = -GameState.light_min_y
-        GameState.light_min_y = 0
-
-    if GameState.light_min_x >= world.WORLD_SIZE_X or GameState.light_min_y >= world.WORLD_SIZE_Y or GameState.light_max_x < 0 or GameState.light_max_y < 0:
-        GameState.thread_active = False
-        return
-
-    temp_pos = (
-        (target_position[
-             0] // commons.BLOCK_SIZE - GameState.LIGHT_RENDER_DISTANCE_X + min_change_x) * commons.BLOCK_SIZE,
-        (target_position[
-             1] // commons.BLOCK_SIZE - GameState.LIGHT_RENDER_DISTANCE_Y + min_change_y) * commons.BLOCK_SIZE,
-    )
-
-    if GameState.light_max_x > world.WORLD_SIZE_X:
-        GameState.light_max_x = world.WORLD_SIZE_X
-    if GameState.light_max_y > world.WORLD_SIZE_Y:
-        GameState.light_max_y = world.WORLD_SIZE_Y
-
-    # timeBefore = pygame.time.get_ticks()
-
-    for x_index in range(GameState.light_min_x, GameState.light_max_x):
-        for y_index in range(GameState.light_min_y, GameState.light_max_y):
-            GameState.map_light[x_index][y_index] = max(0, GameState.map_light[x_index][y_index] - 16)
-
-    # mapLight = [[0 for i in range(world.WORLD_SIZE_Y)] for j in range(world.WORLD_SIZE_X)]
-
-    for x_index in range(GameState.light_min_x, GameState.light_max_x):
-        for y_index in range(GameState.light_min_y, GameState.light_max_y):
-            if y_index < 110:
-                if (
-                        world.world.tile_data[x_index][y_index][1] == game_data.air_wall_id
-                        and world.world.tile_data[x_index][y_index][0] == game_data.air_tile_id
-                ):
-                    fill_light(x_index, y_index, commons.CURRENT_SKY_LIGHTING)
-            tile_emission = game_data.tile_id_light_emission_lookup[world.world.tile_data[x_index][y_index][0]]
-            if tile_emission > 0:
-                fill_light(x_index, y_index, tile_emission)
-
-    # print("Fill Light MS: ", pygame.time.get_ticks() - timeBefore)
-
-    range_x = GameState.light_max_x - GameState.light_min_x
-    range_y = GameState.light_max_y - GameState.light_min_y
-
-    # timeBefore = pygame.time.get_ticks()
-
-    GameState.light_surface = pygame.Surface((range_x, range_y), pygame.SRCALPHA)
-
-    for x_index in range(range_x):
-        for y_index in range(range_y):
-            tile_dat = world.world.tile_data[GameState.light_min_x + x_index][GameState.light_min_y + y_index]
-            if tile_dat[0] == game_data.air_tile_id and tile_dat[1] == game_data.air_wall_id:
-                GameState.light_surface.set_at((x_index, y_index), (0, 0, 0, 255 - commons.CURRENT_SKY_LIGHTING))
-            else:
-                GameState.light_surface.set_at(
-                    (x_index, y_index),
-                    (
-                        0,
-                        0,
-                        0,
-                        255 - GameState.map_light[x_index + GameState.light_min_x][y_index + GameState.light_min_y],
-                    ),
-                )
-
-    GameState.light_surface = pygame.transform.scale(GameState.light_surface,
-                                                     (range_x * commons.BLOCK_SIZE, range_y * commons.BLOCK_SIZE))
-
-    GameState.newest_light_surface_position = temp_pos
-    GameState.newest_light_surface = GameState.light_surface
-    GameState.thread_active = False
-
-    # print("Scale Copy MS: ", pygame.time.get_ticks() - timeBefore)
-
-
-def fill_light(x_pos: int, y_pos: int, light_value: int) -> None:
-    """Recursively calls itself to populate data in the map_light array"""
-    if GameState.light_min_x <= x_pos < GameState.light_max_x and GameState.light_min_y <= y_pos < GameState.light_max_y:
-        light_reduction = game_data.tile_id_light_reduction_lookup[world.world.tile_data[x_pos][y_pos][0]]
-        new_light_value = max(0, light_value - light_reduction)
-        if new_light_value > GameState.map_light[x_pos][y_pos]:
-            GameState.map_light[x_pos][y_pos] = int(new_light_value)
-            fill_light(x_pos - 1, y_pos, new_light_value)
-            fill_light(x_pos + 1, y_pos, new_light_value)
-            fill_light(x_pos, y_pos - 1, new_light_value)
-            fill_light(x_pos, y_pos + 1, new_light_value)
-        else:
-            return
-    else:
-        return
-
-
 def get_speed_text(speed: float) -> str:
     """
     Gets a string relating to the speed value given
@@ -614,31 +497,37 @@ def draw_inventory_hover_text() -> None:
 
     # Crafting menu
     elif pygame.Rect(5, 270, 48, 288).collidepoint(commons.MOUSE_POSITION):
+        crafting_menu = entity_manager.get_client_player().items[item.ItemLocation.CRAFTING_MENU]
         array_index = (commons.MOUSE_POSITION[1] - 270 - int(entity_manager.get_client_player().crafting_menu_offset_y)) // 48
-        if 0 <= array_index < len(entity_manager.get_client_player().items[item.ItemLocation.CRAFTING_MENU]):
+        if 0 <= array_index < len(crafting_menu):
+            # Crafting takes the ingredients out of the inventory, which can rebuild the crafting menu
+            crafting_entry = crafting_menu[array_index]
             if pygame.mouse.get_pressed()[0]:
                 if not commons.is_holding_item:
-                    item.item_holding = item.Item(
-                        entity_manager.get_client_player().items[item.ItemLocation.CRAFTING_MENU][array_index][0],
-                        amount=entity_manager.get_client_player().items[item.ItemLocation.CRAFTING_MENU][array_index][1],
-                        auto_assign_prefix=True,
-                    )
-                    commons.is_holding_item = True
-                    GameState.can_pickup_item = False
-                    GameState.can_drop_holding = False
-                    game_data.play_sound(item.item_holding.get_pickup_sound_id_str())
+                    if entity_manager.get_client_player().craft_recipe(crafting_entry[2]):
+                        item.item_holding = item.Item(
+                            crafting_entry[0],
+                            amount=crafting_entry[1],
+                            auto_assign_prefix=True,
+                        )
+                        commons.is_holding_item = True
+                        GameState.can_pickup_item = False
+                        GameState.can_drop_holding = False
+                        game_data.play_sound(item.item_holding.get_pickup_sound_id_str())
                 elif GameState.can_drop_holding and item.item_holding is not None:
-                    if (
-                            item.item_holding.item_id
-                            == entity_manager.get_client_player().items[item.ItemLocation.CRAFTING_MENU][array_index][0]
-                    ):
-                        if item.item_holding.amount < item.item_holding.get_max_stack():
-                            item.item_holding.amount += entity_manager.get_client_player().items[
-                                item.ItemLocation.CRAFTING_MENU
-                            ][array_index][1]
+                    if item.item_holding.item_id == crafting_entry[0]:
+                        if (
+                                item.item_holding.amount < item.item_holding.get_max_stack()
+                                and entity_manager.get_client_player().craft_recipe(crafting_entry[2])
+                        ):
+                            item.item_holding.amount += crafting_entry[1]
                             game_data.play_sound("sound.grab")
 
-            if render_stats_text([item.ItemLocation.CRAFTING_MENU, array_index]) and not commons.is_holding_item:
+            if (
+                    array_index < len(entity_manager.get_client_player().items[item.ItemLocation.CRAFTING_MENU])
+                    and render_stats_text([item.ItemLocation.CRAFTING_MENU, array_index])
+                    and not commons.is_holding_item
+            ):
                 commons.screen.blit(
                     GameState.stats_text,
                     (commons.MOUSE_POSITION[0] + 10, commons.MOUSE_POSITION[1] + 10),
@@ -680,7 +569,7 @@ def draw_inventory_hover_text() -> None:
                     # Items are being swapped
                     elif item_add_data[0] == item.ItemSlotClickResult.SWAPPED:
                         game_data.play_sound(item.item_holding.get_drop_sound_id_str())
-                        entity_manager.get_client_player().items[item_add_data[2]][pos[1]] = item.item_holding
+                        entity_manager.get_client_player().set_item(item_add_data[2], pos[1], item.item_holding)
                         item.item_holding = item_add_data[1]
 
                     if pos not in entity_manager.get_client_player().old_inventory_positions:
@@ -781,7 +670,7 @@ def draw_interactive_block_hover() -> None:
     Draws the item image of an interactive block being hovered by the mouse
     """
     if world.tile_in_map(commons.HOVERED_TILE[0], commons.HOVERED_TILE[1]):
-        tile_id = world.world.tile_data[commons.HOVERED_TILE[0]][commons.HOVERED_TILE[1]][0]
+        tile_id = world.world.tile_grid.get_tile(commons.HOVERED_TILE[0], commons.HOVERED_TILE[1])
         tile_data = game_data.get_tile_by_id(tile_id)
         if tile_data is not None:
             if commons.TileTag.CHEST in tile_data.tags or commons.TileTag.CYCLABLE in tile_data.tags:
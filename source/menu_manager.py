@@ -11,9 +11,11 @@ from pygame.locals import Rect
 
 import commons
 import entity_manager
+import game_constants
 import game_data
 import player
 import prompt
+import save_index
 import shared_methods
 import tilesets
 import world
@@ -487,6 +489,7 @@ def update_menu_buttons():
                                 commons.PLAYER_DATA,
                                 open(f"assets/players/{commons.TEXT_INPUT}.player", "wb"),
                             )  # Save player array
+                            save_index.update_player_entry(commons.PLAYER_DATA)
                             commons.game_sub_state = "PLAYER_SELECTION"
                             load_menu_player_data()
                         case PlayerNamingButtons.BACK:
@@ -498,23 +501,19 @@ def update_menu_buttons():
                         case WorldCreationButtons.TINY:
                             commons.game_sub_state = "WORLD_NAMING"
                             commons.TEXT_INPUT = ""
-                            world.WORLD_SIZE_X = 100
-                            world.WORLD_SIZE_Y = 350
+                            world.WORLD_SIZE_X, world.WORLD_SIZE_Y = game_constants.WORLD_SIZES["TINY"]
                         case WorldCreationButtons.SMALL:
                             commons.game_sub_state = "WORLD_NAMING"
                             commons.TEXT_INPUT = ""
-                            world.WORLD_SIZE_X = 200
-                            world.WORLD_SIZE_Y = 400
+                            world.WORLD_SIZE_X, world.WORLD_SIZE_Y = game_constants.WORLD_SIZES["SMALL"]
                         case WorldCreationButtons.MEDIUM:
                             commons.game_sub_state = "WORLD_NAMING"
                             commons.TEXT_INPUT = ""
-                            world.WORLD_SIZE_X = 400
-                            world.WORLD_SIZE_Y = 450
+                            world.WORLD_SIZE_X, world.WORLD_SIZE_Y = game_constants.WORLD_SIZES["MEDIUM"]
                         case WorldCreationButtons.LARGE:
                             commons.game_sub_state = "WORLD_NAMING"
                             commons.TEXT_INPUT = ""
-                            world.WORLD_SIZE_X = 700
-                            world.WORLD_SIZE_Y = 550
+                            world.WORLD_SIZE_X, world.WORLD_SIZE_Y = game_constants.WORLD_SIZES["LARGE"]
                         case WorldCreationButtons.BACK:
                             commons.game_sub_state = "WORLD_SELECTION"
                         case WorldNamingButtons.SET_NAME:
@@ -583,22 +582,19 @@ def draw_menu_buttons():
 
 def load_menu_player_data():
     """
-    Loads all player save metadata and creates a surface for each one
+    Loads all player save summaries from the save index and creates a surface for each one
     """
     path = "assets/players"
     if not os.path.exists(path):
         os.makedirs(path)
-    possible_loads = os.listdir(path)  # Get filenames
     commons.PLAYER_SAVE_OPTIONS = []
 
-    for i in range(len(possible_loads)):
-        dat = pickle.load(open("assets/players/" + possible_loads[i], "rb"))
-        possible_loads[i] = possible_loads[i][:-7]
+    for entry in save_index.get_player_entries():
         player_data_surf = pygame.Surface((315, 60))
         player_data_surf.fill((50, 50, 50))
         pygame.draw.rect(player_data_surf, (60, 60, 60), Rect(0, 0, 315, 60), 4)
         player_data_surf.blit(
-            shared_methods.outline_text(dat["name"], pygame.Color(255, 255, 255), commons.DEFAULT_FONT),
+            shared_methods.outline_text(entry["name"], pygame.Color(255, 255, 255), commons.DEFAULT_FONT),
             (5, 3),
         )  # Name
         player_data_surf.blit(
@@ -611,13 +607,13 @@ def load_menu_player_data():
         )  # Playtime
         player_data_surf.blit(
             shared_methods.outline_text(
-                str(dat["creation_date"])[:19], pygame.Color(230, 230, 0), commons.DEFAULT_FONT
+                str(entry["creation_date"])[:19], pygame.Color(230, 230, 0), commons.DEFAULT_FONT
             ),
             (80, 20),
         )  # Creation date
         player_data_surf.blit(
             shared_methods.outline_text(
-                str(dat["hp"]) + "HP",
+                str(entry["hp"]) + "HP",
                 pygame.Color(230, 10, 10),
                 commons.DEFAULT_FONT,
                 outline_color=pygame.Color(128, 5, 5),
@@ -635,74 +631,81 @@ def load_menu_player_data():
         )  # mana
         player_data_surf.blit(
             shared_methods.outline_text(
-                str(int((dat["playtime"] / 60) // 60))
+                str(int((entry["playtime"] / 60) // 60))
                 + ":"
-                + str(int(dat["playtime"] // 60 % 60)).zfill(2)
+                + str(int(entry["playtime"] // 60 % 60)).zfill(2)
                 + ":"
-                + str(int(dat["playtime"] % 60)).zfill(2),
+                + str(int(entry["playtime"] % 60)).zfill(2),
                 pygame.Color(230, 230, 0),
                 commons.DEFAULT_FONT,
             ),
             (90, 40),
         )  # playtime
-        sprites = player.Model(dat["model_appearance"]).create_sprite()
-        player_data_surf.blit(sprites, (270, 0))
-        commons.PLAYER_SAVE_OPTIONS.append([dat, player_data_surf])
+        player_data_surf.blit(save_index.unpack_thumbnail(entry["thumbnail"]), (270, 0))
+        commons.PLAYER_SAVE_OPTIONS.append([entry, player_data_surf])
 
 
 def load_menu_world_data():
     """
-    Loads all world save metadata and creates a surface for each one
+    Loads all world save summaries from the save index and creates a surface for each one
     """
-    path = "assets/worlds"
+    path = world.WORLD_SAVE_DIRECTORY
     if not os.path.exists(path):
         os.makedirs(path)
-    possible_loads = os.listdir(path)  # Get filenames
     commons.WORLD_SAVE_OPTIONS = []
-    for i in range(len(possible_loads)):
-        if os.path.splitext(possible_loads[i])[1] == ".dat":  # if it's a dat file
-            world.load(possible_loads[i][:-4], load_all=False)
+    for entry in save_index.get_world_entries():
+        world_data_surf = pygame.Surface((315, 60))
+        world_data_surf.fill((50, 50, 50))
+        pygame.draw.rect(world_data_surf, pygame.Color(60, 60, 60), Rect(0, 0, 315, 60), 4)
 
-            world_data_surf = pygame.Surface((315, 60))
-            world_data_surf.fill((50, 50, 50))
-            pygame.draw.rect(world_data_surf, pygame.Color(60, 60, 60), Rect(0, 0, 315, 60), 4)
+        world_data_surf.blit(
+            shared_methods.outline_text(entry["name"], pygame.Color(255, 255, 255), commons.DEFAULT_FONT),
+            (5, 3),
+        )  # name
+        world_data_surf.blit(
+            shared_methods.outline_text("Created: ", pygame.Color(255, 255, 255), commons.DEFAULT_FONT),
+            (5, 20),
+        )  # Creation date
+        world_data_surf.blit(
+            shared_methods.outline_text("Playtime: ", pygame.Color(255, 255, 255), commons.DEFAULT_FONT),
+            (5, 40),
+        )  # Playtime
+        world_data_surf.blit(
+            shared_methods.outline_text(
+                str(entry["creation_date"])[:19],
+                pygame.Color(230, 230, 0),
+                commons.DEFAULT_FONT,
+            ),
+            (80, 20),
+        )  # Creation date
+        world_data_surf.blit(
+            shared_methods.outline_text(
+                str(int((entry["playtime"] / 60) // 60))
+                + ":"
+                + str(int(entry["playtime"] // 60 % 60)).zfill(2)
+                + ":"
+                + str(int(entry["playtime"] % 60)).zfill(2),
+                pygame.Color(230, 230, 0),
+                commons.DEFAULT_FONT,
+            ),
+            (90, 40),
+        )  # playtime
 
+        # Center the map thumbnail where the world icon used to be
+        thumbnail = save_index.unpack_thumbnail(entry["thumbnail"])
+        if thumbnail is None:
+            world_data_surf.blit(tilesets.misc_gui[10], (260, 7))
+        else:
+            thumbnail_width, thumbnail_height = game_constants.WORLD_THUMBNAIL_SIZE
             world_data_surf.blit(
-                shared_methods.outline_text(world.world.name, pygame.Color(255, 255, 255), commons.DEFAULT_FONT),
-                (5, 3),
-            )  # name
-            world_data_surf.blit(
-                shared_methods.outline_text("Created: ", pygame.Color(255, 255, 255), commons.DEFAULT_FONT),
-                (5, 20),
-            )  # Creation date
-            world_data_surf.blit(
-                shared_methods.outline_text("Playtime: ", pygame.Color(255, 255, 255), commons.DEFAULT_FONT),
-                (5, 40),
-            )  # Playtime
-            world_data_surf.blit(
-                shared_methods.outline_text(
-                    world.world.get_creation_date_string(),
-                    pygame.Color(230, 230, 0),
-                    commons.DEFAULT_FONT,
-                ),
-                (80, 20),
-            )  # Creation date
-            world_data_surf.blit(
-                shared_methods.outline_text(
-                    str(int((world.world.playtime / 60) // 60))
-                    + ":"
-                    + str(int(world.world.playtime // 60 % 60)).zfill(2)
-                    + ":"
-                    + str(int(world.world.playtime % 60)).zfill(2),
-                    pygame.Color(230, 230, 0),
-                    commons.DEFAULT_FONT,
+                thumbnail,
+                (
+                    260 + (thumbnail_width - thumbnail.get_width()) // 2,
+                    7 + (thumbnail_height - thumbnail.get_height()) // 2,
                 ),
-                (90, 40),
-            )  # playtime
-
-            world_data_surf.blit(tilesets.misc_gui[10], (260, 7))
+            )
 
-            commons.WORLD_SAVE_OPTIONS.append((world.world.name, world_data_surf))
+        commons.WORLD_SAVE_OPTIONS.append((entry["name"], world_data_surf))
 
 
 active_menu_buttons: dict[str, list[MenuObject]] = {
@@ -1,92 +1,184 @@
 import math
 import random
 
+import numpy as np
 import pygame
 
 import commons
-import entity_manager
+import game_constants
 
 
-class Particle:
+class ParticleSystem:
     """
-    Holds all the information required to update and draw a single particle
+    Stores every particle in preallocated arrays, updating them all at once and drawing them from a cache of rotated sprites
     """
 
-    def __init__(
+    ARRAY_NAMES = (
+        "positions",
+        "previous_positions",
+        "velocities",
+        "lives",
+        "init_lives",
+        "sizes",
+        "init_sizes",
+        "gravities",
+        "colors",
+        "outlines",
+    )
+
+    def __init__(self, capacity: int = game_constants.PARTICLE_CAPACITY):
+        self.count = 0
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        # Positions before the last update, for drawing between ticks
+        self.previous_positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float64)
+        self.lives = np.zeros(capacity, dtype=np.float64)
+        self.init_lives = np.ones(capacity, dtype=np.float64)
+        self.sizes = np.zeros(capacity, dtype=np.float64)
+        self.init_sizes = np.zeros(capacity, dtype=np.float64)
+        self.gravities = np.zeros(capacity, dtype=np.float64)
+        self.colors = np.zeros((capacity, 4), dtype=np.uint8)
+        self.outlines = np.zeros(capacity, dtype=np.bool_)
+        # Rotated square sprites keyed by (size, color, angle bucket)
+        self.sprite_cache: dict[tuple[int, tuple[int, int, int, int], int], pygame.Surface] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def get_arrays(self) -> list[np.ndarray]:
+        return [getattr(self, name) for name in self.ARRAY_NAMES]
+
+    def grow(self) -> None:
+        """
+        Doubles the capacity of every array, keeping the live particles
+        """
+        for name in self.ARRAY_NAMES:
+            array = getattr(self, name)
+            grown_array = np.zeros((array.shape[0] * 2, *array.shape[1:]), dtype=array.dtype)
+            grown_array[:self.count] = array[:self.count]
+            setattr(self, name, grown_array)
+
+    def spawn(
             self,
-            position,
-            color,
-            life,
-            magnitude,
-            size,
-            angle,
-            spread,
-            gravity,
+            position: tuple[float, float],
+            color: pygame.Color,
+            life: float,
+            magnitude: float,
+            size: float,
+            angle: float,
+            spread: float,
+            gravity: float,
             velocity: float = 0,
-            outline=True,
-    ):
-        self.position = position
-        self.life = life + (random.random() * life * 0.1 - life * 0.05)  # How long it lasts for (randomized slightly)
-        self.initLife = self.life
-        self.color = color
-        self.size = size + random.random() * size * 0.1 - size * 0.05  # How large it will be (randomized slightly)
-        self.initSize = self.size
-        self.outline = outline
+            outline: bool = True,
+    ) -> None:
+        """
+        Adds a particle, slightly randomizing its life and size and spreading its angle
+        """
+        if self.count == self.lives.shape[0]:
+            self.grow()
+        index = self.count
+        self.count += 1
+
+        life = life + (random.random() * life * 0.1 - life * 0.05)  # How long it lasts for (randomized slightly)
+        size = size + random.random() * size * 0.1 - size * 0.05  # How large it will be (randomized slightly)
         if velocity == 0:
             if angle == 0:
                 angle = random.random() * math.pi * 2 - math.pi  # Random angle
             else:
                 angle += random.random() * spread - spread * 0.5  # Set angle + random spread in set range
-            self.velocity = (
-                math.cos(angle) * magnitude,
-                math.sin(angle) * magnitude,
-            )  # Velocity from angle and magnitude
+            self.velocities[index] = (math.cos(angle) * magnitude, math.sin(angle) * magnitude)
         else:
-            self.velocity = (velocity, velocity)
-        self.gravity = gravity
+            self.velocities[index] = (velocity, velocity)
+
+        self.positions[index] = position
+        self.previous_positions[index] = position
+        self.lives[index] = life
+        self.init_lives[index] = life
+        self.sizes[index] = size
+        self.init_sizes[index] = size
+        self.gravities[index] = gravity
+        self.colors[index] = tuple(pygame.Color(color))
+        self.outlines[index] = outline
 
-    def update(self):
+    def clear(self) -> None:
+        self.count = 0
+
+    def update(self, delta_time: float) -> None:
         """
-        Moves the particle, updates it's time remaining and uses this time remaining to calculate it's size
+        Applies drag, gravity and movement to every particle, shrinks them with their remaining life and removes dead ones
         """
-        drag_factor = 1.0 - commons.DELTA_TIME * 2
+        count = self.count
+        if count == 0:
+            return
+        velocities = self.velocities[:count]
+        velocities *= 1.0 - delta_time * 2
+        velocities[:, 1] += self.gravities[:count] * commons.GRAVITY * delta_time
+        self.previous_positions[:count] = self.positions[:count]
+        self.positions[:count] += velocities * delta_time * commons.BLOCK_SIZE
 
-        self.velocity = (
-            self.velocity[0] * drag_factor,
-            self.velocity[1] * drag_factor + self.gravity * commons.GRAVITY * commons.DELTA_TIME,
-        )
-        self.position = (
-            self.position[0] + self.velocity[0] * commons.DELTA_TIME * commons.BLOCK_SIZE,
-            self.position[1] + self.velocity[1] * commons.DELTA_TIME * commons.BLOCK_SIZE,
-        )
+        lives = self.lives[:count]
+        lives -= delta_time
+        np.multiply(self.init_sizes[:count], lives / self.init_lives[:count], out=self.sizes[:count])
 
-        self.life -= commons.DELTA_TIME  # Change life
+        dead = np.flatnonzero(lives <= 0)
+        if dead.size > 0:
+            self.remove(dead)
 
-        self.size = self.initSize * self.life / self.initLife  # Change size based on life and initial size
+    def remove(self, indices: np.ndarray) -> None:
+        """
+        Removes the particles at the given sorted indices by moving particles from the end of the arrays into their slots
+        """
+        new_count = self.count - indices.size
+        alive = np.ones(self.count, dtype=np.bool_)
+        alive[indices] = False
+        holes = indices[indices < new_count]
+        fillers = np.flatnonzero(alive[new_count:]) + new_count
+        for array in self.get_arrays():
+            array[holes] = array[fillers]
+        self.count = new_count
 
-        if self.life <= 0:  # Remove the particle
-            entity_manager.particles.remove(self)
+    def get_sprite(self, size: int, color: tuple[int, int, int, int], angle_bucket: int) -> pygame.Surface:
+        """
+        Returns a filled square of the given size and color rotated to the given angle bucket, creating it if necessary
+        """
+        key = (size, color, angle_bucket)
+        sprite = self.sprite_cache.get(key)
+        if sprite is None:
+            if len(self.sprite_cache) >= game_constants.PARTICLE_SPRITE_CACHE_SIZE:
+                self.sprite_cache.clear()
+            square = pygame.Surface((size, size), pygame.SRCALPHA)
+            square.fill(color)
+            sprite = pygame.transform.rotate(square, angle_bucket * game_constants.PARTICLE_ANGLE_STEP)
+            self.sprite_cache[key] = sprite
+        return sprite
 
-    def draw(self):
+    def draw(self, surface: pygame.Surface, camera_position: tuple[float, float]) -> None:
         """
-        Draws the particle instance
+        Draws every particle with an optional black outline behind it, between its previous and current position
         """
-        if self.outline:
-            border = pygame.Surface((self.size + 2, self.size + 2), pygame.SRCALPHA)
-            border.fill((0, 0, 0))
-            border = pygame.transform.rotate(border, self.velocity[0] * self.velocity[1] * 10)
-            rect = border.get_rect()
-            rect.center = (
-                self.position[0] - self.size * 0.5 - entity_manager.camera_position[0] + commons.WINDOW_WIDTH * 0.5,
-                self.position[1] - self.size * 0.5 - entity_manager.camera_position[1] + commons.WINDOW_HEIGHT * 0.5,
-            )
-            commons.screen.blit(border, rect)
-        particle = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        particle.fill(self.color)
-        particle = pygame.transform.rotate(particle, self.velocity[0] * self.velocity[1] * 10)
-        rect = particle.get_rect()
-        rect.center = (
-            self.position[0] - self.size * 0.5 - entity_manager.camera_position[0] + commons.WINDOW_WIDTH * 0.5,
-            self.position[1] - self.size * 0.5 - entity_manager.camera_position[1] + commons.WINDOW_HEIGHT * 0.5,
-        )
-        commons.screen.blit(particle, rect)
+        count = self.count
+        if count == 0:
+            return
+        sizes = self.sizes[:count]
+        velocities = self.velocities[:count]
+        # Squares look the same every quarter turn, so only angles within one are bucketed
+        angles = np.mod(velocities[:, 0] * velocities[:, 1] * 10, 90)
+        angle_buckets = (angles / game_constants.PARTICLE_ANGLE_STEP).astype(np.int64).tolist()
+        previous_positions = self.previous_positions[:count]
+        positions = previous_positions + (self.positions[:count] - previous_positions) * commons.INTERPOLATION_ALPHA
+        centers_x = (positions[:, 0] - sizes * 0.5 - camera_position[0] + commons.WINDOW_WIDTH * 0.5).tolist()
+        centers_y = (positions[:, 1] - sizes * 0.5 - camera_position[1] + commons.WINDOW_HEIGHT * 0.5).tolist()
+        sizes = sizes.tolist()
+        colors = [tuple(color) for color in self.colors[:count].tolist()]
+        outlines = self.outlines[:count].tolist()
+
+        blit_sequence = []
+        outline_color = (0, 0, 0, 255)
+        for index in range(count):
+            center = (centers_x[index], centers_y[index])
+            if outlines[index]:
+                border = self.get_sprite(int(sizes[index] + 2), outline_color, angle_buckets[index])
+                blit_sequence.append((border, border.get_rect(center=center)))
+            particle = self.get_sprite(int(sizes[index]), colors[index], angle_buckets[index])
+            blit_sequence.append((particle, particle.get_rect(center=center)))
+        surface.blits(blit_sequence, doreturn=False)
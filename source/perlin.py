@@ -2,6 +2,8 @@ from math import floor, fmod, sqrt
 from random import randint
 from typing import Any
 
+import numpy as np
+
 # 3D Gradient vectors
 _GRAD3 = (
     (1, 1, 0),
@@ -544,6 +546,50 @@ class SimplexNoise(BaseNoise):
 
         return noise * 70.0  # scale noise to [-1, 1]
 
+    def noise2_array(self, x: Any, y: Any) -> np.ndarray:
+        """2D Perlin simplex noise evaluated for whole arrays of coordinates.
+
+        x and y can be any array-likes that broadcast together. Returns a float32
+        array of the broadcast shape holding the same values noise2 would return
+        for each x, y pair.
+        """
+        x, y = np.broadcast_arrays(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+
+        # Skew input space to determine which simplex (triangle) each point is in
+        s = (x + y) * _F2
+        i = np.floor(x + s)
+        j = np.floor(y + s)
+        t = (i + j) * _G2
+        x0 = x - (i - t)  # "Unskewed" distances from cell origin
+        y0 = y - (j - t)
+
+        # Lower triangle, XY order where x0 > y0, otherwise upper triangle, YX order
+        i1 = (x0 > y0).astype(np.int64)
+        j1 = 1 - i1
+
+        x1 = x0 - i1 + _G2  # Offsets for middle corner in (x,y) unskewed coords
+        y1 = y0 - j1 + _G2
+        x2 = x0 + _G2 * 2.0 - 1.0  # Offsets for last corner in (x,y) unskewed coords
+        y2 = y0 + _G2 * 2.0 - 1.0
+
+        # Determine hashed gradient indices of the three simplex corners
+        perm = np.asarray(self.permutation, dtype=np.int64)
+        ii = i.astype(np.int64) % self.period
+        jj = j.astype(np.int64) % self.period
+        gi0 = perm[ii + perm[jj]] % 12
+        gi1 = perm[ii + i1 + perm[jj + j1]] % 12
+        gi2 = perm[ii + 1 + perm[jj + 1]] % 12
+
+        # Calculate the contribution from the three corners
+        grad = np.asarray(_GRAD3, dtype=np.float64)
+        noise = np.zeros(x.shape, dtype=np.float64)
+        for gi, corner_x, corner_y in ((gi0, x0, y0), (gi1, x1, y1), (gi2, x2, y2)):
+            tt = 0.5 - corner_x ** 2 - corner_y ** 2
+            contribution = tt ** 4 * (grad[gi, 0] * corner_x + grad[gi, 1] * corner_y)
+            noise += np.where(tt > 0, contribution, 0.0)
+
+        return (noise * 70.0).astype(np.float32)  # scale noise to [-1, 1]
+
     def noise3(self, x: float, y: float, z: float) -> float:
         """3D Perlin simplex noise.
 
@@ -655,6 +701,80 @@ class SimplexNoise(BaseNoise):
 
         return noise * 32.0
 
+    def noise3_array(self, x: Any, y: Any, z: Any) -> np.ndarray:
+        """3D Perlin simplex noise evaluated for whole arrays of coordinates.
+
+        x, y and z can be any array-likes that broadcast together. Returns a
+        float32 array of the broadcast shape holding the same values noise3
+        would return for each x, y, z triple.
+        """
+        x, y, z = np.broadcast_arrays(
+            np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64), np.asarray(z, dtype=np.float64)
+        )
+
+        # Skew the input space to determine which simplex cell each point is in
+        s = (x + y + z) * _F3
+        i = np.floor(x + s)
+        j = np.floor(y + s)
+        k = np.floor(z + s)
+        t = (i + j + k) * _G3
+        x0 = x - (i - t)  # "Unskewed" distances from cell origin
+        y0 = y - (j - t)
+        z0 = z - (k - t)
+
+        # Determine which of the six tetrahedra each point is in, following the branches of noise3
+        x_ge_y = x0 >= y0
+        y_ge_z = y0 >= z0
+        x_ge_z = x0 >= z0
+        case_a = x_ge_y & y_ge_z
+        case_b = x_ge_y & ~y_ge_z & x_ge_z
+        case_c = x_ge_y & ~y_ge_z & ~x_ge_z
+        case_d = ~x_ge_y & ~y_ge_z
+        case_e = ~x_ge_y & y_ge_z & ~x_ge_z
+        case_f = ~x_ge_y & y_ge_z & x_ge_z
+        i1 = (case_a | case_b).astype(np.int64)
+        j1 = (case_e | case_f).astype(np.int64)
+        k1 = (case_c | case_d).astype(np.int64)
+        i2 = (case_a | case_b | case_c | case_f).astype(np.int64)
+        j2 = (case_a | case_d | case_e | case_f).astype(np.int64)
+        k2 = (case_b | case_c | case_d | case_e).astype(np.int64)
+
+        # Offsets for remaining corners
+        x1 = x0 - i1 + _G3
+        y1 = y0 - j1 + _G3
+        z1 = z0 - k1 + _G3
+        x2 = x0 - i2 + 2.0 * _G3
+        y2 = y0 - j2 + 2.0 * _G3
+        z2 = z0 - k2 + 2.0 * _G3
+        x3 = x0 - 1.0 + 3.0 * _G3
+        y3 = y0 - 1.0 + 3.0 * _G3
+        z3 = z0 - 1.0 + 3.0 * _G3
+
+        # Calculate the hashed gradient indices of the four simplex corners
+        perm = np.asarray(self.permutation, dtype=np.int64)
+        ii = i.astype(np.int64) % self.period
+        jj = j.astype(np.int64) % self.period
+        kk = k.astype(np.int64) % self.period
+        gi0 = perm[ii + perm[jj + perm[kk]]] % 12
+        gi1 = perm[ii + i1 + perm[jj + j1 + perm[kk + k1]]] % 12
+        gi2 = perm[ii + i2 + perm[jj + j2 + perm[kk + k2]]] % 12
+        gi3 = perm[ii + 1 + perm[jj + 1 + perm[kk + 1]]] % 12
+
+        # Calculate the contribution from the four corners
+        grad = np.asarray(_GRAD3, dtype=np.float64)
+        noise = np.zeros(x.shape, dtype=np.float64)
+        for gi, corner_x, corner_y, corner_z in (
+                (gi0, x0, y0, z0),
+                (gi1, x1, y1, z1),
+                (gi2, x2, y2, z2),
+                (gi3, x3, y3, z3),
+        ):
+            tt = 0.6 - corner_x ** 2 - corner_y ** 2 - corner_z ** 2
+            contribution = tt ** 4 * (grad[gi, 0] * corner_x + grad[gi, 1] * corner_y + grad[gi, 2] * corner_z)
+            noise += np.where(tt > 0, contribution, 0.0)
+
+        return (noise * 32.0).astype(np.float32)
+
 
 def lerp(t: float, a: float, b: float) -> float:
     return a + t * (b - a)
@@ -735,3 +855,112 @@ class TileableNoise(BaseNoise):
                 ),
             ),
         )
+
+    def noise3_array(self, x: Any, y: Any, z: Any, repeat: int, base: int = 0) -> np.ndarray:
+        """Tileable 3D noise evaluated for whole arrays of coordinates.
+
+        x, y and z can be any array-likes that broadcast together. Returns a
+        float32 array of the broadcast shape holding the same values noise3
+        would return for each x, y, z triple.
+        """
+        x, y, z = np.broadcast_arrays(
+            np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64), np.asarray(z, dtype=np.float64)
+        )
+        i = np.fmod(np.floor(x), repeat).astype(np.int64)
+        j = np.fmod(np.floor(y), repeat).astype(np.int64)
+        k = np.fmod(np.floor(z), repeat).astype(np.int64)
+        ii = (i + 1) % repeat
+        jj = (j + 1) % repeat
+        kk = (k + 1) % repeat
+        if base:
+            i += base
+            j += base
+            k += base
+            ii += base
+            jj += base
+            kk += base
+
+        x = x - np.floor(x)
+        y = y - np.floor(y)
+        z = z - np.floor(z)
+        fx = x ** 3 * (x * (x * 6 - 15) + 10)
+        fy = y ** 3 * (y * (y * 6 - 15) + 10)
+        fz = z ** 3 * (z * (z * 6 - 15) + 10)
+
+        perm = np.asarray(self.permutation, dtype=np.int64)
+        grad = np.asarray(_GRAD3, dtype=np.float64)
+
+        def grad3_array(hash_values, gx, gy, gz):
+            g = grad[hash_values % 16]
+            return gx * g[..., 0] + gy * g[..., 1] + gz * g[..., 2]
+
+        A = perm[i]
+        AA = perm[A + j]
+        AB = perm[A + jj]
+        B = perm[ii]
+        BA = perm[B + j]
+        BB = perm[B + jj]
+
+        noise = lerp(
+            fz,
+            lerp(
+                fy,
+                lerp(fx, grad3_array(perm[AA + k], x, y, z), grad3_array(perm[BA + k], x - 1, y, z)),
+                lerp(
+                    fx,
+                    grad3_array(perm[AB + k], x, y - 1, z),
+                    grad3_array(perm[BB + k], x - 1, y - 1, z),
+                ),
+            ),
+            lerp(
+                fy,
+                lerp(
+                    fx,
+                    grad3_array(perm[AA + kk], x, y, z - 1),
+                    grad3_array(perm[BA + kk], x - 1, y, z - 1),
+                ),
+                lerp(
+                    fx,
+                    grad3_array(perm[AB + kk], x, y - 1, z - 1),
+                    grad3_array(perm[BB + kk], x - 1, y - 1, z - 1),
+                ),
+            ),
+        )
+        return noise.astype(np.float32)
+
+
+if __name__ == "__main__":
+    # Checks the array variants against the scalar ones and times both: python source/perlin.py
+    from timeit import timeit
+
+    sample_count = 100000
+    rng = np.random.default_rng(0)
+    sample_x, sample_y, sample_z = (rng.uniform(-1000, 1000, sample_count) for _ in range(3))
+    simplex = SimplexNoise()
+    tileable = TileableNoise()
+
+    cases = (
+        (
+            "SimplexNoise.noise2",
+            lambda: [simplex.noise2(*point) for point in zip(sample_x, sample_y)],
+            lambda: simplex.noise2_array(sample_x, sample_y),
+        ),
+        (
+            "SimplexNoise.noise3",
+            lambda: [simplex.noise3(*point) for point in zip(sample_x, sample_y, sample_z)],
+            lambda: simplex.noise3_array(sample_x, sample_y, sample_z),
+        ),
+        (
+            "TileableNoise.noise3",
+            lambda: [tileable.noise3(*point, 64) for point in zip(sample_x, sample_y, sample_z)],
+            lambda: tileable.noise3_array(sample_x, sample_y, sample_z, 64),
+        ),
+    )
+    for name, scalar_function, array_function in cases:
+        max_error = np.abs(np.asarray(scalar_function()) - array_function()).max()
+        scalar_seconds = timeit(scalar_function, number=1)
+        array_seconds = timeit(array_function, number=1)
+        print(
+            f"{name}: {sample_count} samples, scalar {scalar_seconds * 1000:.1f}ms, array {array_seconds * 1000:.1f}ms, "
+            f"{scalar_seconds / array_seconds:.1f}x faster, max error {max_error:.2e}"
+        )
@@ -3,12 +3,12 @@ import random
 
 from pygame.locals import Rect
 
+import collision
 import commons
 import entity_manager
 import game_data
 import item
 import shared_methods
-import world
 from item import Item
 
 
@@ -28,6 +28,8 @@ class PhysicsItem:
         self.item: Item = physics_item
 
         self.position: tuple[float, float] = position
+        # Position before the last simulation tick, for drawing between ticks
+        self.previous_position: tuple[float, float] = position
         self.block_position: tuple[int, int] = (0, 0)
 
         if velocity == (0, 0):
@@ -44,8 +46,6 @@ class PhysicsItem:
         self.half_image_size = 0
         self.render_image()
 
-        self.despawn_check_tick = 60
-
         self.pickup_delay = pickup_delay
         self.grounded = False
 
@@ -67,29 +67,10 @@ class PhysicsItem:
         self.image = self.item.get_image()
         self.half_image_size = self.image.get_width() * 0.5
 
-    def check_despawn(self):
-        """
-        Checks to see if the PhysicsItem is off screen, if it is then remove it from the physics items list
-        """
-        if self.position[0] < entity_manager.get_client_player().position[0] - commons.WINDOW_WIDTH * 0.5:
-            entity_manager.physics_items.remove(self)
-        elif self.position[0] > entity_manager.get_client_player().position[0] + commons.WINDOW_WIDTH * 0.5:
-            entity_manager.physics_items.remove(self)
-        elif self.position[1] < entity_manager.get_client_player().position[1] - commons.WINDOW_HEIGHT * 0.5:
-            entity_manager.physics_items.remove(self)
-        elif self.position[1] > entity_manager.get_client_player().position[1] + commons.WINDOW_HEIGHT * 0.5:
-            entity_manager.physics_items.remove(self)
-
     def update(self):
         """
-        Runs the despawn logic and physics for the PhysicsItem instance
+        Runs the pickup logic and physics for the PhysicsItem instance
         """
-        if self.despawn_check_tick <= 0:
-            self.despawn_check_tick += 10
-            self.check_despawn()
-        else:
-            self.despawn_check_tick -= commons.DELTA_TIME
-
         if not self.stationary:
             if math.sqrt(self.velocity[0] ** 2 + self.velocity[1] ** 2) < 1:
                 self.time_stationary += commons.DELTA_TIME
@@ -148,7 +129,7 @@ class PhysicsItem:
                         assert item_add_data is not None
 
                         if item_add_data[0] == item.ItemSlotClickResult.GAVE_ALL:
-                            entity_manager.physics_items.remove(self)
+                            entity_manager.remove_physics_item(self)
                             entity_manager.add_recent_pickup(
                                 self.item.item_id,
                                 self.item.amount,
@@ -167,62 +148,50 @@ class PhysicsItem:
                 self.pickup_delay -= 1
 
         if collide:
-            for j in range(-2, 3):
-                for i in range(-2, 3):
-                    if world.tile_in_map(self.block_position[1] + j, self.block_position[0] + i):
-                        tile_id = world.world.tile_data[self.block_position[1] + j][self.block_position[0] + i][0]
-                        tile_data = game_data.get_tile_by_id(tile_id)
-                        if commons.TileTag.NO_COLLIDE not in tile_data.tags:
-                            block_rect = Rect(
-                                commons.BLOCK_SIZE * (self.block_position[1] + j),
-                                commons.BLOCK_SIZE * (self.block_position[0] + i),
-                                commons.BLOCK_SIZE,
-                                commons.BLOCK_SIZE,
-                            )
-                            if block_rect.colliderect(self.rect):
-                                delta_x = self.position[0] - block_rect.centerx
-                                delta_y = self.position[1] - block_rect.centery
-                                if abs(delta_x) > abs(delta_y):
-                                    if delta_x > 0:
-                                        self.position = (
-                                            block_rect.right + self.rect.width * 0.5,
-                                            self.position[1],
-                                        )  # Move item right
-                                        self.velocity = (
-                                            0,
-                                            self.velocity[1],
-                                        )  # Stop item horizontally
-                                    else:
-                                        self.position = (
-                                            block_rect.left - self.rect.width * 0.5,
-                                            self.position[1],
-                                        )  # Move item left
-                                        self.velocity = (
-                                            0,
-                                            self.velocity[1],
-                                        )  # Stop item horizontally
-                                else:
-                                    if delta_y > 0:
-                                        if self.velocity[1] < 0:
-                                            self.position = (
-                                                self.position[0],
-                                                block_rect.bottom + self.rect.height * 0.5,
-                                            )  # Move item down
-                                            self.velocity = (
-                                                self.velocity[0],
-                                                0,
-                                            )  # Stop item vertically
-                                    else:
-                                        if self.velocity[1] > 0:
-                                            self.position = (
-                                                self.position[0],
-                                                block_rect.top - self.rect.height * 0.5 + 1,
-                                            )  # Move item up
-                                            self.velocity = (
-                                                self.velocity[0],
-                                                0,
-                                            )  # Stop item vertically
-                                            self.grounded = True
+            for _, _, block_left, block_top in collision.overlapping_solids(*self.rect):
+                delta_x = self.position[0] - (block_left + commons.BLOCK_SIZE // 2)
+                delta_y = self.position[1] - (block_top + commons.BLOCK_SIZE // 2)
+                if abs(delta_x) > abs(delta_y):
+                    if delta_x > 0:
+                        self.position = (
+                            block_left + commons.BLOCK_SIZE + self.rect.width * 0.5,
+                            self.position[1],
+                        )  # Move item right
+                        self.velocity = (
+                            0,
+                            self.velocity[1],
+                        )  # Stop item horizontally
+                    else:
+                        self.position = (
+                            block_left - self.rect.width * 0.5,
+                            self.position[1],
+                        )  # Move item left
+                        self.velocity = (
+                            0,
+                            self.velocity[1],
+                        )  # Stop item horizontally
+                else:
+                    if delta_y > 0:
+                        if self.velocity[1] < 0:
+                            self.position = (
+                                self.position[0],
+                                block_top + commons.BLOCK_SIZE + self.rect.height * 0.5,
+                            )  # Move item down
+                            self.velocity = (
+                                self.velocity[0],
+                                0,
+                            )  # Stop item vertically
+                    else:
+                        if self.velocity[1] > 0:
+                            self.position = (
+                                self.position[0],
+                                block_top - self.rect.height * 0.5 + 1,
+                            )  # Move item up
+                            self.velocity = (
+                                self.velocity[0],
+                                0,
+                            )  # Stop item vertically
+                            self.grounded = True
 
     def draw(self):
         """
@@ -232,6 +201,7 @@ class PhysicsItem:
             velocity_angle = int(max(self.velocity[0], -10) * 50)
         else:
             velocity_angle = int(min(self.velocity[0], 10) * 50)
+        offset = shared_methods.get_interpolation_offset(self.previous_position, self.position)
 
         if not self.stationary or self.rotated_surf is None:
             assert self.image is not None
@@ -240,10 +210,12 @@ class PhysicsItem:
                 self.rotated_surf,
                 (
                     self.rect.centerx
+                    + offset[0]
                     - self.half_image_size
                     - entity_manager.camera_position[0]
                     + commons.WINDOW_WIDTH * 0.5,
                     self.rect.centery
+                    + offset[1]
                     - self.half_image_size
                     - entity_manager.camera_position[1]
                     + commons.WINDOW_HEIGHT * 0.5,
@@ -254,10 +226,12 @@ class PhysicsItem:
                 self.rotated_surf,
                 (
                     self.rect.centerx
+                    + offset[0]
                     - self.half_image_size
                     - entity_manager.camera_position[0]
                     + commons.WINDOW_WIDTH * 0.5,
                     self.rect.centery
+                    + offset[1]
                     - self.half_image_size
                     - entity_manager.camera_position[1]
                     + commons.WINDOW_HEIGHT * 0.5,
@@ -11,6 +11,7 @@ import commons
 import entity_manager
 import game_data
 import item
+import save_index
 import shared_methods
 import tilesets
 import world
@@ -337,6 +338,7 @@ class Player:
     ):
         self.grounded = False
         self.position: tuple[float, float] = position
+        self.previous_position: tuple[float, float] = position  # Position before the last simulation tick, for drawing between ticks
         self.block_position = (0, 0)
         self.model = model
         self.name = name
@@ -349,6 +351,7 @@ class Player:
             ItemLocation.CHEST: [None for _ in range(20)],
             ItemLocation.CRAFTING_MENU: [],
         }
+        self.item_storage = None  # Indexes the hotbar and inventory, created with the components below
 
         self.hotbar_index = 0
 
@@ -441,6 +444,17 @@ class Player:
 
         self.hotbar_image = pygame.Surface((480, 48))
         self.hotbar_image.set_colorkey((255, 0, 255))
+        self.hotbar_image_version = 0  # Increased whenever hotbar_image is drawn to
+
+        # The hotbar with the selected slot highlighted, redrawn when the selection or the hotbar changes
+        self.hotbar_panel = pygame.Surface((480, 48))
+        self.hotbar_panel.set_colorkey((255, 0, 255))
+        self.hotbar_panel_key = None
+
+        # The hp bar and text, redrawn when the hp changes
+        self.hp_bar_image = None
+        self.hp_bar_position = (0, 0)
+        self.hp_bar_key = None
 
         self.inventory_image = pygame.Surface((480, 192))
         self.inventory_image.set_colorkey((255, 0, 255))
@@ -450,8 +464,13 @@ class Player:
 
         self.blit_craft_surf = pygame.Surface((48, 288))
         self.blit_craft_surf.set_colorkey((255, 0, 255))
+        self.blit_craft_surf_key = None
 
-        self.craftable_items_surf = pygame.Surface((48, 0))
+        # How many of each item the hotbar and inventory hold, and what was counted in each of their slots
+        self.owned_item_counts: dict[int, int] = {}
+        self.counted_item_slots: dict[tuple[ItemLocation, int], tuple[int, int]] = {}
+        self.craftable_recipe_ids: set[int] = set()
+        self.crafting_menu_version = 0  # Increased whenever the crafting menu list is rebuilt
 
         self.crafting_menu_offset_y = 120
         self.crafting_menu_offset_velocity_y = 0
@@ -460,13 +479,16 @@ class Player:
         self.chest_open = False
 
         self.old_inventory_positions = []
-        from player_components import PlayerPhysics, PlayerInventory, PlayerCombat, PlayerInteraction, PlayerRenderer
+        from player_components import PlayerPhysics, PlayerInventory, PlayerCombat, PlayerInteraction, PlayerRenderer, ItemStorage
+        self.item_storage = ItemStorage(hotbar, inventory)
         self.physics = PlayerPhysics()
         self.inventory = PlayerInventory()
         self.combat = PlayerCombat()
         self.interaction = PlayerInteraction()
         self.renderer = PlayerRenderer()
 
+        self.count_owned_items()
+
     def update(self):
             return self.physics.update(self)
 
@@ -509,6 +531,9 @@ class Player:
     def remove_item(self, position, remove_count=None):
             return self.inventory.remove_item(self, position, remove_count)
 
+    def set_item(self, location, index, new_item):
+            return self.inventory.set_item(self, location, index, new_item)
+
     def find_existing_item_stacks(self, item_id, search_hotbar=True, search_inventory=True):
             return self.inventory.find_existing_item_stacks(self, item_id, search_hotbar, search_inventory)
 
@@ -530,8 +555,11 @@ class Player:
     def update_craftable_items(self):
             return self.inventory.update_craftable_items(self)
 
-    def render_craftable_items_surf(self):
-            return self.renderer.render_craftable_items_surf(self)
+    def count_owned_items(self):
+            return self.inventory.count_owned_items(self)
+
+    def craft_recipe(self, recipe_id):
+            return self.inventory.craft_recipe(self, recipe_id)
 
     def draw(self):
             return self.renderer.draw(self)
@@ -539,6 +567,12 @@ class Player:
     def draw_hp(self):
             return self.renderer.draw_hp(self)
 
+    def draw_hotbar(self):
+            return self.renderer.draw_hotbar(self)
+
+    def draw_crafting_menu(self):
+            return self.renderer.draw_crafting_menu(self)
+
     def open_chest(self, items):
             return self.inventory.open_chest(self, items)
 
@@ -591,6 +625,7 @@ class Player:
         commons.PLAYER_DATA["creation_date"] = self.creation_date
         commons.PLAYER_DATA["last_played_date"] = self.last_played_date
         pickle.dump(commons.PLAYER_DATA, open(f"assets/players/{self.name}.player", "wb"))  # Save player array
+        save_index.update_player_entry(commons.PLAYER_DATA)
         entity_manager.add_message("Saved Player: " + self.name + "!", pygame.Color(255, 255, 255))
 
     def jump(self):
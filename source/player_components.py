@@ -1,5 +1,8 @@
+import bisect
+
 import pygame
 from pygame.locals import Rect
+import collision
 import commons
 import shared_methods
 import entity_manager
@@ -10,7 +13,7 @@ import world
 import random
 import math
 from item import Item, ItemLocation, ItemSlotClickResult, ItemTag
-from player import Movement
+from player import Movement, get_death_message
 
 class PlayerPhysics:
     def update(self, player):
@@ -136,132 +139,124 @@ class PlayerPhysics:
                         player.grounded = True
                         sync_hitbox_and_block_position()
 
-                for j in range(-2, 3):
-                    for i in range(-2, 3):
-                        if world.tile_in_map(player.block_position[1] + j, player.block_position[0] + i):
-                            if player.block_position[1] + j >= 0:
-                                tile_id = world.world.tile_data[player.block_position[1] + j][player.block_position[0] + i][0]
-                                tile_data = game_data.get_tile_by_id(tile_id)
-                                if commons.TileTag.NO_COLLIDE not in tile_data.tags:
-                                    block_rect = Rect(
-                                        commons.BLOCK_SIZE * (player.block_position[1] + j),
-                                        commons.BLOCK_SIZE * (player.block_position[0] + i),
-                                        commons.BLOCK_SIZE,
-                                        commons.BLOCK_SIZE,
-                                    )
-
-                                    if block_rect.colliderect(
-                                            int(player.rect.left - 1),
-                                            int(player.rect.top + 2),
-                                            1,
-                                            int(player.rect.height - 4),
-                                    ):
-                                        player.stop_left = True  # is there a solid block left
-                                    if block_rect.colliderect(
-                                            int(player.rect.right + 1),
-                                            int(player.rect.top + 2),
-                                            1,
-                                            int(player.rect.height - 4),
+                # Resolving a collision moves the player, so tiles around the hitbox are checked against where it is now
+                for tile_id, flags, block_left, block_top in collision.overlapping_solids(
+                        player.rect.left - commons.BLOCK_SIZE,
+                        player.rect.top - commons.BLOCK_SIZE,
+                        player.rect.width + commons.BLOCK_SIZE * 2,
+                        player.rect.height + commons.BLOCK_SIZE * 2,
+                ):
+                    block_right = block_left + commons.BLOCK_SIZE
+                    block_bottom = block_top + commons.BLOCK_SIZE
+                    probe_top = int(player.rect.top + 2)
+                    probe_height = int(player.rect.height - 4)
+                    if collision.block_overlaps(block_left, block_top, int(player.rect.left - 1), probe_top, 1, probe_height):
+                        player.stop_left = True  # is there a solid block left
+                    if collision.block_overlaps(block_left, block_top, int(player.rect.right + 1), probe_top, 1, probe_height):
+                        player.stop_right = True  # is there a solid block right
+
+                    is_platform = bool(flags & collision.PLATFORM)
+                    if collision.block_overlaps(block_left, block_top, *player.rect):
+                        if not player.invincible and flags & collision.DAMAGING:
+                            tile_data = game_data.get_tile_by_id(tile_id)
+                            player.damage(
+                                tile_data.tile_damage,
+                                (tile_data.tile_damage_name, "World"),
+                            )
+
+                        delta_x = player.position[0] - (block_left + commons.BLOCK_SIZE // 2)
+                        delta_y = player.position[1] - (block_top + commons.BLOCK_SIZE // 2)
+                        if abs(delta_x) > abs(delta_y):
+                            if delta_x > 0:
+                                if not is_platform:
+                                    player.position = (
+                                        block_right + commons.PLAYER_WIDTH * 0.5,
+                                        player.position[1],
+                                    )  # Move player right
+                                    player.velocity = (
+                                        0,
+                                        player.velocity[1],
+                                    )  # Stop player horizontally
+                                    sync_hitbox_and_block_position()
+                            else:
+                                if not is_platform:
+                                    player.position = (
+                                        block_left - commons.PLAYER_WIDTH * 0.5,
+                                        player.position[1],
+                                    )  # Move player left
+                                    player.velocity = (
+                                        0,
+                                        player.velocity[1],
+                                    )  # Stop player horizontally
+                                    sync_hitbox_and_block_position()
+                        else:
+                            if delta_y > 0:
+                                if player.velocity[1] < 0:
+                                    if not is_platform:
+                                        if collision.block_overlaps(
+                                                block_left,
+                                                block_top,
+                                                player.rect.left + 3,
+                                                player.rect.top,
+                                                player.rect.width - 6,
+                                                player.rect.height,
+                                        ):
+                                            player.position = (
+                                                player.position[0],
+                                                block_bottom + commons.PLAYER_HEIGHT * 0.5,
+                                            )  # Move player down
+                                            player.velocity = (
+                                                player.velocity[0],
+                                                0,
+                                            )  # Stop player vertically
+                                            sync_hitbox_and_block_position()
+                            else:
+                                if player.velocity[1] > 0:
+                                    if collision.block_overlaps(
+                                            block_left,
+                                            block_top,
+                                            player.rect.left + 3,
+                                            player.rect.top,
+                                            player.rect.width - 6,
+                                            player.rect.height,
                                     ):
-                                        player.stop_right = True  # is there a solid block right
-
-                                    is_platform = commons.TileTag.PLATFORM in tile_data.tags
-                                    if block_rect.colliderect(player.rect):
-                                        if not player.invincible and commons.TileTag.DAMAGING in tile_data.tags:
-                                            player.damage(
-                                                tile_data.tile_damage,
-                                                (tile_data.tile_damage_name, "World"),
-                                            )
-
-                                        delta_x = player.position[0] - block_rect.centerx
-                                        delta_y = player.position[1] - block_rect.centery
-                                        if abs(delta_x) > abs(delta_y):
-                                            if delta_x > 0:
-                                                if not is_platform:
-                                                    player.position = (
-                                                        block_rect.right + commons.PLAYER_WIDTH * 0.5,
-                                                        player.position[1],
-                                                    )  # Move player right
-                                                    player.velocity = (
-                                                        0,
-                                                        player.velocity[1],
-                                                    )  # Stop player horizontally
-                                                    sync_hitbox_and_block_position()
-                                            else:
-                                                if not is_platform:
-                                                    player.position = (
-                                                        block_rect.left - commons.PLAYER_WIDTH * 0.5,
-                                                        player.position[1],
-                                                    )  # Move player left
-                                                    player.velocity = (
-                                                        0,
-                                                        player.velocity[1],
-                                                    )  # Stop player horizontally
-                                                    sync_hitbox_and_block_position()
-                                        else:
-                                            if delta_y > 0:
-                                                if player.velocity[1] < 0:
-                                                    if not is_platform:
-                                                        if Rect(
-                                                                player.rect.left + 3,
-                                                                player.rect.top,
-                                                                player.rect.width - 6,
-                                                                player.rect.height,
-                                                        ).colliderect(block_rect):
-                                                            player.position = (
-                                                                player.position[0],
-                                                                block_rect.bottom + commons.PLAYER_HEIGHT * 0.5,
-                                                            )  # Move player down
-                                                            player.velocity = (
-                                                                player.velocity[0],
-                                                                0,
-                                                            )  # Stop player vertically
-                                                            sync_hitbox_and_block_position()
-                                            else:
-                                                if player.velocity[1] > 0:
-                                                    if Rect(
-                                                            player.rect.left + 3,
-                                                            player.rect.top,
-                                                            player.rect.width - 6,
-                                                            player.rect.height,
-                                                    ).colliderect(block_rect):
-                                                        should_collide = not is_platform
-                                                        if is_platform:
-                                                            if not player.sprites.moving_down:
-                                                                if player.velocity[1] < 5:
-                                                                    should_collide = (
-                                                                        player.position[1] + commons.BLOCK_SIZE
-                                                                        < block_rect.top
-                                                                    )
-                                                                else:
-                                                                    should_collide = True
-
-                                                        if should_collide:
-                                                            if not fall_damaged:
-                                                                if player.velocity[1] > 58:
-                                                                    damage = int(
-                                                                        (player.velocity[1] - 57) ** 2
-                                                                    )  # Work out fall damage
-                                                                    player.damage(
-                                                                        damage,
-                                                                        (
-                                                                            "falling",
-                                                                            "World",
-                                                                        ),
-                                                                    )  # Apply fall damage once
-                                                                    fall_damaged = True
-                                                            player.last_block_on = int(tile_id)
-                                                            player.moving_down_tick = -1
-                                                            player.position = (
-                                                                player.position[0],
-                                                                block_rect.top - commons.PLAYER_HEIGHT * 0.5 + 1,
-                                                            )  # Move player up
-                                                            player.velocity = (
-                                                                player.velocity[0] * 0.5,
-                                                                0,
-                                                            )  # Slow down player horizontally and stop player vertically
-                                                            player.grounded = True
-                                                            sync_hitbox_and_block_position()
+                                        should_collide = not is_platform
+                                        if is_platform:
+                                            if not player.sprites.moving_down:
+                                                if player.velocity[1] < 5:
+                                                    should_collide = (
+                                                        player.position[1] + commons.BLOCK_SIZE
+                                                        < block_top
+                                                    )
+                                                else:
+                                                    should_collide = True
+
+                                        if should_collide:
+                                            if not fall_damaged:
+                                                if player.velocity[1] > 58:
+                                                    damage = int(
+                                                        (player.velocity[1] - 57) ** 2
+                                                    )  # Work out fall damage
+                                                    player.damage(
+                                                        damage,
+                                                        (
+                                                            "falling",
+                                                            "World",
+                                                        ),
+                                                    )  # Apply fall damage once
+                                                    fall_damaged = True
+                                            player.last_block_on = int(tile_id)
+                                            player.moving_down_tick = -1
+                                            player.position = (
+                                                player.position[0],
+                                                block_top - commons.PLAYER_HEIGHT * 0.5 + 1,
+                                            )  # Move player up
+                                            player.velocity = (
+                                                player.velocity[0] * 0.5,
+                                                0,
+                                            )  # Slow down player horizontally and stop player vertically
+                                            player.grounded = True
+                                            sync_hitbox_and_block_position()
 
             if player.stop_moving_down:
                 if player.moving_down_tick < 0:
@@ -320,7 +315,7 @@ class PlayerInventory:
                         if amount > 0:
                             player.items[existing_slots[0][0]][existing_slots[0][1]].amount = amount
                         else:
-                            player.items[existing_slots[0][0]][existing_slots[0][1]] = None
+                            player.set_item(existing_slots[0][0], existing_slots[0][1], None)
                         player.give_item(Item(current_item.item_id + 1))
                         amount = 0
 
@@ -332,24 +327,23 @@ class PlayerInventory:
                 existing_slots.pop(0)
 
             # Free slots
-            free_slots = player.find_free_spaces(current_item.json_item.max_stack)
+            free_slot = player.item_storage.get_first_free_slot()
 
-            while len(free_slots) > 0 and amount > 0:  # No stacks left to fill so fill empty slots
+            while free_slot is not None and amount > 0:  # No stacks left to fill so fill empty slots
                 # Work out how many to add to the stack
-                fill_count = free_slots[0][2]
+                fill_count = current_item.json_item.max_stack
                 amount -= fill_count
                 if amount < 0:
                     fill_count += amount
 
                 # Add that number to the free slot
-                player.items[free_slots[0][0]][free_slots[0][1]] = current_item.copy(new_amount=fill_count)
+                player.set_item(free_slot[0], free_slot[1], current_item.copy(new_amount=fill_count))
 
                 # Flag the position for a surface update
-                dat = [free_slots[0][0], free_slots[0][1]]
+                dat = [free_slot[0], free_slot[1]]
                 if dat not in player.old_inventory_positions:
                     player.old_inventory_positions.append(dat)
-                # Remove the used data
-                free_slots.remove(free_slots[0])
+                free_slot = player.item_storage.get_first_free_slot()
 
             if amount <= 0:
                 return [ItemSlotClickResult.GAVE_ALL]
@@ -362,7 +356,7 @@ class PlayerInventory:
         else:
             # Slot is free, add
             if player.items[position[0]][position[1]] is None:
-                player.items[position[0]][position[1]] = current_item.copy(new_amount=amount)
+                player.set_item(position[0], position[1], current_item.copy(new_amount=amount))
                 return [ItemSlotClickResult.GAVE_ALL]
 
             # Slot has an item with the same ID
@@ -404,11 +398,11 @@ class PlayerInventory:
         current_item = player.items[position[0]][position[1]]
         if current_item is not None:
             if remove_count is None:
-                player.items[position[0]][position[1]] = None
+                player.set_item(position[0], position[1], None)
             else:
                 player.items[position[0]][position[1]].amount -= remove_count
                 if player.items[position[0]][position[1]].amount <= 0:
-                    player.items[position[0]][position[1]] = None
+                    player.set_item(position[0], position[1], None)
 
             if position not in player.old_inventory_positions:
                 player.old_inventory_positions.append(position)
@@ -419,6 +413,15 @@ class PlayerInventory:
                 return current_item.copy(new_amount=remove_count)
         return None
 
+    def set_item(self, player, location, index, new_item):
+        """
+        Puts an item, or None, in a slot, keeping the hotbar and inventory index up to date
+        """
+        if location in player.item_storage:
+            player.item_storage.set_item(location, index, new_item)
+        else:
+            player.items[location][index] = new_item
+
     def find_existing_item_stacks(self, player, item_id, search_hotbar=True, search_inventory=True):
         """
         Finds any occurrences of an item in the player's inventory or hotbar
@@ -427,22 +430,13 @@ class PlayerInventory:
         existing_spaces = []
         item_data = game_data.get_item_by_id(item_id)
 
-        if search_hotbar:
-            for hotbar_index in range(len(player.items[ItemLocation.HOTBAR])):
-                current_item = player.items[ItemLocation.HOTBAR][hotbar_index]
-                if current_item is not None:
-                    if current_item.item_id == item_id:
-                        available = item_data.max_stack - player.items[ItemLocation.HOTBAR][hotbar_index].amount
-                        existing_spaces.append([ItemLocation.HOTBAR, hotbar_index, available])
-
-        if search_inventory:
-            for inventory_index in range(len(player.items[ItemLocation.INVENTORY])):
-                current_item = player.items[ItemLocation.INVENTORY][inventory_index]
-                if current_item is not None:
-                    if current_item.item_id == item_id:
-                        available = item_data.max_stack - player.items[ItemLocation.INVENTORY][inventory_index].amount
-                        if available > 0:
-                            existing_spaces.append([ItemLocation.INVENTORY, inventory_index, available])
+        for location, index in player.item_storage.get_item_slots(item_id):
+            available = item_data.max_stack - player.items[location][index].amount
+            if location == ItemLocation.HOTBAR:
+                if search_hotbar:
+                    existing_spaces.append([location, index, available])
+            elif search_inventory and available > 0:
+                existing_spaces.append([location, index, available])
 
         return existing_spaces
 
@@ -451,24 +445,21 @@ class PlayerInventory:
         Finds any free spaces in the player's inventory or hotbar
         """
         free_spaces = []
-
-        if search_hotbar:
-            for hotbar_index in range(len(player.items[ItemLocation.HOTBAR])):
-                if player.items[ItemLocation.HOTBAR][hotbar_index] is None:
-                    free_spaces.append([ItemLocation.HOTBAR, hotbar_index, max_stack])
-
-        if search_inventory:
-            for inventory_index in range(len(player.items[ItemLocation.INVENTORY])):
-                if player.items[ItemLocation.INVENTORY][inventory_index] is None:
-                    free_spaces.append([ItemLocation.INVENTORY, inventory_index, max_stack])
-
+        for location, index in player.item_storage.get_free_slots():
+            searched = search_hotbar if location == ItemLocation.HOTBAR else search_inventory
+            if searched:
+                free_spaces.append([location, index, max_stack])
         return free_spaces
 
     def update_inventory_old_slots(self, player):
         """
         Uses a list of outdated positions in the hotbar, inventory, or an open chest to update the respective area's surfaces
+        and the recipes the player can craft
         """
+        changed_item_ids = set()
         for data in player.old_inventory_positions:
+            if data[0] == ItemLocation.HOTBAR or data[0] == ItemLocation.INVENTORY:
+                changed_item_ids.update(self.count_owned_item_slot(player, data[0], data[1]))
             if data[0] == ItemLocation.HOTBAR:
                 current_item = player.items[ItemLocation.HOTBAR][data[1]]
                 player.hotbar_image.blit(tilesets.misc_gui[0], (data[1] * 48, 0))
@@ -487,6 +478,7 @@ class PlayerInventory:
                             ),
                             (24 + 48 * data[1], 30),
                         )
+                player.hotbar_image_version += 1
             elif data[0] == ItemLocation.INVENTORY:
                 current_item = player.items[ItemLocation.INVENTORY][data[1]]
                 slot_x = data[1] % 10
@@ -529,12 +521,104 @@ class PlayerInventory:
                             (24 + 48 * slot_x, 30 + 48 * slot_y),
                         )
         player.old_inventory_positions = []
+        if len(changed_item_ids) > 0:
+            self.update_craftable_recipes(player, changed_item_ids)
+
+    def count_owned_item_slot(self, player, location, index) -> tuple[int, ...]:
+        """
+        Moves the amount counted for a hotbar or inventory slot to what is in it now, returning the ids of the items whose
+        owned amount changed
+        """
+        current_item = player.items[location][index]
+        new_contents = None if current_item is None else (current_item.item_id, current_item.amount)
+        old_contents = player.counted_item_slots.get((location, index))
+        if new_contents == old_contents:
+            return ()
+        if old_contents is not None:
+            player.owned_item_counts[old_contents[0]] -= old_contents[1]
+        if new_contents is not None:
+            player.owned_item_counts[new_contents[0]] = player.owned_item_counts.get(new_contents[0], 0) + new_contents[1]
+            player.counted_item_slots[(location, index)] = new_contents
+        else:
+            del player.counted_item_slots[(location, index)]
+        if old_contents is None:
+            return (new_contents[0],)
+        if new_contents is None or new_contents[0] == old_contents[0]:
+            return (old_contents[0],)
+        return old_contents[0], new_contents[0]
+
+    def count_owned_items(self, player):
+        """
+        Counts every item in the hotbar and inventory from scratch and works out every recipe the player can craft
+        """
+        player.owned_item_counts = {}
+        player.counted_item_slots = {}
+        for location in (ItemLocation.HOTBAR, ItemLocation.INVENTORY):
+            for index in range(len(player.items[location])):
+                self.count_owned_item_slot(player, location, index)
+        player.craftable_recipe_ids = set()
+        self.update_craftable_recipes(player, list(player.owned_item_counts))
+        self.update_craftable_items(player)
+
+    def can_craft_recipe(self, player, recipe_id) -> bool:
+        for ingredient_item_id, amount in game_data.get_recipe_ingredient_ids(recipe_id):
+            if player.owned_item_counts.get(ingredient_item_id, 0) < amount:
+                return False
+        return True
+
+    def update_craftable_recipes(self, player, changed_item_ids):
+        """
+        Checks again only the recipes that use the items whose owned amount changed, updating the crafting menu if the
+        set of craftable recipes changed
+        """
+        changed = False
+        for item_id in changed_item_ids:
+            for recipe_id in game_data.get_recipes_using_item(item_id):
+                craftable = self.can_craft_recipe(player, recipe_id)
+                if craftable != (recipe_id in player.craftable_recipe_ids):
+                    changed = True
+                    if craftable:
+                        player.craftable_recipe_ids.add(recipe_id)
+                    else:
+                        player.craftable_recipe_ids.remove(recipe_id)
+        if changed:
+            self.update_craftable_items(player)
 
     def update_craftable_items(self, player):
         """
-        Creates a list of items that can be crafted with the current materials List structure [item_id, amount]
+        Creates a list of items that can be crafted with the current materials List structure [item_id, amount, recipe_id],
+        in creative mode every item is listed without a recipe
+        """
+        if commons.CREATIVE:
+            player.items[ItemLocation.CRAFTING_MENU] = [[i + 1, 1, None] for i in range(len(game_data.json_item_data) - 1)]
+        else:
+            player.items[ItemLocation.CRAFTING_MENU] = []
+            for recipe_id in sorted(player.craftable_recipe_ids):
+                recipe_data = game_data.get_recipe_by_id(recipe_id)
+                player.items[ItemLocation.CRAFTING_MENU].append(
+                    [game_data.get_item_id_by_id_str(recipe_data.item_id_str), recipe_data.amount, recipe_id]
+                )
+        player.crafting_menu_version += 1
+
+    def craft_recipe(self, player, recipe_id) -> bool:
+        """
+        Takes the ingredients of a recipe out of the hotbar and inventory, returning False if the player does not have them
         """
-        player.items[ItemLocation.CRAFTING_MENU] = [[i + 1, 1] for i in range(len(game_data.json_item_data) - 1)]
+        if recipe_id is None:
+            return True
+        if not self.can_craft_recipe(player, recipe_id):
+            return False
+        for ingredient_item_id, amount in game_data.get_recipe_ingredient_ids(recipe_id):
+            for location in (ItemLocation.HOTBAR, ItemLocation.INVENTORY):
+                for index in range(len(player.items[location])):
+                    current_item = player.items[location][index]
+                    if amount > 0 and current_item is not None and current_item.item_id == ingredient_item_id:
+                        remove_count = min(amount, current_item.amount)
+                        player.remove_item([location, index], remove_count)
+                        amount -= remove_count
+        # Count the removed ingredients straight away so the recipe cannot be crafted twice before the next update
+        player.update_inventory_old_slots()
+        return True
 
     def open_chest(self, player, items):
         """
@@ -546,13 +630,12 @@ class PlayerInventory:
         player.inventory_open = True
         player.items[ItemLocation.CHEST] = items
         player.crafting_menu_offset_y = 120
-        player.update_craftable_items()
-        player.render_craftable_items_surf()
         player.render_chest()
 
 class PlayerCombat:
     def damage(
             self,
+            player,
             value: int,
             source_name: tuple[str, str],
             knockback: int = 0,
@@ -746,27 +829,22 @@ class PlayerInteraction:
                     or commons.CREATIVE
             ):
                 block_position = commons.HOVERED_TILE
-                tile_dat = world.world.tile_data[block_position[0]][block_position[1]]
-                json_tile_data = game_data.get_tile_by_id(tile_dat[0])
+                json_tile_data = game_data.get_tile_by_id(
+                    world.world.tile_grid.get_tile(block_position[0], block_position[1])
+                )
                 if (
                         commons.TileTag.CHEST in json_tile_data.tags
                         or commons.TileTag.CYCLABLE in json_tile_data.tags
                 ):
                     if commons.TileTag.MULTI_TILE in json_tile_data.tags:
-                        origin = (
-                            block_position[0] - tile_dat[2][0],
-                            block_position[1] - tile_dat[2][1],
-                        )
+                        origin = world.get_multitile_origin(block_position[0], block_position[1])
                     else:
                         origin = block_position
                     world.use_special_tile(origin[0], origin[1])
 
                 if commons.TileTag.WORKBENCH in json_tile_data.tags:
                     if commons.TileTag.MULTI_TILE in json_tile_data.tags:
-                        origin = (
-                            block_position[0] - tile_dat[2][0],
-                            block_position[1] - tile_dat[2][1],
-                        )
+                        origin = world.get_multitile_origin(block_position[0], block_position[1])
                     else:
                         origin = block_position
                     world.use_special_tile(origin[0], origin[1])
@@ -804,7 +882,7 @@ class PlayerInteraction:
                             for x in range(tile_dimensions[0]):
                                 for y in range(tile_dimensions[1]):
                                     if (
-                                            not world.world.tile_data[block_position[0] + x][block_position[1] + y][0]
+                                            not world.world.tile_grid.get_tile(block_position[0] + x, block_position[1] + y)
                                                 == game_data.air_tile_id
                                     ):
                                         can_place = False
@@ -812,9 +890,10 @@ class PlayerInteraction:
                             required_solids = tile_to_place.multitile_required_solids
 
                             for i in range(len(required_solids)):
-                                tile_id = world.world.tile_data[block_position[0] + required_solids[i][0]][
-                                    block_position[1] + required_solids[i][1]
-                                    ][0]
+                                tile_id = world.world.tile_grid.get_tile(
+                                    block_position[0] + required_solids[i][0],
+                                    block_position[1] + required_solids[i][1],
+                                )
                                 tile_data = game_data.get_tile_by_id(tile_id)
                                 if commons.TileTag.NO_COLLIDE in tile_data.tags:
                                     can_place = False
@@ -836,19 +915,21 @@ class PlayerInteraction:
                                 game_data.play_tile_place_sfx(tile_to_place.id)
 
                         else:
-                            if world.world.tile_data[block_position[0]][block_position[1]][0] == game_data.air_tile_id:
+                            if world.world.tile_grid.get_tile(block_position[0], block_position[1]) == game_data.air_tile_id:
                                 if world.get_neighbor_count(block_position[0], block_position[1]) > 0:
-                                    world.world.tile_data[block_position[0]][block_position[1]][0] = tile_to_place.id
+                                    world.world.tile_grid.set_tile(block_position[0], block_position[1], tile_to_place.id)
 
                                     if world.tile_in_map(block_position[0], block_position[1] + 1):
                                         if (
                                                 game_data.get_tile_by_id(
-                                                    world.world.tile_data[block_position[0]][block_position[1]][0]
+                                                    world.world.tile_grid.get_tile(block_position[0], block_position[1])
                                                 ).id_str
                                                 == "tile.grass"
                                         ):
-                                            world.world.tile_data[block_position[0]][block_position[1]][0] = (
-                                                game_data.get_tile_id_by_id_str("tile.dirt")
+                                            world.world.tile_grid.set_tile(
+                                                block_position[0],
+                                                block_position[1],
+                                                game_data.get_tile_id_by_id_str("tile.dirt"),
                                             )
 
                                     world.update_terrain_surface(block_position[0], block_position[1])
@@ -856,13 +937,11 @@ class PlayerInteraction:
                                     game_data.play_tile_place_sfx(tile_to_place.id)
                                     block_placed = True
                     else:
-                        if world.world.tile_data[block_position[0]][block_position[1]][1] == game_data.air_wall_id:
+                        if world.world.tile_grid.get_wall(block_position[0], block_position[1]) == game_data.air_wall_id:
                             if world.get_neighbor_count(block_position[0], block_position[1], tile=1) > 0:
                                 wall_to_place = game_data.get_wall_by_id_str(block_item.get_wall_id_str())
 
-                                world.world.tile_data[block_position[0]][block_position[1]][1] = int(
-                                    wall_to_place.id
-                                )
+                                world.world.tile_grid.set_wall(block_position[0], block_position[1], wall_to_place.id)
                                 world.update_terrain_surface(block_position[0], block_position[1])
 
                                 game_data.play_wall_place_sfx(wall_to_place.id)
@@ -884,7 +963,7 @@ class PlayerInteraction:
                                 if dat not in player.old_inventory_positions:
                                     player.old_inventory_positions.append(dat)
                                 if player.items[ItemLocation.HOTBAR][player.hotbar_index].amount <= 0:
-                                    player.items[ItemLocation.HOTBAR][player.hotbar_index] = None
+                                    player.set_item(ItemLocation.HOTBAR, player.hotbar_index, None)
                             else:
                                 commons.WAIT_TO_USE = True
                                 assert item.item_holding is not None
@@ -919,7 +998,7 @@ class PlayerInteraction:
                 block_position = commons.HOVERED_TILE
                 if world.tile_in_map(block_position[0], block_position[1]):
                     if tool_item.has_tag(ItemTag.PICKAXE):
-                        tile_id = world.world.tile_data[block_position[0]][block_position[1]][0]
+                        tile_id = world.world.tile_grid.get_tile(block_position[0], block_position[1])
                         tile_dat = game_data.get_tile_by_id(tile_id)
                         if commons.TileTag.MULTI_TILE in tile_dat.tags:
                             multitile_origin = world.get_multitile_origin(block_position[0], block_position[1])
@@ -930,13 +1009,15 @@ class PlayerInteraction:
                                 item_id = game_data.get_item_id_by_id_str(tile_dat.item_id_str)
                                 # Remove Grass from    dirt
                                 if tile_id == game_data.grass_tile_id:
-                                    world.world.tile_data[block_position[0]][block_position[1]][0] = (
-                                        game_data.get_tile_id_by_id_str("tile.dirt")
+                                    world.world.tile_grid.set_tile(
+                                        block_position[0],
+                                        block_position[1],
+                                        game_data.get_tile_id_by_id_str("tile.dirt"),
                                     )
                                 else:
-                                    world.world.tile_data[block_position[0]][block_position[1]][
-                                        0
-                                    ] = game_data.air_tile_id
+                                    world.world.tile_grid.set_tile(
+                                        block_position[0], block_position[1], game_data.air_tile_id
+                                    )
 
                                     entity_manager.spawn_physics_item(
                                         Item(item_id),
@@ -964,7 +1045,7 @@ class PlayerInteraction:
                                         )
 
                     elif tool_item.has_tag(ItemTag.HAMMER):
-                        wall_id = world.world.tile_data[block_position[0]][block_position[1]][1]
+                        wall_id = world.world.tile_grid.get_wall(block_position[0], block_position[1])
                         if wall_id != game_data.air_wall_id:
                             if (
                                     world.get_neighbor_count(
@@ -988,7 +1069,7 @@ class PlayerInteraction:
                                     pickup_delay=10,
                                 )
 
-                                world.world.tile_data[block_position[0]][block_position[1]][1] = game_data.air_wall_id
+                                world.world.tile_grid.set_wall(block_position[0], block_position[1], game_data.air_wall_id)
 
                                 world.update_terrain_surface(block_position[0], block_position[1])
 
@@ -1135,6 +1216,7 @@ class PlayerRenderer:
         Fully renders the player's hotbar to the hotbar_image surface, including all the items in the hotbar
         """
         player.hotbar_image.fill((255, 0, 255))
+        player.hotbar_image_version += 1
         for hotbar_index in range(len(player.items[ItemLocation.HOTBAR])):
             player.hotbar_image.blit(tilesets.misc_gui[0], (48 * hotbar_index, 0))
             current_item = player.items[ItemLocation.HOTBAR][hotbar_index]
@@ -1212,32 +1294,6 @@ class PlayerRenderer:
                         (24 + 48 * slot_x, 30 + 48 * slot_y),
                     )
 
-    def render_craftable_items_surf(self, player):
-        """
-        Uses the craftable_items list to create a surface that displays all the items the player can craft
-        """
-        player.craftable_items_surf = pygame.Surface((48, len(player.items[ItemLocation.CRAFTING_MENU]) * 48))
-        player.craftable_items_surf.fill((255, 0, 255))
-        for i in range(len(player.items[ItemLocation.CRAFTING_MENU])):
-            player.craftable_items_surf.blit(tilesets.misc_gui[0], (0, i * 48))
-            item_data = game_data.json_item_data[player.items[ItemLocation.CRAFTING_MENU][i][0]]
-            image = item_data.surface
-            if max(image.get_width(), image.get_height()) > 32:
-                image = pygame.transform.scale(
-                    image,
-                    (
-                        image.get_width() * 32 / max(image.get_width(), image.get_height()),
-                        image.get_height() * 32 / max(image.get_width(), image.get_height()),
-                    ),
-                )
-            player.craftable_items_surf.blit(
-                image,
-                (
-                    int(24 - image.get_width() * 0.5),
-                    int(24 - image.get_height() * 0.5) + i * 48,
-                ),
-            )
-
     def draw(self, player):
         """
         Uses various player variables to draw the player in the world
@@ -1320,7 +1376,7 @@ class PlayerRenderer:
                         )
 
                     # Probably should be in update
-                    for enemy in entity_manager.enemies:
+                    for enemy in entity_manager.enemy_grid.query_rect(hit_rect):
                         if enemy.rect.colliderect(hit_rect):
                             if enemy.game_id not in player.enemies_hit:
                                 if player.direction == 0:
@@ -1439,7 +1495,7 @@ class PlayerRenderer:
                         )
 
                     # Probably should be in update
-                    for enemy in entity_manager.enemies:
+                    for enemy in entity_manager.enemy_grid.query_rect(hit_rect):
                         if enemy.rect.colliderect(hit_rect):
                             if enemy.game_id not in player.enemies_hit:
                                 if player.direction == 0:
@@ -1533,25 +1589,128 @@ class PlayerRenderer:
                     1,
                 )
 
+    def render_hp_bar(self, player):
+        """
+        Renders the player's hp bar and the hp text below it to the hp_bar_image surface
+        """
+        rect = Rect(commons.WINDOW_WIDTH - 10 - player.hp * 2, 25, player.hp * 2, 20)
+        text_position = (int(player.hp_x_position), 45)
+        left = min(rect.left, text_position[0])
+        right = max(rect.right, text_position[0] + player.hp_text.get_width())
+        bottom = max(rect.bottom, text_position[1] + player.hp_text.get_height())
+        player.hp_bar_position = (left, rect.top)
+        player.hp_bar_image = pygame.Surface((right - left, bottom - rect.top), pygame.SRCALPHA)
+
+        hp_float = player.hp / player.max_hp
+        col: tuple[int, int, int] = (
+            int((1 - hp_float) * 255),
+            int(hp_float * 255),
+            0,
+        )
+        rect.move_ip(-left, -rect.top)
+        pygame.draw.rect(player.hp_bar_image, col, rect, 0)
+        pygame.draw.rect(player.hp_bar_image, (int(col[0] * 0.8), int(col[1] * 0.8), 0), rect, 3)
+        player.hp_bar_image.blit(player.hp_text, (text_position[0] - left, text_position[1] - player.hp_bar_position[1]))
+
     def draw_hp(self, player):
         """
         Draws the player's health in the top right
         """
         if player.hp > 0:
-            rect = Rect(commons.WINDOW_WIDTH - 10 - player.hp * 2, 25, player.hp * 2, 20)
-            hp_float = player.hp / player.max_hp
-            col: tuple[int, int, int] = (
-                int((1 - hp_float) * 255),
-                int(hp_float * 255),
-                0,
-            )
-            pygame.draw.rect(commons.screen, col, rect, 0)
-            pygame.draw.rect(commons.screen, (int(col[0] * 0.8), int(col[1] * 0.8), 0), rect, 3)
-            commons.screen.blit(player.hp_text, (player.hp_x_position, 45))
+            key = (player.hp, player.max_hp, player.hp_text, commons.WINDOW_WIDTH)
+            if player.hp_bar_key != key:
+                player.hp_bar_key = key
+                self.render_hp_bar(player)
+            commons.screen.blit(player.hp_bar_image, player.hp_bar_position)
+
+    def draw_hotbar(self, player):
+        """
+        Draws the hotbar with the selected slot highlighted in the top left
+        """
+        key = (player.hotbar_index, player.hotbar_image_version)
+        if player.hotbar_panel_key != key:
+            player.hotbar_panel_key = key
+            player.hotbar_panel.fill((255, 0, 255))
+            player.hotbar_panel.blit(player.hotbar_image, (0, 0))
+            pygame.draw.rect(player.hotbar_panel, (230, 230, 10), Rect(player.hotbar_index * 48, 0, 48, 48), 3)
+        commons.screen.blit(player.hotbar_panel, (5, 20))
+
+    def draw_crafting_menu(self, player):
+        """
+        Draws the craftable items that are scrolled into view below the inventory, only rendering the visible rows
+        """
+        key = (player.crafting_menu_version, player.crafting_menu_offset_y)
+        if player.blit_craft_surf_key != key:
+            player.blit_craft_surf_key = key
+            player.blit_craft_surf.fill((255, 0, 255))
+            crafting_menu = player.items[ItemLocation.CRAFTING_MENU]
+            offset_y = int(player.crafting_menu_offset_y)
+            first_row = max(0, -offset_y // 48)
+            last_row = min(len(crafting_menu) - 1, (player.blit_craft_surf.get_height() - offset_y) // 48)
+            for row in range(first_row, last_row + 1):
+                row_y = offset_y + row * 48
+                image = item.get_resized_item_image(crafting_menu[row][0])
+                player.blit_craft_surf.blit(tilesets.misc_gui[0], (0, row_y))
+                player.blit_craft_surf.blit(
+                    image,
+                    (int(24 - image.get_width() * 0.5), int(24 - image.get_height() * 0.5) + row_y),
+                )
+        commons.screen.blit(player.blit_craft_surf, (5, 270))
 
 class ItemStorage:
+    """
+    Holds the hotbar and inventory, keeping the slots every item id is in and the free slots indexed so stacks and
+    free space can be found without scanning every slot. Slots have to be changed through set_item to stay indexed
+    """
+
     def __init__(self, hotbar=None, inventory=None):
         self.hotbar: list[None] | list[Item] = hotbar
         self.inventory: list[None] | list[Item] = inventory
-        self.chest: list[None] | list[Item] = [None for _ in range(20)]
-        self.crafting_menu: list[None] | list[Item] = []
+        self.slots: dict[ItemLocation, list[None] | list[Item]] = {
+            ItemLocation.HOTBAR: hotbar,
+            ItemLocation.INVENTORY: inventory,
+        }
+        # Slots are stored as (location value, index) so they sort with the hotbar first, like a scan would find them
+        self.item_slots: dict[int, list[tuple[int, int]]] = {}
+        self.free_slots: list[tuple[int, int]] = []
+        for location, items in self.slots.items():
+            for index in range(len(items)):
+                self.add_to_index(items[index], (location.value, index))
+
+    def __contains__(self, location: ItemLocation) -> bool:
+        return location in self.slots
+
+    def add_to_index(self, current_item: Item | None, slot: tuple[int, int]) -> None:
+        if current_item is None:
+            bisect.insort(self.free_slots, slot)
+        else:
+            bisect.insort(self.item_slots.setdefault(current_item.item_id, []), slot)
+
+    def remove_from_index(self, current_item: Item | None, slot: tuple[int, int]) -> None:
+        slots = self.free_slots if current_item is None else self.item_slots[current_item.item_id]
+        del slots[bisect.bisect_left(slots, slot)]
+        if current_item is not None and len(slots) == 0:
+            del self.item_slots[current_item.item_id]
+
+    def set_item(self, location: ItemLocation, index: int, new_item: Item | None) -> None:
+        slot = (location.value, index)
+        self.remove_from_index(self.slots[location][index], slot)
+        self.slots[location][index] = new_item
+        self.add_to_index(new_item, slot)
+
+    def get_item_slots(self, item_id: int) -> list[tuple[ItemLocation, int]]:
+        """
+        Returns the slots holding the item, hotbar first and in slot order
+        """
+        return [(ItemLocation(location_value), index) for location_value, index in self.item_slots.get(item_id, [])]
+
+    def get_free_slots(self) -> list[tuple[ItemLocation, int]]:
+        """
+        Returns the empty slots, hotbar first and in slot order
+        """
+        return [(ItemLocation(location_value), index) for location_value, index in self.free_slots]
+
+    def get_first_free_slot(self) -> tuple[ItemLocation, int] | None:
+        if len(self.free_slots) == 0:
+            return None
+        return ItemLocation(self.free_slots[0][0]), self.free_slots[0][1]
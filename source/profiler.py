@@ -0,0 +1,160 @@
+"""
+Per-subsystem timings of the game loop.
+
+Every timed section keeps a rolling window of its durations for the overlay and adds an event to a bounded trace
+that can be written out in the Chrome trace format and opened in chrome://tracing or Perfetto.
+"""
+import collections
+import contextlib
+import datetime
+import json
+import os
+import threading
+import time
+
+import numpy as np
+import pygame
+
+import commons
+import game_constants
+import shared_methods
+
+overlay_visible = False
+
+# Rolling window of durations in seconds for every section name, in the order the sections were first seen
+section_samples: dict[str, collections.deque] = {}
+
+# (name, start, duration, thread id) of the most recent timed sections, oldest first
+trace_events: collections.deque = collections.deque(maxlen=game_constants.PROFILER_TRACE_EVENT_LIMIT)
+trace_start_time = time.perf_counter()
+
+overlay_rows: list[list[pygame.Surface]] = []
+overlay_update_tick = 0.0
+
+
+@contextlib.contextmanager
+def section(name: str):
+    """
+    Times the code inside the with block under the given name
+    """
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start_time
+        samples = section_samples.get(name)
+        if samples is None:
+            samples = collections.deque(maxlen=game_constants.PROFILER_WINDOW_SIZE)
+            section_samples[name] = samples
+        samples.append(duration)
+        trace_events.append((name, start_time, duration, threading.get_ident()))
+
+
+def get_section_stats() -> dict[str, dict[str, float]]:
+    """
+    Returns the mean, median, 95th and 99th percentile and worst duration in milliseconds of every section's window
+    """
+    stats = {}
+    for name, samples in list(section_samples.items()):
+        if len(samples) == 0:
+            continue
+        durations = np.array(samples) * 1000
+        p50, p95, p99 = np.percentile(durations, (50, 95, 99))
+        stats[name] = {
+            "mean": float(durations.mean()),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+            "max": float(durations.max()),
+        }
+    return stats
+
+
+def toggle_overlay() -> None:
+    global overlay_visible, overlay_update_tick
+    overlay_visible = not overlay_visible
+    overlay_update_tick = 0.0
+
+
+def render_overlay_rows() -> None:
+    global overlay_rows
+    rows = [["section", "mean", "p50", "p95", "p99", "max ms"]]
+    for name, section_stats in get_section_stats().items():
+        rows.append([name] + [f"{section_stats[key]:.2f}" for key in ("mean", "p50", "p95", "p99", "max")])
+    overlay_rows = [
+        [shared_methods.outline_text(cell, pygame.Color(255, 255, 255), commons.SMALL_FONT) for cell in row]
+        for row in rows
+    ]
+
+
+def draw_overlay(surface: pygame.Surface) -> None:
+    """
+    Draws the section table below the hp bar, only re-rendering the text every few frames
+    """
+    global overlay_update_tick
+    if not overlay_visible:
+        return
+    if overlay_update_tick <= 0:
+        overlay_update_tick += game_constants.PROFILER_OVERLAY_UPDATE_INTERVAL
+        render_overlay_rows()
+    else:
+        overlay_update_tick -= commons.DELTA_TIME
+
+    column_widths = [
+        max(row[column].get_width() for row in overlay_rows) + game_constants.PROFILER_OVERLAY_COLUMN_SPACING
+        for column in range(len(overlay_rows[0]))
+    ]
+    row_height = overlay_rows[0][0].get_height()
+    width = sum(column_widths)
+    left = commons.WINDOW_WIDTH - width - 5
+    top = game_constants.PROFILER_OVERLAY_TOP
+    background = pygame.Surface((width + 10, row_height * len(overlay_rows) + 10), pygame.SRCALPHA)
+    background.fill((0, 0, 0, 150))
+    blit_sequence = [(background, (left - 5, top - 5))]
+    for row_index, row in enumerate(overlay_rows):
+        cell_left = left
+        for column_index, cell in enumerate(row):
+            # Names are left aligned, numbers right aligned
+            if column_index == 0:
+                blit_sequence.append((cell, (cell_left, top + row_index * row_height)))
+            else:
+                cell_right = cell_left + column_widths[column_index] - game_constants.PROFILER_OVERLAY_COLUMN_SPACING
+                blit_sequence.append((cell, (cell_right - cell.get_width(), top + row_index * row_height)))
+            cell_left += column_widths[column_index]
+    surface.blits(blit_sequence, doreturn=False)
+
+
+def export_trace() -> str:
+    """
+    Writes the recorded sections to a Chrome trace file and returns its path
+    """
+    date_string = str(datetime.datetime.now()).replace("-", ".").replace(" ", " - ").replace(":", ".")[:-7]
+    path = f"{game_constants.PROFILER_TRACE_DIRECTORY}/{date_string}.json"
+    os.makedirs(game_constants.PROFILER_TRACE_DIRECTORY, exist_ok=True)
+
+    process_id = os.getpid()
+    thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+    events = [
+        {
+            "name": "thread_name",
+            "ph": "M",
+            "pid": process_id,
+            "tid": thread_id,
+            "args": {"name": thread_name},
+        }
+        for thread_id, thread_name in thread_names.items()
+    ]
+    for name, start_time, duration, thread_id in list(trace_events):
+        events.append(
+            {
+                "name": name,
+                "ph": "X",
+                "ts": round((start_time - trace_start_time) * 1000000, 3),
+                "dur": round(duration * 1000000, 3),
+                "pid": process_id,
+                "tid": thread_id,
+            }
+        )
+    with open(path, "w") as file:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+    return path
@@ -4,6 +4,7 @@ import random
 import pygame
 from pygame.locals import Rect
 
+import collision
 import commons
 import entity_manager
 import game_data
@@ -32,6 +33,7 @@ class Projectile:
             drag=0.99,
     ):
         self.position = position
+        self.previous_position = position  # Position before the last tick, for drawing between ticks
         self.velocity = velocity
         self.angle = math.atan2(velocity[1], velocity[0])
         self.source = source
@@ -59,7 +61,7 @@ class Projectile:
         Updates the life of the Projectile instance, performs physics (including optional bounces) and spawns trail particles if necessary
         """
         if self.life <= 0:
-            entity_manager.projectiles.remove(self)
+            entity_manager.remove_projectile(self)
             return
         else:
             self.life -= commons.DELTA_TIME
@@ -76,10 +78,6 @@ class Projectile:
         )
         self.rect.left = self.position[0] - self.size * 0.5
         self.rect.top = self.position[1] - self.size * 0.5
-        block_position = (
-            int(self.position[1] // commons.BLOCK_SIZE),
-            int(self.position[0] // commons.BLOCK_SIZE),
-        )
         if self.trail is not None:
             if self.trail_tick <= 0:
                 if self.trail == "arrow":
@@ -109,50 +107,37 @@ class Projectile:
 
         block_hit_tile_id = -1
 
-        for j in range(-1, 2):
-            for i in range(-1, 2):
-                if world.tile_in_map(block_position[1] + j, block_position[0] + i):
-                    tile_id = world.world.tile_data[block_position[1] + j][block_position[0] + i][0]
-                    tile_data = game_data.get_tile_by_id(tile_id)
-                    if commons.TileTag.NO_COLLIDE not in tile_data.tags:
-                        if commons.TileTag.PLATFORM not in tile_data.tags:
-                            block_rect = Rect(
-                                commons.BLOCK_SIZE * (block_position[1] + j),
-                                commons.BLOCK_SIZE * (block_position[0] + i),
-                                commons.BLOCK_SIZE,
-                                commons.BLOCK_SIZE,
-                            )
-                            if block_rect.colliderect(self.rect):
-                                delta_x = self.position[0] - block_rect.centerx
-                                delta_y = self.position[1] - block_rect.centery
-                                if abs(delta_x) > abs(delta_y):
-                                    if delta_x > 0:
-                                        self.position = (
-                                            block_rect.right + self.rect.width * 0.5,
-                                            self.position[1],
-                                        )  # Move proj right
-                                    else:
-                                        self.position = (
-                                            block_rect.left - self.rect.width * 0.5,
-                                            self.position[1],
-                                        )  # Move proj left
-                                    block_hit_tile_id = tile_id
-                                    x_collided = True
-                                else:
-                                    if delta_y > 0:
-                                        if self.velocity[1] < 0:
-                                            self.position = (
-                                                self.position[0],
-                                                block_rect.bottom + self.rect.height * 0.5,
-                                            )  # Move proj down
-                                    else:
-                                        if self.velocity[1] > 0:
-                                            self.position = (
-                                                self.position[0],
-                                                block_rect.top - self.rect.height * 0.5,
-                                            )  # Move proj up
-                                    block_hit_tile_id = tile_id
-                                    y_collided = True
+        for tile_id, _, block_left, block_top in collision.overlapping_solids(*self.rect, ignore_flags=collision.PLATFORM):
+            delta_x = self.position[0] - (block_left + commons.BLOCK_SIZE // 2)
+            delta_y = self.position[1] - (block_top + commons.BLOCK_SIZE // 2)
+            if abs(delta_x) > abs(delta_y):
+                if delta_x > 0:
+                    self.position = (
+                        block_left + commons.BLOCK_SIZE + self.rect.width * 0.5,
+                        self.position[1],
+                    )  # Move proj right
+                else:
+                    self.position = (
+                        block_left - self.rect.width * 0.5,
+                        self.position[1],
+                    )  # Move proj left
+                block_hit_tile_id = tile_id
+                x_collided = True
+            else:
+                if delta_y > 0:
+                    if self.velocity[1] < 0:
+                        self.position = (
+                            self.position[0],
+                            block_top + commons.BLOCK_SIZE + self.rect.height * 0.5,
+                        )  # Move proj down
+                else:
+                    if self.velocity[1] > 0:
+                        self.position = (
+                            self.position[0],
+                            block_top - self.rect.height * 0.5,
+                        )  # Move proj up
+                block_hit_tile_id = tile_id
+                y_collided = True
 
         if x_collided or y_collided:
             if self.bounce_num > 0:
@@ -162,7 +147,7 @@ class Projectile:
                 else:
                     self.velocity = (-self.velocity[0], -self.velocity[1])
             if self.bounce_num <= 0:
-                entity_manager.projectiles.remove(self)
+                entity_manager.remove_projectile(self)
                 if commons.PARTICLES:
                     color = pygame.transform.average_color(game_data.get_tile_by_id(block_hit_tile_id).image)
                     velocity_angle = math.atan2(self.velocity[1], self.velocity[0])
@@ -181,7 +166,7 @@ class Projectile:
                 game_data.play_sound("sound.dig")
                 return
 
-        for enemy in entity_manager.enemies:
+        for enemy in entity_manager.enemy_grid.query_rect(self.rect):
             if enemy.rect.colliderect(self.rect):
                 if enemy.position[0] > entity_manager.get_client_player().position[0]:
                     direction = 1
@@ -195,7 +180,7 @@ class Projectile:
                     direction=direction,
                     source_velocity=self.velocity,
                 )
-                entity_manager.projectiles.remove(self)
+                entity_manager.remove_projectile(self)
                 return
 
     def draw(self):
@@ -204,11 +189,12 @@ class Projectile:
         """
         angle = math.atan2(self.velocity[1], -self.velocity[0]) * 180 / math.pi + 90
         surf = shared_methods.rotate_surface(self.image, angle)
+        offset = shared_methods.get_interpolation_offset(self.previous_position, self.position)
         commons.screen.blit(
             surf,
             (
-                self.rect.left - entity_manager.camera_position[0] + commons.WINDOW_WIDTH * 0.5,
-                self.rect.top - entity_manager.camera_position[1] + commons.WINDOW_HEIGHT * 0.5,
+                self.rect.left + offset[0] - entity_manager.camera_position[0] + commons.WINDOW_WIDTH * 0.5,
+                self.rect.top + offset[1] - entity_manager.camera_position[1] + commons.WINDOW_HEIGHT * 0.5,
             ),
         )
         shared_methods.draw_hitbox(
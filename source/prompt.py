@@ -4,6 +4,7 @@ from pygame.locals import Rect
 import commons
 import entity_manager
 import game_data
+import lighting
 import menu_manager
 import shared_methods
 import sound_manager
@@ -104,10 +105,11 @@ class Prompt:
             if self.button_1_pressed:
                 entity_manager.get_client_player().save()
                 world.save()
+                lighting.stop_light_worker()
                 sound_manager.stop_music()
                 commons.game_state = "MAIN_MENU"
                 commons.game_sub_state = "MAIN"
-                world.terrain_surface = pygame.Surface((1, 1))
+                world.clear_terrain_chunks()
                 menu_manager.update_active_menu_buttons()
                 self.close = True
 
@@ -0,0 +1,175 @@
+"""
+Cached summaries of world and player saves for the selection menus.
+
+Each entry remembers the modification time of the files it was built from, entries whose files changed are
+rebuilt from the save itself and entries for deleted saves are dropped.
+"""
+import os
+import pickle
+
+import pygame
+
+import player
+import world
+
+SAVE_INDEX_PATH = "assets/save_index.dat"
+SAVE_INDEX_VERSION = 2
+
+save_index: dict | None = None
+
+
+def get_save_index() -> dict:
+    """
+    Returns the index, reading it from disk the first time
+    """
+    global save_index
+    if save_index is None:
+        save_index = {"version": SAVE_INDEX_VERSION, "worlds": {}, "players": {}}
+        if os.path.isfile(SAVE_INDEX_PATH):
+            try:
+                loaded_index = pickle.load(open(SAVE_INDEX_PATH, "rb"))
+                if loaded_index.get("version") == SAVE_INDEX_VERSION:
+                    save_index = loaded_index
+            except (pickle.UnpicklingError, EOFError, AttributeError):
+                pass
+    return save_index
+
+
+def write_save_index() -> None:
+    pickle.dump(get_save_index(), open(SAVE_INDEX_PATH, "wb"))
+
+
+def get_save_modified_time(paths: list[str]) -> float:
+    return max(os.path.getmtime(path) for path in paths)
+
+
+def get_world_paths(world_name: str) -> list[str]:
+    return [f"{world.WORLD_SAVE_DIRECTORY}/{world_name}.dat", f"{world.WORLD_SAVE_DIRECTORY}/{world_name}.wrld"]
+
+
+def get_player_paths(player_name: str) -> list[str]:
+    return [f"assets/players/{player_name}.player"]
+
+
+def pack_thumbnail(surface: pygame.Surface) -> tuple[tuple[int, int], bytes]:
+    return surface.get_size(), pygame.image.tobytes(surface, "RGBA")
+
+
+def unpack_thumbnail(thumbnail: tuple[tuple[int, int], bytes] | None) -> pygame.Surface | None:
+    if thumbnail is None:
+        return None
+    return pygame.image.frombytes(thumbnail[1], thumbnail[0], "RGBA")
+
+
+def build_world_entry(indexed_world: "world.World", world_name: str) -> dict:
+    return {
+        "modified_time": get_save_modified_time(get_world_paths(world_name)),
+        "name": indexed_world.name,
+        "creation_date": indexed_world.creation_date,
+        "last_played_date": indexed_world.last_played_date,
+        "playtime": indexed_world.playtime,
+        "size": (indexed_world.tile_grid.width, indexed_world.tile_grid.height),
+        "thumbnail": pack_thumbnail(world.create_world_thumbnail(indexed_world.tile_grid)),
+    }
+
+
+def build_player_entry(player_data: dict, player_name: str, thumbnail: tuple[tuple[int, int], bytes] | None) -> dict:
+    if thumbnail is None:
+        thumbnail = pack_thumbnail(player.Model(player_data["model_appearance"]).create_sprite())
+    return {
+        "modified_time": get_save_modified_time(get_player_paths(player_name)),
+        "name": player_data["name"],
+        "creation_date": player_data["creation_date"],
+        "last_played_date": player_data["last_played_date"],
+        "playtime": player_data["playtime"],
+        "hp": player_data["hp"],
+        "max_hp": player_data["max_hp"],
+        "model_appearance": player_data["model_appearance"],
+        "thumbnail": thumbnail,
+    }
+
+
+def update_world_entry(saved_world: "world.World") -> None:
+    """
+    Records a world that has just been saved
+    """
+    get_save_index()["worlds"][saved_world.name] = build_world_entry(saved_world, saved_world.name)
+    write_save_index()
+
+
+def remove_world_entry(world_name: str) -> None:
+    """
+    Forgets a world whose save has been deleted
+    """
+    if get_save_index()["worlds"].pop(world_name, None) is not None:
+        write_save_index()
+
+
+def update_player_entry(player_data: dict) -> None:
+    """
+    Records a player that has just been saved, reusing the thumbnail the player was indexed with if their appearance
+    is unchanged
+    """
+    players = get_save_index()["players"]
+    previous_entry = players.get(player_data["name"])
+    thumbnail = None
+    if previous_entry is not None and previous_entry["model_appearance"] == player_data["model_appearance"]:
+        thumbnail = previous_entry["thumbnail"]
+    players[player_data["name"]] = build_player_entry(player_data, player_data["name"], thumbnail)
+    write_save_index()
+
+
+def get_world_entries() -> list[dict]:
+    """
+    Returns an entry for every world save, rebuilding the entries of worlds that changed since they were indexed
+    """
+    worlds = get_save_index()["worlds"]
+    changed = False
+    world_names = [
+        os.path.splitext(file_name)[0] for file_name in os.listdir(world.WORLD_SAVE_DIRECTORY)
+        if os.path.splitext(file_name)[1] == ".dat"
+        and os.path.isfile(f"{world.WORLD_SAVE_DIRECTORY}/{os.path.splitext(file_name)[0]}.wrld")
+    ]
+    for world_name in world_names:
+        entry = worlds.get(world_name)
+        if entry is None or entry["modified_time"] != get_save_modified_time(get_world_paths(world_name)):
+            indexed_world = world.World()
+            indexed_world.load(world_name, compact=True)
+            worlds[world_name] = build_world_entry(indexed_world, world_name)
+            changed = True
+    for world_name in [world_name for world_name in worlds if world_name not in world_names]:
+        del worlds[world_name]
+        changed = True
+    if changed:
+        write_save_index()
+    return [worlds[world_name] for world_name in world_names]
+
+
+def get_player_entries() -> list[dict]:
+    """
+    Returns an entry for every player save, rebuilding the entries of players that changed since they were indexed
+    """
+    players = get_save_index()["players"]
+    changed = False
+    player_names = [
+        os.path.splitext(file_name)[0] for file_name in os.listdir("assets/players")
+        if os.path.splitext(file_name)[1] == ".player"
+    ]
+    for player_name in player_names:
+        entry = players.get(player_name)
+        if entry is None or entry["modified_time"] != get_save_modified_time(get_player_paths(player_name)):
+            players[player_name] = build_player_entry(load_player_data(player_name), player_name, None)
+            changed = True
+    for player_name in [player_name for player_name in players if player_name not in player_names]:
+        del players[player_name]
+        changed = True
+    if changed:
+        write_save_index()
+    return [players[player_name] for player_name in player_names]
+
+
+def load_player_data(player_name: str) -> dict:
+    """
+    Reads the full save of a player, only needed once the player is picked
+    """
+    return pickle.load(open(get_player_paths(player_name)[0], "rb"))
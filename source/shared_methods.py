@@ -1,10 +1,18 @@
 import math
+from collections import OrderedDict
 
 import pygame
 
 import commons
+import game_constants
 import tilesets
 
+# Rendered outlined text keyed by (string, color, outline color, font, fancy text), least recently used first
+outline_text_cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+outline_text_cache_size_bytes = 0
+outline_text_cache_hits = 0
+outline_text_cache_misses = 0
+
 
 def normalize_vec_2(vector):
     """
@@ -76,7 +84,50 @@ def outline_text(
         string, color: pygame.Color, font: pygame.font.Font, outline_color: pygame.Color = pygame.Color(0, 0, 0)
 ):
     """
-    Used to draw most text in the game, renders some text and draws it several times at varying offsets to create an outline effect
+    Used to draw most text in the game, returns the outlined text from the cache or renders it if it is not there.
+    The returned surface is shared, copy it before changing it
+    """
+    global outline_text_cache_size_bytes, outline_text_cache_hits, outline_text_cache_misses
+    key = (string, tuple(pygame.Color(color)), tuple(pygame.Color(outline_color)), font, commons.FANCY_TEXT)
+    surface = outline_text_cache.get(key)
+    if surface is not None:
+        outline_text_cache_hits += 1
+        outline_text_cache.move_to_end(key)
+        return surface
+
+    outline_text_cache_misses += 1
+    surface = render_outline_text(string, color, font, outline_color)
+    outline_text_cache[key] = surface
+    outline_text_cache_size_bytes += get_text_size_bytes(surface)
+    while (
+            len(outline_text_cache) > game_constants.TEXT_CACHE_SIZE
+            or outline_text_cache_size_bytes > game_constants.TEXT_CACHE_BUDGET_BYTES
+    ) and len(outline_text_cache) > 1:
+        _, evicted_surface = outline_text_cache.popitem(last=False)
+        outline_text_cache_size_bytes -= get_text_size_bytes(evicted_surface)
+    return surface
+
+
+def get_text_size_bytes(surface: pygame.Surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def get_outline_text_cache_stats() -> dict[str, int | float]:
+    lookups = outline_text_cache_hits + outline_text_cache_misses
+    return {
+        "size": len(outline_text_cache),
+        "size_bytes": outline_text_cache_size_bytes,
+        "hits": outline_text_cache_hits,
+        "misses": outline_text_cache_misses,
+        "hit_rate": outline_text_cache_hits / lookups if lookups > 0 else 0.0,
+    }
+
+
+def render_outline_text(
+        string, color: pygame.Color, font: pygame.font.Font, outline_color: pygame.Color = pygame.Color(0, 0, 0)
+):
+    """
+    Renders some text and draws it several times at varying offsets to create an outline effect
     """
     text1 = font.render(string, False, color)
     if commons.FANCY_TEXT:
@@ -185,6 +236,25 @@ def lerp_float(start_value, end_value, interpolation_factor):
     return start_value + (end_value - start_value) * interpolation_factor
 
 
+def get_interpolation_offset(previous_position, position):
+    """
+    Returns how far from its simulated position something that moved during the last tick is drawn, so it is drawn
+    between its previous and current position like the camera
+    """
+    factor = 1 - commons.INTERPOLATION_ALPHA
+    return (previous_position[0] - position[0]) * factor, (previous_position[1] - position[1]) * factor
+
+
+def lerp_position(start_position, end_position, interpolation_factor):
+    """
+    Linear interpolation between two positions
+    """
+    return (
+        lerp_float(start_position[0], end_position[0], interpolation_factor),
+        lerp_float(start_position[1], end_position[1], interpolation_factor),
+    )
+
+
 def smooth_zero_to_one(value, iterations):
     """
     Applies a smooth transformation to a 0-1 value
@@ -0,0 +1,113 @@
+"""
+Sound effects, loaded once and played on a fixed pool of mixer channels.
+
+Every sound file is decoded on a background thread when the game starts, a sound that is played before the thread got
+to it is decoded right away instead. A sound can only be playing on a limited number of channels at once and a play
+past that limit takes over the sound's oldest channel. When every channel is busy the oldest play with the lowest
+priority makes way, as long as its priority isn't higher than the new one's. Bursts like digging, slimes being hit or
+picking up coins reuse a few channels instead of filling the mixer.
+"""
+import threading
+import time
+
+import pygame
+
+import game_constants
+
+# Decoded sounds by path, None for files that failed to load
+sounds: dict[str, pygame.mixer.Sound | None] = {}
+sound_lock = threading.Lock()
+sound_loader_thread: threading.Thread | None = None
+
+channels: list[pygame.mixer.Channel] = []
+# The sound, priority and start time of what was last played on each channel
+channel_voices: list[tuple[str, int, float] | None] = []
+
+dropped_play_count = 0
+
+
+def load_sound(path: str) -> pygame.mixer.Sound | None:
+    """
+    Returns the sound at the path, decoding it the first time
+    """
+    with sound_lock:
+        if path not in sounds:
+            try:
+                sounds[path] = pygame.mixer.Sound(path)
+            except (FileNotFoundError, pygame.error):
+                sounds[path] = None
+        return sounds[path]
+
+
+def load_sounds_in_background(paths: list[str]) -> None:
+    """
+    Starts decoding the sounds on a background thread
+    """
+    global sound_loader_thread
+    if sound_loader_thread is not None:
+        return
+
+    def load_sounds() -> None:
+        for path in paths:
+            load_sound(path)
+
+    sound_loader_thread = threading.Thread(target=load_sounds, name="SoundLoader", daemon=True)
+    sound_loader_thread.start()
+
+
+def get_channels() -> list[pygame.mixer.Channel]:
+    """
+    Returns the channels sounds are played on, reserving them in the mixer the first time
+    """
+    if len(channels) == 0:
+        pygame.mixer.set_num_channels(game_constants.SOUND_CHANNEL_COUNT)
+        for channel_index in range(game_constants.SOUND_CHANNEL_COUNT):
+            channels.append(pygame.mixer.Channel(channel_index))
+            channel_voices.append(None)
+    return channels
+
+
+def play(name: str, path: str, volume: float, priority: int, max_voices: int) -> None:
+    """
+    Plays the file under the sound's name at the volume, taking a channel according to the voice limit and priority
+    """
+    global dropped_play_count
+    sound = load_sound(path)
+    if sound is None:
+        return
+
+    free_channel_index = None
+    same_sound_indices = []
+    for channel_index, channel in enumerate(get_channels()):
+        if channel_voices[channel_index] is None or not channel.get_busy():
+            channel_voices[channel_index] = None
+            if free_channel_index is None:
+                free_channel_index = channel_index
+        elif channel_voices[channel_index][0] == name:
+            same_sound_indices.append(channel_index)
+
+    if len(same_sound_indices) >= max_voices:
+        channel_index = min(same_sound_indices, key=lambda index: channel_voices[index][2])
+    elif free_channel_index is not None:
+        channel_index = free_channel_index
+    else:
+        channel_index = min(
+            range(len(channels)), key=lambda index: (channel_voices[index][1], channel_voices[index][2])
+        )
+        if channel_voices[channel_index][1] > priority:
+            dropped_play_count += 1
+            return
+
+    channels[channel_index].play(sound)
+    channels[channel_index].set_volume(volume)
+    channel_voices[channel_index] = (name, priority, time.perf_counter())
+
+
+def get_sound_bank_stats() -> dict:
+    busy_channel_count = len([channel for channel in channels if channel.get_busy()])
+    return {
+        "loaded": len(sounds),
+        "channels": len(channels),
+        "busy_channels": busy_channel_count,
+        "dropped_plays": dropped_play_count,
+    }
@@ -0,0 +1,132 @@
+import pygame
+
+
+class SpatialHash:
+    """
+    Buckets entities into a uniform grid of square cells by their rect so nearby ones can be found without checking all of them
+    """
+
+    def __init__(self, cell_size: int):
+        self.cell_size = cell_size
+        # Each cell keeps its entities in a dict used as an insertion ordered set
+        self.cells: dict[tuple[int, int], dict[object, None]] = {}
+        self.entity_rects: dict[object, pygame.Rect] = {}
+        self.entity_cell_ranges: dict[object, tuple[int, int, int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entity_rects)
+
+    def __contains__(self, entity: object) -> bool:
+        return entity in self.entity_rects
+
+    def get_cell_range(self, rect: pygame.Rect) -> tuple[int, int, int, int]:
+        """
+        Returns the first and last cell the rect covers along each axis
+        """
+        return (
+            int(rect.left // self.cell_size),
+            int(rect.top // self.cell_size),
+            int((rect.right - 1) // self.cell_size),
+            int((rect.bottom - 1) // self.cell_size),
+        )
+
+    def add_to_cells(self, entity: object, cell_range: tuple[int, int, int, int]) -> None:
+        for cell_x in range(cell_range[0], cell_range[2] + 1):
+            for cell_y in range(cell_range[1], cell_range[3] + 1):
+                self.cells.setdefault((cell_x, cell_y), {})[entity] = None
+
+    def remove_from_cells(self, entity: object, cell_range: tuple[int, int, int, int]) -> None:
+        for cell_x in range(cell_range[0], cell_range[2] + 1):
+            for cell_y in range(cell_range[1], cell_range[3] + 1):
+                cell = self.cells[(cell_x, cell_y)]
+                del cell[entity]
+                if not cell:
+                    del self.cells[(cell_x, cell_y)]
+
+    def insert(self, entity: object, rect: pygame.Rect) -> None:
+        """
+        Starts tracking an entity, the rect is kept and read again whenever the entity is moved or queried
+        """
+        if entity in self.entity_rects:
+            self.remove(entity)
+        cell_range = self.get_cell_range(rect)
+        self.entity_rects[entity] = rect
+        self.entity_cell_ranges[entity] = cell_range
+        self.add_to_cells(entity, cell_range)
+
+    def move(self, entity: object) -> None:
+        """
+        Moves a tracked entity to the cells its rect covers now, entities that are not tracked are ignored
+        """
+        rect = self.entity_rects.get(entity)
+        if rect is None:
+            return
+        cell_range = self.get_cell_range(rect)
+        old_cell_range = self.entity_cell_ranges[entity]
+        if cell_range != old_cell_range:
+            self.remove_from_cells(entity, old_cell_range)
+            self.add_to_cells(entity, cell_range)
+            self.entity_cell_ranges[entity] = cell_range
+
+    def remove(self, entity: object) -> None:
+        if entity not in self.entity_rects:
+            return
+        self.remove_from_cells(entity, self.entity_cell_ranges.pop(entity))
+        del self.entity_rects[entity]
+
+    def clear(self) -> None:
+        self.cells.clear()
+        self.entity_rects.clear()
+        self.entity_cell_ranges.clear()
+
+    def get_candidates(self, cell_range: tuple[int, int, int, int]) -> dict[object, None]:
+        """
+        Returns every entity in the given cells without checking their rects
+        """
+        candidates: dict[object, None] = {}
+        for cell_x in range(cell_range[0], cell_range[2] + 1):
+            for cell_y in range(cell_range[1], cell_range[3] + 1):
+                cell = self.cells.get((cell_x, cell_y))
+                if cell is not None:
+                    candidates.update(cell)
+        return candidates
+
+    def query_rect(self, rect: pygame.Rect) -> list:
+        """
+        Returns the entities whose rect overlaps the given rect
+        """
+        return [
+            entity for entity in self.get_candidates(self.get_cell_range(rect))
+            if self.entity_rects[entity].colliderect(rect)
+        ]
+
+    def query_point(self, point: tuple[float, float]) -> list:
+        """
+        Returns the entities whose rect contains the given point
+        """
+        cell_x = int(point[0] // self.cell_size)
+        cell_y = int(point[1] // self.cell_size)
+        return [
+            entity for entity in self.cells.get((cell_x, cell_y), {})
+            if self.entity_rects[entity].collidepoint(point)
+        ]
+
+    def query_radius(self, center: tuple[float, float], radius: float) -> list:
+        """
+        Returns the entities whose rect comes within the radius of the given center
+        """
+        cell_range = (
+            int((center[0] - radius) // self.cell_size),
+            int((center[1] - radius) // self.cell_size),
+            int((center[0] + radius) // self.cell_size),
+            int((center[1] + radius) // self.cell_size),
+        )
+        radius_squared = radius * radius
+        entities = []
+        for entity in self.get_candidates(cell_range):
+            rect = self.entity_rects[entity]
+            closest_x = min(max(center[0], rect.left), rect.right)
+            closest_y = min(max(center[1], rect.top), rect.bottom)
+            if (closest_x - center[0]) ** 2 + (closest_y - center[1]) ** 2 <= radius_squared:
+                entities.append(entity)
+        return entities
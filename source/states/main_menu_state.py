@@ -4,6 +4,7 @@ import random
 import sys
 from typing import Any, List
 
+import numpy as np
 import pygame
 
 import commons
@@ -14,6 +15,7 @@ import item
 import menu_manager
 import player
 import prompt
+import save_index
 import shared_methods
 import sound_manager
 import world
@@ -23,7 +25,7 @@ from state_manager import State
 from main_utils import *
 
 class MainMenuState(State):
-    def update(self, dt: float) -> None:
+    def draw(self, surface: pygame.Surface) -> None:
         draw_menu_background()
         menu_manager.update_menu_buttons()
         menu_manager.draw_menu_buttons()
@@ -44,22 +46,18 @@ class MainMenuState(State):
                                 60,
                         ).collidepoint(commons.MOUSE_POSITION):
                             commons.WAIT_TO_USE = True
-                            commons.PLAYER_DATA["name"] = commons.PLAYER_SAVE_OPTIONS[save_option_index][0]["name"]
-                            commons.PLAYER_DATA["model_appearance"] = commons.PLAYER_SAVE_OPTIONS[save_option_index][0][
-                                "model_appearance"
-                            ]
-                            commons.PLAYER_DATA["hotbar"] = commons.PLAYER_SAVE_OPTIONS[save_option_index][0]["hotbar"]
-                            commons.PLAYER_DATA["inventory"] = commons.PLAYER_SAVE_OPTIONS[save_option_index][0][
-                                "inventory"]
-                            commons.PLAYER_DATA["hp"] = commons.PLAYER_SAVE_OPTIONS[save_option_index][0]["hp"]
-                            commons.PLAYER_DATA["max_hp"] = commons.PLAYER_SAVE_OPTIONS[save_option_index][0]["max_hp"]
-                            commons.PLAYER_DATA["playtime"] = commons.PLAYER_SAVE_OPTIONS[save_option_index][0][
-                                "playtime"]
-                            commons.PLAYER_DATA["creation_date"] = commons.PLAYER_SAVE_OPTIONS[save_option_index][0][
-                                "creation_date"]
-                            commons.PLAYER_DATA["last_played_date"] = commons.PLAYER_SAVE_OPTIONS[save_option_index][0][
-                                "last_played_date"
-                            ]
+                            player_data = save_index.load_player_data(
+                                commons.PLAYER_SAVE_OPTIONS[save_option_index][0]["name"]
+                            )
+                            commons.PLAYER_DATA["name"] = player_data["name"]
+                            commons.PLAYER_DATA["model_appearance"] = player_data["model_appearance"]
+                            commons.PLAYER_DATA["hotbar"] = player_data["hotbar"]
+                            commons.PLAYER_DATA["inventory"] = player_data["inventory"]
+                            commons.PLAYER_DATA["hp"] = player_data["hp"]
+                            commons.PLAYER_DATA["max_hp"] = player_data["max_hp"]
+                            commons.PLAYER_DATA["playtime"] = player_data["playtime"]
+                            commons.PLAYER_DATA["creation_date"] = player_data["creation_date"]
+                            commons.PLAYER_DATA["last_played_date"] = player_data["last_played_date"]
                             menu_manager.load_menu_world_data()
                             game_data.play_sound("sound.menu_open")
                             commons.game_sub_state = "WORLD_SELECTION"
@@ -109,9 +107,7 @@ class MainMenuState(State):
         
                             world.load(commons.WORLD_SAVE_OPTIONS[world_option_index][0])
         
-                            world.WORLD_SIZE_X, world.WORLD_SIZE_Y = len(world.world.tile_data), len(
-                                world.world.tile_data[0]
-                            )
+                            world.WORLD_SIZE_X, world.WORLD_SIZE_Y = world.world.tile_grid.width, world.world.tile_grid.height
         
                             world.biome_border_x_1 = world.WORLD_SIZE_X * 0.333333
                             world.biome_border_x_2 = world.WORLD_SIZE_X * 0.666666
@@ -121,12 +117,7 @@ class MainMenuState(State):
                             world.border_up = int(commons.BLOCK_SIZE * 1.5)
                             world.border_down = int(world.WORLD_SIZE_Y * commons.BLOCK_SIZE - commons.BLOCK_SIZE * 1.5)
         
-                            world.tile_mask_data = [
-                                [-1 for _ in range(world.WORLD_SIZE_Y)] for _ in range(world.WORLD_SIZE_X)
-                            ]
-                            world.wall_tile_mask_data = [
-                                [-1 for _ in range(world.WORLD_SIZE_Y)] for _ in range(world.WORLD_SIZE_X)
-                            ]
+                            world.compute_terrain_masks()
                             background_id = 5
         
                             entity_manager.create_player()
@@ -177,26 +168,17 @@ class MainMenuState(State):
                                 world.world.spawn_position[0],
                                 0,
                             )
+                            entity_manager.old_camera_position = entity_manager.camera_position
                             entity_manager.get_client_player().position = tuple(world.world.spawn_position)
+                            entity_manager.get_client_player().previous_position = entity_manager.get_client_player().position
                             entity_manager.get_client_player().render_current_item_image()
                             entity_manager.get_client_player().render_hotbar()
                             entity_manager.get_client_player().render_inventory()
-                            world.create_terrain_surface()
+                            world.clear_terrain_chunks()
         
                             render_hand_text()
         
-                            GameState.map_light = [[0 for _ in range(world.WORLD_SIZE_Y)] for _ in
-                                                   range(world.WORLD_SIZE_X)]
-                            for world_x in range(world.WORLD_SIZE_X - 1):
-                                for world_y in range(world.WORLD_SIZE_Y - 1):
-                                    if (
-                                            world.world.tile_data[world_x][world_y][0] == -1
-                                            and world.world.tile_data[world_x][world_y][1] == -1
-                                            and world_y < game_constants.SURFACE_LIGHT_LEVEL_Y
-                                    ):
-                                        GameState.map_light[world_x][world_y] = global_lighting
-                                    else:
-                                        GameState.map_light[world_x][world_y] = 0
+                            GameState.map_light = np.zeros((world.WORLD_SIZE_X, world.WORLD_SIZE_Y), dtype=np.int16)
         
                             commons.game_state = "PLAYING"
                             should_break = True
@@ -326,7 +308,7 @@ class MainMenuState(State):
             entity_manager.client_color_picker.draw()
         
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def update(self, dt: float) -> None:
         pass
 
     def handle_events(self, events: List[pygame.event.Event]) -> None:
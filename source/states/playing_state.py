@@ -2,7 +2,6 @@ import datetime
 import math
 import random
 import sys
-import _thread
 from typing import Any, List
 
 import pygame
@@ -12,7 +11,9 @@ import entity_manager
 import game_constants
 import game_data
 import item
+import lighting
 import menu_manager
+import profiler
 import prompt
 import shared_methods
 import sound_manager
@@ -62,20 +63,29 @@ class PlayingState(State):
             entity_manager.camera_position[1],
         )
         
-        entity_manager.update_enemies()
-        entity_manager.update_projectiles()
-        entity_manager.update_particles()
+        with profiler.section("enemies"):
+            entity_manager.update_enemies()
+        with profiler.section("projectiles"):
+            entity_manager.update_projectiles()
+        with profiler.section("particles"):
+            entity_manager.update_particles()
         entity_manager.update_messages()
-        entity_manager.update_physics_items()
-        entity_manager.check_enemy_spawn()
+        with profiler.section("physics_items"):
+            entity_manager.update_physics_items()
+        with profiler.section("spawning"):
+            entity_manager.check_enemy_spawn()
+            entity_manager.update_dormancy()
         
-        entity_manager.get_client_player().update()
-        entity_manager.get_client_player().animate()
+        with profiler.section("player"):
+            entity_manager.get_client_player().previous_position = entity_manager.get_client_player().position
+            entity_manager.get_client_player().update()
+            entity_manager.get_client_player().animate()
         
         entity_manager.update_damage_numbers()
         entity_manager.update_recent_pickups()
         
-        world.check_grow_grass()
+        with profiler.section("grass"):
+            world.check_grow_grass()
         
         temp_cam_pos_x = entity_manager.camera_position[0]
         temp_cam_pos_y = entity_manager.camera_position[1]
@@ -140,44 +150,81 @@ class PlayingState(State):
                 commons.WAIT_TO_USE = True
         
         if commons.BACKGROUND:
-            BACKGROUND_DATA.update_biome(Biome.TREE)
-            BACKGROUND_DATA.render(GameState.parallax_position[0], GameState.parallax_position[1], 0.1)
-            BACKGROUND_DATA.shift(commons.DELTA_TIME * 10, 0.001)
-            BACKGROUND_DATA.update(commons.DELTA_TIME)
+            move_parallax((GameState.background_scroll_velocity, 0))
+        
+        if GameState.auto_save_tick <= 0:
+            GameState.auto_save_tick += commons.AUTO_SAVE_FREQUENCY
+            entity_manager.get_client_player().save()
+            world.save()
         else:
-            commons.screen.fill((0, 0, 0))
+            GameState.auto_save_tick -= commons.DELTA_TIME
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """
+        Draws the world between the last two simulation ticks so movement stays smooth at any frame rate
+        """
+        client_player = entity_manager.get_client_player()
+        simulated_camera_position = entity_manager.camera_position
+        simulated_player_position = client_player.position
+        entity_manager.camera_position = shared_methods.lerp_position(
+            entity_manager.old_camera_position, simulated_camera_position, commons.INTERPOLATION_ALPHA
+        )
+        client_player.position = shared_methods.lerp_position(
+            client_player.previous_position, simulated_player_position, commons.INTERPOLATION_ALPHA
+        )
+        try:
+            self.draw_world()
+        finally:
+            entity_manager.camera_position = simulated_camera_position
+            client_player.position = simulated_player_position
+
+    def draw_world(self) -> None:
+        with profiler.section("background"):
+            if commons.BACKGROUND:
+                BACKGROUND_DATA.update_biome(Biome.TREE)
+                BACKGROUND_DATA.render(GameState.parallax_position[0], GameState.parallax_position[1], 0.1)
+                BACKGROUND_DATA.shift(commons.DELTA_TIME * 10, 0.001)
+                BACKGROUND_DATA.update(commons.DELTA_TIME)
+            else:
+                commons.screen.fill((0, 0, 0))
         
         terrain_position = (
             commons.WINDOW_WIDTH * 0.5 - entity_manager.camera_position[0],
             commons.WINDOW_HEIGHT * 0.5 - entity_manager.camera_position[1],
         )
-        commons.screen.blit(world.terrain_surface, terrain_position)
-        entity_manager.draw_projectiles()
-        entity_manager.get_client_player().draw()
-        entity_manager.draw_particles()
-        entity_manager.draw_enemies()
-        entity_manager.draw_physics_items()
-        
+        with profiler.section("terrain"):
+            world.draw_terrain(terrain_position)
+        with profiler.section("draw_entities"):
+            entity_manager.draw_projectiles()
+            entity_manager.get_client_player().draw()
+            entity_manager.draw_particles()
+            entity_manager.draw_enemies()
+            entity_manager.draw_physics_items()
+        
+        with profiler.section("lighting"):
+            self.draw_lighting()
+        
+        with profiler.section("ui"):
+            self.draw_ui()
+    
+    def draw_lighting(self) -> None:
         if commons.EXPERIMENTAL_LIGHTING:
-            if not GameState.thread_active:
-                GameState.last_thread_time = (pygame.time.get_ticks() - GameState.last_thread_start) * 0.001
-                _thread.start_new_thread(update_light, ())
-                GameState.last_thread_start = pygame.time.get_ticks()
-        
-            GameState.newest_light_surface.unlock()
-            commons.screen.blit(
-                GameState.newest_light_surface,
+            # Light where the camera will be once the worker is done, based on how long jobs take
+            lighting.submit_light_job(
                 (
-                    GameState.newest_light_surface_position[0] - entity_manager.camera_position[
-                        0] + commons.WINDOW_WIDTH * 0.5,
-                    GameState.newest_light_surface_position[1] - entity_manager.camera_position[
-                        1] + commons.WINDOW_HEIGHT * 0.5,
+                    entity_manager.camera_position[0]
+                    + (entity_manager.camera_position_difference[0] / commons.SIMULATION_DELTA_TIME) * lighting.light_average_latency,
+                    entity_manager.camera_position[1]
+                    + (entity_manager.camera_position_difference[1] / commons.SIMULATION_DELTA_TIME) * lighting.light_average_latency,
                 ),
+                commons.CURRENT_SKY_LIGHTING,
             )
-        
+            lighting.draw_light_overlay(commons.screen, entity_manager.camera_position)
+    
+    def draw_ui(self) -> None:
         if commons.DRAW_UI:
             entity_manager.get_client_player().draw_hp()
-            commons.screen.blit(entity_manager.get_client_player().hotbar_image, (5, 20))
+            entity_manager.get_client_player().draw_hotbar()
             entity_manager.draw_messages()
         
         entity_manager.draw_damage_numbers()
@@ -194,23 +241,11 @@ class PlayingState(State):
         if commons.DRAW_UI:
             if entity_manager.get_client_player().inventory_open:
                 commons.screen.blit(entity_manager.get_client_player().inventory_image, (5, 70))
-                entity_manager.get_client_player().blit_craft_surf.fill((255, 0, 255))
-                entity_manager.get_client_player().blit_craft_surf.blit(
-                    entity_manager.get_client_player().craftable_items_surf,
-                    (0, entity_manager.get_client_player().crafting_menu_offset_y),
-                )
-                commons.screen.blit(entity_manager.get_client_player().blit_craft_surf, (5, 270))
+                entity_manager.get_client_player().draw_crafting_menu()
         
             if entity_manager.get_client_player().chest_open:
                 commons.screen.blit(entity_manager.get_client_player().chest_image, (245, 265))
         
-            pygame.draw.rect(
-                commons.screen,
-                (230, 230, 10),
-                pygame.Rect(5 + entity_manager.get_client_player().hotbar_index * 48, 20, 48, 48),
-                3,
-            )
-        
             if entity_manager.get_client_player().inventory_open:
                 draw_inventory_hover_text()
                 draw_exit_button()
@@ -218,20 +253,7 @@ class PlayingState(State):
             if GameState.hand_text is not None:
                 commons.screen.blit(GameState.hand_text, (242 - GameState.hand_text.get_width() * 0.5, 0))
             draw_item_holding()
-        
-        if commons.BACKGROUND:
-            move_parallax((GameState.background_scroll_velocity, 0))
-        
-        if GameState.auto_save_tick <= 0:
-            GameState.auto_save_tick += commons.AUTO_SAVE_FREQUENCY
-            entity_manager.get_client_player().save()
-            world.save()
-        else:
-            GameState.auto_save_tick -= commons.DELTA_TIME
-        
 
-    def draw(self, surface: pygame.Surface) -> None:
-        pass
 
     def handle_events(self, events: List[pygame.event.Event]) -> None:
         for event in events:
@@ -250,8 +272,6 @@ class PlayingState(State):
                         game_data.play_sound("sound.menu_open")
                         entity_manager.get_client_player().inventory_open = True
                         entity_manager.get_client_player().crafting_menu_offset_y = 120
-                        entity_manager.get_client_player().update_craftable_items()
-                        entity_manager.get_client_player().render_craftable_items_surf()
                         entity_manager.client_prompt = None
             
                 if event.key == pygame.K_a:
@@ -359,10 +379,10 @@ class PlayingState(State):
                                 tile_scale * world.WORLD_SIZE_Y,
                             )
                         )
-                        for tile_x in range(len(world.world.tile_data)):
-                            for tile_y in range(len(world.world.tile_data[tile_x])):
-                                tile_id = world.world.tile_data[tile_x][tile_y][0]
-                                wall_id = world.world.tile_data[tile_x][tile_y][1]
+                        for tile_x in range(world.world.tile_grid.width):
+                            for tile_y in range(world.world.tile_grid.height):
+                                tile_id = world.world.tile_grid.get_tile(tile_x, tile_y)
+                                wall_id = world.world.tile_grid.get_wall(tile_x, tile_y)
             
                                 if tile_id != game_data.air_tile_id:
                                     tile_data = game_data.get_tile_by_id(tile_id)
@@ -478,7 +498,7 @@ class PlayingState(State):
                 if event.key == pygame.K_p:
                     if commons.SHIFT_ACTIVE:
                         if world.tile_in_map(commons.HOVERED_TILE[0], commons.HOVERED_TILE[1]):
-                            wallID = world.world.tile_data[commons.HOVERED_TILE[0]][commons.HOVERED_TILE[1]][1]
+                            wallID = world.world.tile_grid.get_wall(commons.HOVERED_TILE[0], commons.HOVERED_TILE[1])
                             entity_manager.add_message(
                                 "Wall at ("
                                 + str(commons.HOVERED_TILE[0])
@@ -491,7 +511,7 @@ class PlayingState(State):
                             )
                     else:
                         if world.tile_in_map(commons.HOVERED_TILE[0], commons.HOVERED_TILE[1]):
-                            tileID = world.world.tile_data[commons.HOVERED_TILE[0]][commons.HOVERED_TILE[1]][0]
+                            tileID = world.world.tile_grid.get_tile(commons.HOVERED_TILE[0], commons.HOVERED_TILE[1])
                             entity_manager.add_message(
                                 "Tile at ("
                                 + str(commons.HOVERED_TILE[0])
@@ -521,6 +541,19 @@ class PlayingState(State):
                         outline_color=pygame.Color(80, 70, 3),
                     )
             
+                # Toggle the profiler overlay
+                if event.key == pygame.K_F3:
+                    profiler.toggle_overlay()
+            
+                # Export a profiler trace
+                if event.key == pygame.K_F4:
+                    path = profiler.export_trace()
+                    entity_manager.add_message(
+                        "Saved trace to " + path,
+                        pygame.Color(255, 223, 10),
+                        outline_color=pygame.Color(80, 70, 3),
+                    )
+            
                 # Toggle HITBOXES
                 if event.key == pygame.K_h:
                     commons.HITBOXES = not commons.HITBOXES
@@ -0,0 +1,361 @@
+import struct
+import zlib
+
+import numpy as np
+
+import game_constants
+
+NO_MULTITILE_OFFSET = -1
+
+PALETTE_CHUNK_HEADER_FORMAT = "<BH"  # Index width in bytes, 0 for uniform chunks, and palette length
+PALETTE_CHUNK_HEADER_SIZE = struct.calcsize(PALETTE_CHUNK_HEADER_FORMAT)
+PALETTE_CELL_DTYPE = np.dtype("<i2")
+
+
+def pack_cells(tiles: np.ndarray, walls: np.ndarray, multitile_offsets: np.ndarray) -> np.ndarray:
+    """
+    Packs the tile id, wall id and multitile offset of every cell into one int64 so cells can be compared at once
+    """
+    return (
+            (tiles.astype(np.int64) << 32)
+            | ((walls.astype(np.int64) & 0xFFFF) << 16)
+            | (multitile_offsets.astype(np.int64) & 0xFFFF)
+    )
+
+
+class PaletteChunk:
+    """
+    A block of cells stored as one (tile id, wall id, multitile offset) cell when the whole block holds it, and as a
+    palette of its distinct cells plus the palette index of every cell otherwise. A uniform chunk turns into a
+    palette chunk the first time one of its cells is set to something else
+    """
+
+    def __init__(self, width: int, height: int, palette: list[tuple[int, int, int]], indices: np.ndarray | None = None):
+        self.width = width
+        self.height = height
+        self.palette = palette
+        self.palette_lookup: dict[tuple[int, int, int], int] = {cell: index for index, cell in enumerate(palette)}
+        # Palette index of every cell indexed [x, y], None while the chunk is uniform
+        self.indices = indices
+
+    @classmethod
+    def from_planes(cls, tiles: np.ndarray, walls: np.ndarray, multitile_offsets: np.ndarray) -> "PaletteChunk":
+        packed = pack_cells(tiles, walls, multitile_offsets)
+        palette_values, indices = np.unique(packed, return_inverse=True)
+        palette_cells = np.stack((palette_values >> 32, palette_values >> 16, palette_values), axis=1)
+        palette = [tuple(cell) for cell in palette_cells.astype(np.uint16).view(np.int16).tolist()]
+        if len(palette) == 1:
+            return cls(tiles.shape[0], tiles.shape[1], palette)
+        index_dtype = np.uint8 if len(palette) <= 256 else np.uint16
+        return cls(tiles.shape[0], tiles.shape[1], palette, indices.reshape(tiles.shape).astype(index_dtype))
+
+    @property
+    def uniform(self) -> bool:
+        return self.indices is None
+
+    def get_cell(self, x: int, y: int) -> tuple[int, int, int]:
+        if self.indices is None:
+            return self.palette[0]
+        return self.palette[self.indices.item(x, y)]
+
+    def set_cell(self, x: int, y: int, cell: tuple[int, int, int]) -> None:
+        index = self.palette_lookup.get(cell)
+        if index is None:
+            index = len(self.palette)
+            self.palette.append(cell)
+            self.palette_lookup[cell] = index
+            if index == 256 and self.indices is not None:
+                self.indices = self.indices.astype(np.uint16)
+        if self.indices is None:
+            if index == 0:
+                return
+            self.indices = np.zeros((self.width, self.height), dtype=np.uint8 if len(self.palette) <= 256 else np.uint16)
+        self.indices[x, y] = index
+
+    def to_planes(self) -> np.ndarray:
+        """
+        Returns the tile, wall and multitile offset planes of the chunk stacked in one array
+        """
+        palette = np.array(self.palette, dtype=np.int16)
+        planes = np.empty((3, self.width, self.height), dtype=np.int16)
+        for layer in range(3):
+            if self.indices is None:
+                planes[layer] = palette[0, layer]
+            else:
+                planes[layer] = palette[:, layer].take(self.indices)
+        return planes
+
+    def compacted(self) -> "PaletteChunk":
+        """
+        Returns the chunk without the palette entries no cell uses anymore, uniform again if only one is left
+        """
+        if self.indices is None:
+            return self
+        used_indices, indices = np.unique(self.indices, return_inverse=True)
+        palette = [self.palette[index] for index in used_indices.tolist()]
+        if len(palette) == 1:
+            return PaletteChunk(self.width, self.height, palette)
+        index_dtype = np.uint8 if len(palette) <= 256 else np.uint16
+        return PaletteChunk(self.width, self.height, palette, indices.reshape(self.indices.shape).astype(index_dtype))
+
+    def encode(self, compression_level: int) -> bytes:
+        chunk = self.compacted()
+        index_size = 0 if chunk.indices is None else chunk.indices.dtype.itemsize
+        data = np.array(chunk.palette, dtype=PALETTE_CELL_DTYPE).tobytes()
+        if chunk.indices is not None:
+            data += chunk.indices.astype(chunk.indices.dtype.newbyteorder("<")).tobytes()
+        return struct.pack(PALETTE_CHUNK_HEADER_FORMAT, index_size, len(chunk.palette)) + zlib.compress(data, compression_level)
+
+    @classmethod
+    def decode(cls, data: bytes, width: int, height: int) -> "PaletteChunk":
+        index_size, palette_length = struct.unpack(PALETTE_CHUNK_HEADER_FORMAT, data[:PALETTE_CHUNK_HEADER_SIZE])
+        data = zlib.decompress(data[PALETTE_CHUNK_HEADER_SIZE:])
+        palette_size = palette_length * 3 * PALETTE_CELL_DTYPE.itemsize
+        palette = [tuple(cell) for cell in np.frombuffer(data[:palette_size], dtype=PALETTE_CELL_DTYPE).reshape(-1, 3).tolist()]
+        if index_size == 0:
+            return cls(width, height, palette)
+        index_dtype = np.dtype("<u1" if index_size == 1 else "<u2")
+        indices = np.frombuffer(data[palette_size:], dtype=index_dtype).reshape(width, height).copy()
+        return cls(width, height, palette, indices)
+
+    def get_size_bytes(self) -> int:
+        palette_size = len(self.palette) * 3 * PALETTE_CELL_DTYPE.itemsize
+        return palette_size + (0 if self.indices is None else self.indices.nbytes)
+
+
+class TileGrid:
+    """
+    Stores the tile and wall ids of a world in compact int16 planes indexed [x, y]
+    """
+
+    def __init__(self, width: int, height: int, tile_id: int = 0, wall_id: int = 0):
+        self.tiles = np.full((width, height), tile_id, dtype=np.int16)
+        self.walls = np.full((width, height), wall_id, dtype=np.int16)
+        # Offset of each multitile cell from its origin packed as (x << 8) | y, NO_MULTITILE_OFFSET elsewhere
+        self.multitile_offsets = np.full((width, height), NO_MULTITILE_OFFSET, dtype=np.int16)
+        # Save chunks changed since the grid was last written, all of them until it has been written once
+        self.dirty_chunks: set[tuple[int, int]] = set()
+        self.all_dirty = True
+
+    @property
+    def width(self) -> int:
+        return self.tiles.shape[0]
+
+    @property
+    def height(self) -> int:
+        return self.tiles.shape[1]
+
+    def get_tile(self, x: int, y: int) -> int:
+        return self.tiles.item(x, y)
+
+    def set_tile(self, x: int, y: int, tile_id: int) -> None:
+        self.tiles[x, y] = tile_id
+        self.mark_dirty(x, y)
+
+    def get_wall(self, x: int, y: int) -> int:
+        return self.walls.item(x, y)
+
+    def set_wall(self, x: int, y: int, wall_id: int) -> None:
+        self.walls[x, y] = wall_id
+        self.mark_dirty(x, y)
+
+    def get(self, x: int, y: int, layer: int) -> int:
+        """
+        Returns the tile (layer 0) or wall (layer 1) id at the given position
+        """
+        if layer == 0:
+            return self.tiles.item(x, y)
+        return self.walls.item(x, y)
+
+    def get_multitile_offset(self, x: int, y: int) -> tuple[int, int] | None:
+        """
+        Returns the offset of a multitile cell from the multitile's origin, or None if the cell is not part of one
+        """
+        packed = self.multitile_offsets.item(x, y)
+        if packed == NO_MULTITILE_OFFSET:
+            return None
+        return packed >> 8, packed & 0xFF
+
+    def set_multitile_offset(self, x: int, y: int, offset: tuple[int, int]) -> None:
+        self.multitile_offsets[x, y] = (offset[0] << 8) | offset[1]
+        self.mark_dirty(x, y)
+
+    def clear_multitile_offset(self, x: int, y: int) -> None:
+        self.multitile_offsets[x, y] = NO_MULTITILE_OFFSET
+        self.mark_dirty(x, y)
+
+    def mark_dirty(self, x: int, y: int) -> None:
+        """
+        Flags the save chunk containing the given position as needing to be written
+        """
+        chunk_size = game_constants.WORLD_FILE_CHUNK_SIZE
+        self.dirty_chunks.add((x // chunk_size, y // chunk_size))
+
+    def clear_dirty(self) -> None:
+        self.dirty_chunks.clear()
+        self.all_dirty = False
+
+    def get_chunk(self, chunk_x: int, chunk_y: int, chunk_size: int) -> PaletteChunk:
+        area = (
+            slice(chunk_x * chunk_size, (chunk_x + 1) * chunk_size),
+            slice(chunk_y * chunk_size, (chunk_y + 1) * chunk_size),
+        )
+        return PaletteChunk.from_planes(self.tiles[area], self.walls[area], self.multitile_offsets[area])
+
+    def remap_ids(self, tile_id_remap: np.ndarray, wall_id_remap: np.ndarray) -> None:
+        """
+        Replaces every tile and wall id with the id at its position in the remap arrays
+        """
+        self.tiles = tile_id_remap[self.tiles]
+        self.walls = wall_id_remap[self.walls]
+
+    def sample(self, step: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the tile and wall ids of every step-th cell along both axes
+        """
+        return self.tiles[::step, ::step], self.walls[::step, ::step]
+
+    def get_size_bytes(self) -> int:
+        return self.tiles.nbytes + self.walls.nbytes + self.multitile_offsets.nbytes
+
+    def to_palette_grid(self) -> "PaletteTileGrid":
+        chunk_size = game_constants.WORLD_FILE_CHUNK_SIZE
+        palette_grid = PaletteTileGrid(self.width, self.height, [
+            [self.get_chunk(chunk_x, chunk_y, chunk_size) for chunk_y in range(-(-self.height // chunk_size))]
+            for chunk_x in range(-(-self.width // chunk_size))
+        ])
+        palette_grid.dirty_chunks = set(self.dirty_chunks)
+        palette_grid.all_dirty = self.all_dirty
+        return palette_grid
+
+    @classmethod
+    def from_planes(cls, tiles: np.ndarray, walls: np.ndarray, multitile_offsets: np.ndarray) -> "TileGrid":
+        """
+        Builds a grid around existing tile, wall and multitile offset planes
+        """
+        grid = cls(0, 0)
+        grid.tiles = tiles
+        grid.walls = walls
+        grid.multitile_offsets = multitile_offsets
+        return grid
+
+    @classmethod
+    def from_nested(cls, tile_data: list[list[list]]) -> "TileGrid":
+        """
+        Builds a grid from the old [x][y] -> [tile_id, wall_id, (offset)] nested list format
+        """
+        grid = cls(len(tile_data), len(tile_data[0]))
+        for x, column in enumerate(tile_data):
+            grid.tiles[x] = [cell[0] for cell in column]
+            grid.walls[x] = [cell[1] for cell in column]
+            for y, cell in enumerate(column):
+                if len(cell) > 2:
+                    grid.set_multitile_offset(x, y, cell[2])
+        return grid
+
+
+class PaletteTileGrid:
+    """
+    A TileGrid kept as save chunk sized PaletteChunks, which takes a fraction of the memory of the full planes for
+    worlds that are only looked at or edited a few cells at a time
+    """
+
+    def __init__(self, width: int, height: int, chunks: list[list[PaletteChunk]]):
+        self.width = width
+        self.height = height
+        # Chunks of WORLD_FILE_CHUNK_SIZE cells along each side, indexed [chunk x][chunk y]
+        self.chunks = chunks
+        self.dirty_chunks: set[tuple[int, int]] = set()
+        self.all_dirty = True
+
+    def get_cell(self, x: int, y: int) -> tuple[int, int, int]:
+        chunk_size = game_constants.WORLD_FILE_CHUNK_SIZE
+        return self.chunks[x // chunk_size][y // chunk_size].get_cell(x % chunk_size, y % chunk_size)
+
+    def set_cell(self, x: int, y: int, cell: tuple[int, int, int]) -> None:
+        chunk_size = game_constants.WORLD_FILE_CHUNK_SIZE
+        self.chunks[x // chunk_size][y // chunk_size].set_cell(x % chunk_size, y % chunk_size, cell)
+        self.mark_dirty(x, y)
+
+    def get_tile(self, x: int, y: int) -> int:
+        return self.get_cell(x, y)[0]
+
+    def set_tile(self, x: int, y: int, tile_id: int) -> None:
+        _, wall_id, multitile_offset = self.get_cell(x, y)
+        self.set_cell(x, y, (tile_id, wall_id, multitile_offset))
+
+    def get_wall(self, x: int, y: int) -> int:
+        return self.get_cell(x, y)[1]
+
+    def set_wall(self, x: int, y: int, wall_id: int) -> None:
+        tile_id, _, multitile_offset = self.get_cell(x, y)
+        self.set_cell(x, y, (tile_id, wall_id, multitile_offset))
+
+    def get(self, x: int, y: int, layer: int) -> int:
+        return self.get_cell(x, y)[layer]
+
+    def get_multitile_offset(self, x: int, y: int) -> tuple[int, int] | None:
+        packed = self.get_cell(x, y)[2]
+        if packed == NO_MULTITILE_OFFSET:
+            return None
+        return packed >> 8, packed & 0xFF
+
+    def set_multitile_offset(self, x: int, y: int, offset: tuple[int, int]) -> None:
+        tile_id, wall_id, _ = self.get_cell(x, y)
+        self.set_cell(x, y, (tile_id, wall_id, (offset[0] << 8) | offset[1]))
+
+    def clear_multitile_offset(self, x: int, y: int) -> None:
+        tile_id, wall_id, _ = self.get_cell(x, y)
+        self.set_cell(x, y, (tile_id, wall_id, NO_MULTITILE_OFFSET))
+
+    def mark_dirty(self, x: int, y: int) -> None:
+        chunk_size = game_constants.WORLD_FILE_CHUNK_SIZE
+        self.dirty_chunks.add((x // chunk_size, y // chunk_size))
+
+    def clear_dirty(self) -> None:
+        self.dirty_chunks.clear()
+        self.all_dirty = False
+
+    def get_chunk(self, chunk_x: int, chunk_y: int, chunk_size: int) -> PaletteChunk:
+        if chunk_size != game_constants.WORLD_FILE_CHUNK_SIZE:
+            raise ValueError("Palette grids can only be split into chunks of their own size")
+        return self.chunks[chunk_x][chunk_y]
+
+    def remap_ids(self, tile_id_remap: np.ndarray, wall_id_remap: np.ndarray) -> None:
+        """
+        Replaces every tile and wall id with the id at its position in the remap arrays, only touching the palettes
+        """
+        for column in self.chunks:
+            for chunk in column:
+                chunk.palette = [
+                    (int(tile_id_remap[tile_id]), int(wall_id_remap[wall_id]), multitile_offset)
+                    for tile_id, wall_id, multitile_offset in chunk.palette
+                ]
+                chunk.palette_lookup = {cell: index for index, cell in enumerate(chunk.palette)}
+
+    def sample(self, step: int) -> tuple[np.ndarray, np.ndarray]:
+        tiles = np.empty((-(-self.width // step), -(-self.height // step)), dtype=np.int16)
+        walls = np.empty_like(tiles)
+        for x in range(0, self.width, step):
+            for y in range(0, self.height, step):
+                tile_id, wall_id, _ = self.get_cell(x, y)
+                tiles[x // step, y // step] = tile_id
+                walls[x // step, y // step] = wall_id
+        return tiles, walls
+
+    def to_tile_grid(self) -> TileGrid:
+        tile_grid = TileGrid(self.width, self.height)
+        chunk_size = game_constants.WORLD_FILE_CHUNK_SIZE
+        for chunk_x, column in enumerate(self.chunks):
+            for chunk_y, chunk in enumerate(column):
+                area = (
+                    slice(chunk_x * chunk_size, (chunk_x + 1) * chunk_size),
+                    slice(chunk_y * chunk_size, (chunk_y + 1) * chunk_size),
+                )
+                tile_grid.tiles[area], tile_grid.walls[area], tile_grid.multitile_offsets[area] = chunk.to_planes()
+        tile_grid.dirty_chunks = set(self.dirty_chunks)
+        tile_grid.all_dirty = self.all_dirty
+        return tile_grid
+
+    def get_size_bytes(self) -> int:
+        return sum(chunk.get_size_bytes() for column in self.chunks for chunk in column)
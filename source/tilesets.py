@@ -1,9 +1,14 @@
 import pygame
 
+import asset_manager
 import commons
 
 
 class Tileset:
+    """
+    Frames cut out of a sprite sheet, which is only loaded and sliced the first time a frame is asked for
+    """
+
     def __init__(
             self,
             folder_path: str,
@@ -20,33 +25,51 @@ class Tileset:
             colorkey: pygame.Color | None = None,
             alpha: int = 255,
     ) -> None:
-        self.tileset: list[pygame.Surface] = []
-        image: pygame.Surface = pygame.image.load(folder_path).convert_alpha()
-        for column in range(columns):
-            for row in range(rows):
+        self.folder_path: str = folder_path
+        self.width: int = width
+        self.height: int = height
+        self.rows: int = rows
+        self.columns: int = columns
+        self.x_spacing: int = x_spacing
+        self.y_spacing: int = y_spacing
+        self.x_offset: int = x_offset
+        self.y_offset: int = y_offset
+        self.scale_width: int | None = scale_width
+        self.scale_height: int | None = scale_height
+        self.colorkey: pygame.Color | None = colorkey
+        self.alpha: int = alpha
+        self.tileset: list[pygame.Surface] | None = None
+
+    def load(self) -> None:
+        self.tileset = []
+        image: pygame.Surface = asset_manager.load_image(self.folder_path)
+        for column in range(self.columns):
+            for row in range(self.rows):
                 surface = pygame.Surface(
-                    (width, height),
+                    (self.width, self.height),
                     pygame.SRCALPHA,
                 )
                 surface.blit(
                     image,
                     (
-                        -row * (width + x_spacing) - x_offset,
-                        -column * (height + y_spacing) - y_offset,
+                        -row * (self.width + self.x_spacing) - self.x_offset,
+                        -column * (self.height + self.y_spacing) - self.y_offset,
                     ),
                 )
                 surface = pygame.transform.scale(
                     surface,
                     (
-                        scale_width if scale_width is not None else surface.get_width(),
-                        scale_height if scale_height is not None else surface.get_height(),
+                        self.scale_width if self.scale_width is not None else surface.get_width(),
+                        self.scale_height if self.scale_height is not None else surface.get_height(),
                     ),
                 )
-                surface.set_colorkey(colorkey)
-                surface.set_alpha(alpha)
+                surface.set_colorkey(self.colorkey)
+                surface.set_alpha(self.alpha)
                 self.tileset.append(surface)
 
     def __getitem__(self, index: int) -> pygame.Surface:
+        if self.tileset is None:
+            self.load()
         return self.tileset[index]
 
 
@@ -1,23 +1,29 @@
 import math
 import pickle
 import random
+from collections import OrderedDict
 from datetime import datetime
 from enum import Enum
 
+import numpy as np
 import pygame
 from pygame.locals import Rect
 
 import commons
 import entity_manager
+import game_constants
 import game_data
 import item
 import perlin
+import save_index
 import shared_methods
 import tilesets
+import world_file
 from background import BACKGROUND_DATA
 from commons import TileMaskType, TileTag
 from game_data import find_structures_for_connection, get_item_id_by_id_str
 from item import Item
+from tile_grid import PaletteTileGrid, TileGrid
 
 
 class WorldSize(Enum):
@@ -58,6 +64,64 @@ class MaskType(Enum):
     MIDDLE = 15
 
 
+# Bits of the neighbors a tile merges with
+MERGE_RIGHT = 8
+MERGE_BOTTOM = 4
+MERGE_LEFT = 2
+MERGE_TOP = 1
+MERGE_ALL = MERGE_RIGHT | MERGE_BOTTOM | MERGE_LEFT | MERGE_TOP
+
+# The mask type for every combination of merging neighbors
+MASK_TYPE_BY_NEIGHBORS: tuple[MaskType, ...] = (
+    MaskType.SINGLE,
+    MaskType.SINGLE_VERTICAL_BOT,
+    MaskType.SINGLE_HORIZONTAL_RIGHT,
+    MaskType.CORNER_BOT_RIGHT,
+    MaskType.SINGLE_VERTICAL_TOP,
+    MaskType.SINGLE_VERTICAL_MID,
+    MaskType.CORNER_TOP_RIGHT,
+    MaskType.RIGHT_MID,
+    MaskType.SINGLE_HORIZONTAL_LEFT,
+    MaskType.CORNER_BOT_LEFT,
+    MaskType.SINGLE_HORIZONTAL_MID,
+    MaskType.BOT_MID,
+    MaskType.CORNER_TOP_LEFT,
+    MaskType.LEFT_MID,
+    MaskType.TOP_MID,
+    MaskType.MIDDLE,
+)
+
+# The mask indices a tile of every type randomly picks from
+MASK_INDICES_BY_TYPE: dict[MaskType, tuple[int, int, int]] = {
+    MaskType.TOP_MID: (1, 2, 3),
+    MaskType.LEFT_MID: (0, 13, 26),
+    MaskType.BOT_MID: (27, 28, 29),
+    MaskType.RIGHT_MID: (4, 17, 30),
+    MaskType.SINGLE_VERTICAL_MID: (5, 18, 31),
+    MaskType.SINGLE_HORIZONTAL_MID: (58, 59, 60),
+    MaskType.SINGLE_VERTICAL_TOP: (6, 7, 8),
+    MaskType.SINGLE_VERTICAL_BOT: (45, 46, 47),
+    MaskType.SINGLE_HORIZONTAL_LEFT: (9, 22, 35),
+    MaskType.SINGLE_HORIZONTAL_RIGHT: (12, 25, 38),
+    MaskType.SINGLE: (48, 49, 50),
+    MaskType.CORNER_TOP_LEFT: (39, 41, 43),
+    MaskType.CORNER_TOP_RIGHT: (40, 42, 44),
+    MaskType.CORNER_BOT_LEFT: (52, 54, 56),
+    MaskType.CORNER_BOT_RIGHT: (53, 55, 57),
+    MaskType.MIDDLE: (14, 14, 14),
+}
+
+MASK_INDICES_BY_NEIGHBORS = tuple(MASK_INDICES_BY_TYPE[mask_type] for mask_type in MASK_TYPE_BY_NEIGHBORS)
+MASK_TYPE_BY_INDEX = {index: mask_type for mask_type, indices in MASK_INDICES_BY_TYPE.items() for index in indices}
+
+# The same tables as arrays for picking the masks of a whole map at once, unknown indices have no type
+MASK_INDEX_LOOKUP = np.array(MASK_INDICES_BY_NEIGHBORS, dtype=np.int8)
+MASK_TYPE_LOOKUP = np.array(
+    [MASK_TYPE_BY_INDEX[index].value if index in MASK_TYPE_BY_INDEX else -1 for index in range(max(MASK_TYPE_BY_INDEX) + 1)],
+    dtype=np.int8,
+)
+
+
 class World:
     """
     Stores data about the world
@@ -70,13 +134,13 @@ class World:
         self.size = WorldSize.TINY
         self.type = WorldType.NORMAL
         self.gen_type = WorldGenType.DEFAULT
+        self.seed: int | None = None
         self.state_flags = {}
         self.playtime = 0
         self.spawn_position = (0, 0)
         self.chest_data = []
         self.tile_id_str_lookup = []
-        self.tile_data: list[list[list[int]]] = []
-        self.tile_mask_data = []
+        self.tile_grid: TileGrid = TileGrid(0, 0)
 
     def get_creation_date_string(self):
         return str(self.creation_date)[:19]
@@ -114,6 +178,7 @@ class World:
             "size": self.size,
             "type": self.type,
             "gen_type": self.gen_type,
+            "seed": self.seed,
             "state_flags": self.state_flags,
             "playtime": self.playtime,
             "spawn_position": self.spawn_position,
@@ -122,17 +187,24 @@ class World:
             "wall_id_str_lookup": game_data.get_current_wall_id_str_lookup(),
         }
 
-        pickle.dump(save_map, open(f"assets/worlds/{self.name}.dat", "wb"))  # save dat
-        pickle.dump(self.tile_data, open(f"assets/worlds/{self.name}.wrld", "wb"))  # save wrld
-
-    def load(self, world_name, load_all=True):
-        save_map = pickle.load(open(f"assets/worlds/{world_name}.dat", "rb"))  # opens the selected save dat file
+        pickle.dump(save_map, open(f"{WORLD_SAVE_DIRECTORY}/{self.name}.dat", "wb"))  # save dat
+        world_file.save_tile_grid(
+            f"{WORLD_SAVE_DIRECTORY}/{self.name}.wrld",
+            self.tile_grid,
+            save_map["tile_id_str_lookup"],
+            save_map["wall_id_str_lookup"],
+        )  # save wrld
+        save_index.update_world_entry(self)
+
+    def load(self, world_name, load_all=True, compact=False):
+        save_map = pickle.load(open(f"{WORLD_SAVE_DIRECTORY}/{world_name}.dat", "rb"))  # opens the selected save dat file
         self.name = save_map["name"]
         self.creation_date = save_map["creation_date"]
         self.last_played_date = save_map["last_played_date"]
         self.size = save_map["size"]
         self.type = save_map["type"]
         self.gen_type = save_map["gen_type"]
+        self.seed = save_map.get("seed")  # Worlds saved before seeds were stored have none
         self.state_flags = save_map["state_flags"]
         self.playtime = save_map["playtime"]
         self.spawn_position = save_map["spawn_position"]
@@ -155,30 +227,51 @@ class World:
                     chest_item.assign_prefix(loaded_item_data[3])
                     self.chest_data[chest_data_index][1][loaded_item_data[0]] = chest_item
 
-            # Open selected save wrld file
-            self.tile_data = pickle.load(open(f"assets/worlds/{world_name}.wrld", "rb"))
+            # Open selected save wrld file, converting worlds saved with pickle
+            wrld_path = f"{WORLD_SAVE_DIRECTORY}/{world_name}.wrld"
+            if world_file.is_world_file(wrld_path):
+                self.tile_grid, tile_palette, wall_palette = world_file.load_tile_grid(wrld_path, compact)
+            else:
+                tile_grid = pickle.load(open(wrld_path, "rb"))
+                if isinstance(tile_grid, TileGrid):
+                    tile_grid = TileGrid.from_planes(tile_grid.tiles, tile_grid.walls, tile_grid.multitile_offsets)
+                else:
+                    tile_grid = TileGrid.from_nested(tile_grid)
+                self.tile_grid = tile_grid.to_palette_grid() if compact else tile_grid
+                tile_palette = save_map["tile_id_str_lookup"]
+                wall_palette = save_map["wall_id_str_lookup"]
 
             # And replace the tile and wall values with updated ones
-            tile_id_str_lookup = save_map["tile_id_str_lookup"]
-            wall_id_str_lookup = save_map["wall_id_str_lookup"]
-
-            for tile_column_index in range(len(self.tile_data)):
-                for tile_row_index in range(len(self.tile_data[tile_column_index])):
-                    existing_tile_id_str = tile_id_str_lookup[self.tile_data[tile_column_index][tile_row_index][0]]
-                    self.tile_data[tile_column_index][tile_row_index][0] = game_data.get_tile_id_by_id_str(
-                        existing_tile_id_str
-                    )
-
-                    existing_wall_id_str = wall_id_str_lookup[self.tile_data[tile_column_index][tile_row_index][1]]
-                    self.tile_data[tile_column_index][tile_row_index][1] = game_data.get_wall_id_by_id_str(
-                        existing_wall_id_str
-                    )
-
+            tile_id_remap = np.array([game_data.get_tile_id_by_id_str(id_str) for id_str in tile_palette], dtype=np.int16)
+            wall_id_remap = np.array([game_data.get_wall_id_by_id_str(id_str) for id_str in wall_palette], dtype=np.int16)
+            self.tile_grid.remap_ids(tile_id_remap, wall_id_remap)
 
 WORLD_SIZE_X = 0
 WORLD_SIZE_Y = 0
 
-terrain_surface = pygame.Surface((0, 0))
+# Rendered terrain chunk surfaces keyed by chunk position, least recently used first
+terrain_chunks: OrderedDict[tuple[int, int], pygame.Surface] = OrderedDict()
+terrain_chunks_size_bytes = 0
+
+# Composited tile over wall cell images keyed by (tile id, wall id, tile mask, wall mask, multitile offset)
+terrain_cell_cache: OrderedDict[tuple, pygame.Surface | None] = OrderedDict()
+terrain_cell_cache_hits = 0
+terrain_cell_cache_misses = 0
+
+# Directory world saves are read from and written to
+WORLD_SAVE_DIRECTORY = "assets/worlds"
+
+# Average color of every tile and wall id used to draw world thumbnails, built on first use
+tile_map_colors: np.ndarray | None = None
+wall_map_colors: np.ndarray | None = None
+
+# Merge lookups of the tile and wall ids and whether every tile id is drawn as arrays, built on first use
+tile_merge_lookup: np.ndarray | None = None
+wall_merge_lookup: np.ndarray | None = None
+tile_draw_lookup: np.ndarray | None = None
+
+# Incremented whenever tiles change so data derived from the terrain knows to rebuild
+terrain_revision = 0
 
 border_down = 0
 border_up = 0
@@ -244,29 +337,29 @@ def get_neighbor_count(i, j, tile=0, check_adjacent=True, check_center_tile=True
     if check_adjacent:
         # Left block
         if tile_in_map(i - 1, j):
-            if world.tile_data[i - 1][j][tile] != air_value:
+            if world.tile_grid.get(i - 1, j, tile) != air_value:
                 neighbor_count += 1
         # Right block
         if tile_in_map(i + 1, j):
-            if world.tile_data[i + 1][j][tile] != air_value:
+            if world.tile_grid.get(i + 1, j, tile) != air_value:
                 neighbor_count += 1
         # Top block
         if tile_in_map(i, j - 1):
-            if world.tile_data[i][j - 1][tile] != air_value:
+            if world.tile_grid.get(i, j - 1, tile) != air_value:
                 neighbor_count += 1
         # Bottom block
         if tile_in_map(i, j + 1):
-            if world.tile_data[i][j + 1][tile] != air_value:
+            if world.tile_grid.get(i, j + 1, tile) != air_value:
                 neighbor_count += 1
     if check_center_tile:
         # Block at pos
         if tile_in_map(i, j):
-            if world.tile_data[i][j][0] != air_value:
+            if world.tile_grid.get_tile(i, j) != air_value:
                 neighbor_count += 1
     if check_center_wall:
         # Wall behind block
         if tile_in_map(i, j):
-            if world.tile_data[i][j][1] != air_value:
+            if world.tile_grid.get_wall(i, j) != air_value:
                 neighbor_count += 1
 
     return neighbor_count
@@ -276,186 +369,110 @@ def check_tile_merge(tile_id_1, tile_id_2):
     """
     Checks if the two tile ids should merge with each other
     """
-    tile_1 = game_data.get_tile_by_id(tile_id_1)
-    tile_2 = game_data.get_tile_by_id(tile_id_2)
-
-    if tile_1.id_str in tile_2.mask_merge_ids or tile_1.id_str == tile_2.id_str:
-        return True
-    return False
+    return game_data.tile_id_merge_lookup[tile_id_2][tile_id_1]
 
 
 def check_wall_merge(wall_id_1, wall_id_2):
     """
     Checks if the two wall ids should merge with each other
     """
-    wall_1 = game_data.get_wall_by_id(wall_id_1)
-    wall_2 = game_data.get_wall_by_id(wall_id_2)
-
-    if wall_1.id_str in wall_2.mask_merge_ids or wall_1.id_str == wall_2.id_str:
-        return True
-    return False
+    return game_data.wall_id_merge_lookup[wall_id_2][wall_id_1]
 
 
-def get_mask_type_from_adjacent_blocks(adjacent_blocks):
-    """
-    Returns the mask type given an array of the surrounding blocks
-    """
-    match adjacent_blocks:
-        case [0, 0, 0, 0]:
-            return MaskType.SINGLE
-        case [0, 0, 0, 1]:
-            return MaskType.SINGLE_VERTICAL_BOT
-        case [0, 0, 1, 0]:
-            return MaskType.SINGLE_HORIZONTAL_RIGHT
-        case [0, 0, 1, 1]:
-            return MaskType.CORNER_BOT_RIGHT
-        case [0, 1, 0, 0]:
-            return MaskType.SINGLE_VERTICAL_TOP
-        case [0, 1, 0, 1]:
-            return MaskType.SINGLE_VERTICAL_MID
-        case [0, 1, 1, 0]:
-            return MaskType.CORNER_TOP_RIGHT
-        case [0, 1, 1, 1]:
-            return MaskType.RIGHT_MID
-        case [1, 0, 0, 0]:
-            return MaskType.SINGLE_HORIZONTAL_LEFT
-        case [1, 0, 0, 1]:
-            return MaskType.CORNER_BOT_LEFT
-        case [1, 0, 1, 0]:
-            return MaskType.SINGLE_HORIZONTAL_MID
-        case [1, 0, 1, 1]:
-            return MaskType.BOT_MID
-        case [1, 1, 0, 0]:
-            return MaskType.CORNER_TOP_LEFT
-        case [1, 1, 0, 1]:
-            return MaskType.LEFT_MID
-        case [1, 0, 1, 0]:
-            return MaskType.SINGLE_HORIZONTAL_MID
-        case [0, 1, 1, 1]:
-            return MaskType.LEFT_MID
-        case [1, 1, 1, 1]:
-            return MaskType.MIDDLE
-        case [1, 1, 1, 0]:
-            return MaskType.TOP_MID
-    raise ValueError(f"Unknown mask type: {adjacent_blocks}")
-
-
-def get_mask_index_from_type(mask_type):
-    """
-    Returns a random mask index for the given type
-    """
-    match mask_type:
-        case MaskType.TOP_MID:
-            return random.randint(1, 3)
-        case MaskType.LEFT_MID:
-            return int(random.randint(0, 2) * 13)
-        case MaskType.BOT_MID:
-            return random.randint(27, 29)
-        case MaskType.RIGHT_MID:
-            return int(random.randint(0, 2) * 13) + 4
-        case MaskType.SINGLE_VERTICAL_MID:
-            return int(random.randint(0, 2) * 13) + 5
-        case MaskType.SINGLE_HORIZONTAL_MID:
-            return random.randint(58, 60)
-        case MaskType.SINGLE_VERTICAL_TOP:
-            return random.randint(6, 8)
-        case MaskType.SINGLE_VERTICAL_BOT:
-            return random.randint(45, 47)
-        case MaskType.SINGLE_HORIZONTAL_LEFT:
-            return int(random.randint(0, 2) * 13) + 9
-        case MaskType.SINGLE_HORIZONTAL_RIGHT:
-            return int(random.randint(0, 2) * 13) + 12
-        case MaskType.SINGLE:
-            return random.randint(48, 50)
-        case MaskType.CORNER_TOP_LEFT:
-            return 39 + int(random.randint(0, 2) * 2)
-        case MaskType.CORNER_TOP_RIGHT:
-            return 40 + int(random.randint(0, 2) * 2)
-        case MaskType.CORNER_BOT_LEFT:
-            return 52 + int(random.randint(0, 2) * 2)
-        case MaskType.CORNER_BOT_RIGHT:
-            return 53 + int(random.randint(0, 2) * 2)
-        case MaskType.MIDDLE:
-            return 14
-    raise ValueError(f"Unknown mask type: {mask_type}")
+def get_mask_index_from_neighbors(neighbors):
+    """
+    Returns a random mask index for the given bits of merging neighbors
+    """
+    return MASK_INDICES_BY_NEIGHBORS[neighbors][random.randint(0, 2)]
 
 
 def get_mask_type_from_index(index):
     """
     Returns the type of a given mask index
     """
-    if index == 1 or index == 2 or index == 3:
-        return MaskType.TOP_MID
-    elif index == 0 or index == 13 or index == 26:
-        return MaskType.LEFT_MID
-    elif index == 27 or index == 28 or index == 29:
-        return MaskType.BOT_MID
-    elif index == 4 or index == 17 or index == 30:
-        return MaskType.RIGHT_MID
-    elif index == 5 or index == 18 or index == 31:
-        return MaskType.SINGLE_VERTICAL_MID
-    elif index == 58 or index == 59 or index == 60:
-        return MaskType.SINGLE_HORIZONTAL_MID
-    elif index == 6 or index == 7 or index == 8:
-        return MaskType.SINGLE_VERTICAL_TOP
-    elif index == 45 or index == 46 or index == 47:
-        return MaskType.SINGLE_VERTICAL_TOP
-    elif index == 9 or index == 22 or index == 35:
-        return MaskType.SINGLE_HORIZONTAL_LEFT
-    elif index == 12 or index == 25 or index == 38:
-        return MaskType.SINGLE_HORIZONTAL_RIGHT
-    elif index == 48 or index == 49 or index == 50:
-        return MaskType.SINGLE
-    elif index == 39 or index == 41 or index == 43:
-        return MaskType.CORNER_TOP_LEFT
-    elif index == 40 or index == 42 or index == 44:
-        return MaskType.CORNER_TOP_RIGHT
-    elif index == 52 or index == 54 or index == 56:
-        return MaskType.CORNER_BOT_LEFT
-    elif index == 53 or index == 55 or index == 57:
-        return MaskType.CORNER_BOT_RIGHT
-    else:
-        return None
+    return MASK_TYPE_BY_INDEX.get(index)
 
 
 def get_wall_mask_index_from_pos(i, j, wall_id):
     """
     Returns the index of the mask for the wall at a given position
     """
-    merge_blocks = [1, 1, 1, 1]
-    if i > 0:
-        if not check_wall_merge(world.tile_data[i - 1][j][1], wall_id):
-            merge_blocks[2] = 0
-    if i < WORLD_SIZE_X - 1:
-        if not check_wall_merge(world.tile_data[i + 1][j][1], wall_id):
-            merge_blocks[0] = 0
-    if j > 0:
-        if not check_wall_merge(world.tile_data[i][j - 1][1], wall_id):
-            merge_blocks[3] = 0
-    if j < WORLD_SIZE_Y - 1:
-        if not check_wall_merge(world.tile_data[i][j + 1][1], wall_id):
-            merge_blocks[1] = 0
-    return get_mask_index_from_type(get_mask_type_from_adjacent_blocks(merge_blocks))
+    merge_lookup = game_data.wall_id_merge_lookup[wall_id]
+    neighbors = MERGE_ALL
+    if i > 0 and not merge_lookup[world.tile_grid.get_wall(i - 1, j)]:
+        neighbors ^= MERGE_LEFT
+    if i < WORLD_SIZE_X - 1 and not merge_lookup[world.tile_grid.get_wall(i + 1, j)]:
+        neighbors ^= MERGE_RIGHT
+    if j > 0 and not merge_lookup[world.tile_grid.get_wall(i, j - 1)]:
+        neighbors ^= MERGE_TOP
+    if j < WORLD_SIZE_Y - 1 and not merge_lookup[world.tile_grid.get_wall(i, j + 1)]:
+        neighbors ^= MERGE_BOTTOM
+    return get_mask_index_from_neighbors(neighbors)
 
 
 def get_mask_index_from_pos(i, j, tile_id) -> int:
     """
     Returns the index of the mask for the block at a given position
     """
-    merge_blocks = [1, 1, 1, 1]
-    if i > 0:
-        if not check_tile_merge(world.tile_data[i - 1][j][0], tile_id):
-            merge_blocks[2] = 0
-    if i < WORLD_SIZE_X - 1:
-        if not check_tile_merge(world.tile_data[i + 1][j][0], tile_id):
-            merge_blocks[0] = 0
-    if j > 0:
-        if not check_tile_merge(world.tile_data[i][j - 1][0], tile_id):
-            merge_blocks[3] = 0
-    if j < WORLD_SIZE_Y - 1:
-        if not check_tile_merge(world.tile_data[i][j + 1][0], tile_id):
-            merge_blocks[1] = 0
-    return get_mask_index_from_type(get_mask_type_from_adjacent_blocks(merge_blocks))
+    merge_lookup = game_data.tile_id_merge_lookup[tile_id]
+    neighbors = MERGE_ALL
+    if i > 0 and not merge_lookup[world.tile_grid.get_tile(i - 1, j)]:
+        neighbors ^= MERGE_LEFT
+    if i < WORLD_SIZE_X - 1 and not merge_lookup[world.tile_grid.get_tile(i + 1, j)]:
+        neighbors ^= MERGE_RIGHT
+    if j > 0 and not merge_lookup[world.tile_grid.get_tile(i, j - 1)]:
+        neighbors ^= MERGE_TOP
+    if j < WORLD_SIZE_Y - 1 and not merge_lookup[world.tile_grid.get_tile(i, j + 1)]:
+        neighbors ^= MERGE_BOTTOM
+    return get_mask_index_from_neighbors(neighbors)
+
+
+def get_mask_lookups() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the tile and wall merge lookups and whether every tile id is drawn as arrays
+    """
+    global tile_merge_lookup, wall_merge_lookup, tile_draw_lookup
+    if tile_merge_lookup is None or wall_merge_lookup is None or tile_draw_lookup is None:
+        tile_merge_lookup = np.array(game_data.tile_id_merge_lookup, dtype=bool)
+        wall_merge_lookup = np.array(game_data.wall_id_merge_lookup, dtype=bool)
+        tile_draw_lookup = np.array([TileTag.NO_DRAW not in tile.tags for tile in game_data.json_tile_data], dtype=bool)
+    return tile_merge_lookup, wall_merge_lookup, tile_draw_lookup
+
+
+def get_neighbor_masks(ids: np.ndarray, merge_lookup: np.ndarray) -> np.ndarray:
+    """
+    Returns the bits of merging neighbors of every cell in the id array, neighbors outside the map always merge
+    """
+    right = np.ones(ids.shape, dtype=bool)
+    right[:-1, :] = merge_lookup[ids[:-1, :], ids[1:, :]]
+    bottom = np.ones(ids.shape, dtype=bool)
+    bottom[:, :-1] = merge_lookup[ids[:, :-1], ids[:, 1:]]
+    left = np.ones(ids.shape, dtype=bool)
+    left[1:, :] = merge_lookup[ids[1:, :], ids[:-1, :]]
+    top = np.ones(ids.shape, dtype=bool)
+    top[:, 1:] = merge_lookup[ids[:, 1:], ids[:, :-1]]
+    return right * MERGE_RIGHT | bottom * MERGE_BOTTOM | left * MERGE_LEFT | top * MERGE_TOP
+
+
+def compute_terrain_masks() -> None:
+    """
+    Picks the tile and wall masks of the whole map at once, so chunks don't have to work them out while rendering.
+    Masks are picked for every cell, including the ones that aren't drawn
+    """
+    global tile_mask_data, wall_tile_mask_data
+    tile_merge, wall_merge, tile_draw = get_mask_lookups()
+    tiles = world.tile_grid.tiles
+    walls = world.tile_grid.walls
+    generator = np.random.default_rng(random.getrandbits(32))
+
+    tile_masks = MASK_INDEX_LOOKUP[get_neighbor_masks(tiles, tile_merge), generator.integers(0, 3, tiles.shape)]
+    wall_masks = MASK_INDEX_LOOKUP[get_neighbor_masks(walls, wall_merge), generator.integers(0, 3, walls.shape)]
+    # Walls behind a drawn tile with a mask of the same type use the tile's mask
+    same_type = tile_draw[tiles] & (MASK_TYPE_LOOKUP[wall_masks] == MASK_TYPE_LOOKUP[tile_masks])
+    wall_masks = np.where(same_type, tile_masks, wall_masks)
+
+    tile_mask_data = tile_masks.tolist()
+    wall_tile_mask_data = wall_masks.tolist()
 
 
 def blit_generation_stage(string) -> None:
@@ -482,11 +499,159 @@ def blit_generation_stage(string) -> None:
     pygame.display.flip()
 
 
-def generate_terrain(gen_type, blit_progress=False) -> None:
+class WorldGenerator:
     """
-    Initializes all structures related to terrain and generates a map of the given size using the given generation type
+    Generates the terrain of a world from a seed. Every generation stage draws from its own random stream made from the
+    seed and the stage's name, so a stage gives the same result for a seed however much the other stages draw. The
+    terrain layers only depend on the seed and the position, so any region of them can be generated on its own
     """
-    global world, tile_mask_data, wall_tile_mask_data
+
+    def __init__(self, width: int, height: int, seed: int | None = None):
+        if seed is None:
+            seed = random.getrandbits(32)
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.noise_gen = perlin.SimplexNoise()
+        offset_random = self.get_random("noise_offsets")
+        self.noise_offsets = [offset_random.random() * 1000 for _ in range(3)]
+
+    def get_random(self, stage: str) -> random.Random:
+        """
+        Returns a new random stream for the given stage, the same one every time for the same seed
+        """
+        return random.Random(f"{self.seed}:{stage}")
+
+    def get_position_integers(self, stage: str, map_x: np.ndarray, map_y: np.ndarray, low: int, high: int) -> np.ndarray:
+        """
+        Returns a random integer from low up to but not including high for every position, by hashing the position
+        with the stage's stream instead of drawing in order
+        """
+        stage_key = np.uint64(self.get_random(stage).getrandbits(64))
+        map_x, map_y = np.broadcast_arrays(map_x.astype(np.uint64), map_y.astype(np.uint64))
+        hashed = (map_x * np.uint64(0x9E3779B97F4A7C15)) ^ (map_y * np.uint64(0xC2B2AE3D27D4EB4F)) ^ stage_key
+        hashed ^= hashed >> np.uint64(30)
+        hashed *= np.uint64(0xBF58476D1CE4E5B9)
+        hashed ^= hashed >> np.uint64(27)
+        hashed *= np.uint64(0x94D049BB133111EB)
+        hashed ^= hashed >> np.uint64(31)
+        return (hashed % np.uint64(high - low)).astype(np.int64) + low
+
+    def generate_layers(self, left: int, top: int, width: int, height: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the tiles and walls of the surface, cave and cavern layers of the default world in the given region
+        """
+        # The row above the region decides which soil tiles are topped
+        first_row = max(top - 1, 0)
+        map_x = np.arange(left, left + width, dtype=np.float64)[:, None]
+        map_y = np.arange(first_row, top + height, dtype=np.float64)[None, :]
+        shape = (width, top + height - first_row)
+
+        def noise_field(scale_x, scale_y, offset):
+            return self.noise_gen.noise2_array(map_x / scale_x + offset, map_y / scale_y + offset)
+
+        def jitter(stage, size):
+            return self.get_position_integers(stage, map_x, map_y, -size, size + 1)
+
+        # Per tile biome: 1 = snow, 0 = forest, 2 = desert, with jittered borders
+        biome = np.where(
+            map_x < self.width * 0.333333 + jitter("biome_border_1", 5),
+            1,
+            np.where(map_x < self.width * 0.666666 + jitter("biome_border_2", 5), 0, 2),
+        )
+
+        # Per tile layer masks, with jittered layer boundaries
+        caverns_2 = map_y > 350 + jitter("caverns_2", 5)
+        caverns_1 = ~caverns_2 & (map_y > 250 + jitter("caverns_1", 3))
+        caves_2 = ~caverns_2 & ~caverns_1 & (map_y > 200 + jitter("caves_2", 2))
+        caves_1 = ~caverns_2 & ~caverns_1 & ~caves_2 & (map_y > 95)
+        surface = ~caverns_2 & ~caverns_1 & ~caves_2 & ~caves_1
+
+        biome_tile_ids = np.array(
+            [[game_data.get_tile_id_by_id_str(tile_id_str) for tile_id_str in vals[0]] for vals in game_data.biome_tile_vals],
+            dtype=np.int16,
+        )
+        biome_wall_ids = np.array(
+            [[game_data.get_wall_id_by_id_str(wall_id_str) for wall_id_str in vals[1]] for vals in game_data.biome_tile_vals],
+            dtype=np.int16,
+        )
+        top_tile, soil_tile, rock_tile = (biome_tile_ids[biome, index] for index in range(3))
+        soil_wall, rock_wall = (biome_wall_ids[biome, index] for index in range(2))
+        air_tile = np.int16(game_data.air_tile_id)
+        air_wall = np.int16(game_data.air_wall_id)
+
+        noise_offsets = self.noise_offsets
+        cavern_noise = noise_field(30, 20, noise_offsets[2])
+        ore_noise = noise_field(30, 30, noise_offsets[0])
+        tunnel_noise = noise_field(100, 75, noise_offsets[1]) + noise_field(20, 8, noise_offsets[1]) * 0.2
+        dirt_noise = noise_field(15, 15, noise_offsets[0])
+        height_noise = noise_field(30, 20, noise_offsets[1])
+        hill_noise = self.noise_gen.noise2_array(map_x / 100 + noise_offsets[2], 0.1)
+
+        tiles = np.full(shape, air_tile, dtype=np.int16)
+        walls = np.full(shape, air_wall, dtype=np.int16)
+
+        # Caverns layer 2
+        solid = caverns_2 & (cavern_noise <= 0.1)
+        backed = caverns_2 & (cavern_noise <= 0.55)
+        tiles[solid] = rock_tile[solid]
+        walls[backed] = rock_wall[backed]
+
+        # Caverns layer 1
+        open_cave = np.abs(cavern_noise) < 0.2
+        walled_cave = ~open_cave & (np.abs(cavern_noise) < 0.4)
+        solid = caverns_1 & ~open_cave & ~walled_cave
+        soil = solid & (ore_noise > 0.5)
+        rock = solid & ~soil
+        tiles[soil] = soil_tile[soil]
+        walls[soil] = soil_wall[soil]
+        tiles[rock] = rock_tile[rock]
+        walls[rock] = rock_wall[rock]
+        walled = caverns_1 & walled_cave
+        walls[walled] = rock_wall[walled]
+
+        # Tier 2 small caves
+        walled = caves_2 & (cavern_noise > 0.3)
+        soil = caves_2 & ~walled & (ore_noise > 0.3)
+        rock = caves_2 & ~walled & ~soil
+        walls[walled] = rock_wall[walled]
+        tiles[soil] = soil_tile[soil]
+        walls[soil] = soil_wall[soil]
+        tiles[rock] = rock_tile[rock]
+        walls[rock] = rock_wall[rock]
+
+        # Tier 1 small caves
+        solid = caves_1 & ~(np.abs(tunnel_noise) < 0.2)
+        rock = solid & (dirt_noise > -0.75)
+        soil = solid & ~rock
+        tiles[rock] = rock_tile[rock]
+        tiles[soil] = soil_tile[soil]
+        walls[caves_1] = soil_wall[caves_1]
+
+        # Surface, topping soil that has air above it with the biome's top tile
+        ground = surface & (map_y >= height_noise * 5 + 60 + hill_noise * 30)
+        tunnel = ground & (np.abs(tunnel_noise) < 0.15)
+        soil = ground & ~tunnel & (dirt_noise > -0.6)
+        rock = ground & ~tunnel & ~soil
+        walls[tunnel] = soil_wall[tunnel]
+        tiles[soil] = soil_tile[soil]
+        walls[soil] = soil_wall[soil]
+        tiles[rock] = rock_tile[rock]
+        walls[rock] = rock_wall[rock]
+        air_above = np.ones(shape, dtype=bool)
+        air_above[:, 1:] = tiles[:, :-1] == air_tile
+        topped = soil & air_above
+        tiles[topped] = top_tile[topped]
+
+        return tiles[:, top - first_row:], walls[:, top - first_row:]
+
+
+def generate_terrain(gen_type, blit_progress=False, seed=None) -> None:
+    """
+    Initializes all structures related to terrain and generates a map of the given size using the given generation type.
+    The same seed always generates the same world, a random one is picked if no seed is given
+    """
+    global world, tile_mask_data, wall_tile_mask_data, structure_rectangles
 
     global biome_border_x_1, biome_border_x_2
     biome_border_x_1 = WORLD_SIZE_X * 0.333333
@@ -499,11 +664,9 @@ def generate_terrain(gen_type, blit_progress=False) -> None:
     border_down = int(WORLD_SIZE_Y * commons.BLOCK_SIZE - commons.BLOCK_SIZE * 1.5)
 
     world = World()
+    structure_rectangles = []
 
-    world.tile_data = [
-        [[game_data.air_tile_id, game_data.air_wall_id] for _ in range(WORLD_SIZE_Y)] for _ in range(WORLD_SIZE_X)
-    ]
-    world.tile_mask_data = [[[-1, -1] for _ in range(WORLD_SIZE_Y)] for _ in range(WORLD_SIZE_X)]
+    world.tile_grid = TileGrid(WORLD_SIZE_X, WORLD_SIZE_Y, game_data.air_tile_id, game_data.air_wall_id)
 
     date = datetime.now()
 
@@ -512,34 +675,19 @@ def generate_terrain(gen_type, blit_progress=False) -> None:
     world.last_played_date = date
     world.gen_type = gen_type
 
-    noise_gen = perlin.SimplexNoise()  # Create a NOISE object
-    noise_offsets = [
-        random.random() * 1000,
-        random.random() * 1000,
-        random.random() * 1000,
-    ]  # Randomly generate offsets
+    generator = WorldGenerator(WORLD_SIZE_X, WORLD_SIZE_Y, seed)
+    world.seed = generator.seed
+    noise_gen = generator.noise_gen
+    noise_offsets = generator.noise_offsets
 
     if gen_type == "ice caves":
-        world.tile_data = [[[-1, 0] for _ in range(WORLD_SIZE_X)] for _ in range(WORLD_SIZE_Y)]
-
-        for map_index_x in range(WORLD_SIZE_X):
-            for map_index_y in range(WORLD_SIZE_Y):
+        world.tile_grid = TileGrid(WORLD_SIZE_X, WORLD_SIZE_Y, -1, 0)
 
-                val = noise_gen.noise2(
-                    map_index_x / 15 + noise_offsets[0],
-                    map_index_y / 15 + noise_offsets[0],
-                )
-                if val > -0.2:
-                    val2 = noise_gen.noise2(
-                        map_index_x / 15 + noise_offsets[1],
-                        map_index_y / 15 + noise_offsets[1],
-                    )
-                    if val2 > 0.4:
-                        world.tile_data[map_index_x][map_index_y][0] = 2
-                    else:
-                        world.tile_data[map_index_x][map_index_y][0] = 3
-                else:
-                    world.tile_data[map_index_x][map_index_y][0] = -1
+        map_x = np.arange(WORLD_SIZE_X)[:, None] / 15
+        map_y = np.arange(WORLD_SIZE_Y)[None, :] / 15
+        val = noise_gen.noise2_array(map_x + noise_offsets[0], map_y + noise_offsets[0])
+        val2 = noise_gen.noise2_array(map_x + noise_offsets[1], map_y + noise_offsets[1])
+        world.tile_grid.tiles = np.where(val > -0.2, np.where(val2 > 0.4, 2, 3), -1).astype(np.int16)
 
     elif gen_type == "DEFAULT":
         print("Gen type: " + gen_type)
@@ -552,145 +700,12 @@ def generate_terrain(gen_type, blit_progress=False) -> None:
             + str(WORLD_SIZE_Y)
             + ")\n"
         )
+        print("Seed: " + str(generator.seed))
 
-        for map_index_x in range(WORLD_SIZE_X):
-            if blit_progress:
-                blit_generation_stage("Generating Terrain: " + str(round((map_index_x / WORLD_SIZE_X) * 100, 1)) + "%")
-
-            for map_index_y in range(WORLD_SIZE_Y):
-                if map_index_x < biome_border_x_1 + random.randint(-5, 5):
-                    biome = 1
-                elif map_index_x < biome_border_x_2 + random.randint(-5, 5):
-                    biome = 0
-                else:
-                    biome = 2
-
-                tile_value = "tile.none"
-                wall_value = "wall.none"
-
-                if map_index_y > 350 + random.randint(-5, 5):  # Caverns layer 2
-                    val = noise_gen.noise2(
-                        map_index_x / 30 + noise_offsets[2],
-                        map_index_y / 20 + noise_offsets[2],
-                    )
-                    if val > 0.55:
-                        tile_value = "tile.none"
-                        wall_value = "wall.none"
-                    elif val > 0.1:
-                        tile_value = "tile.none"
-                        wall_value = game_data.biome_tile_vals[biome][1][1]
-                    else:
-                        tile_value = game_data.biome_tile_vals[biome][0][2]
-                        wall_value = game_data.biome_tile_vals[biome][1][1]
-
-                elif map_index_y > 250 + random.randint(-3, 3):  # Caverns layer 1
-                    val = noise_gen.noise2(
-                        map_index_x / 30 + noise_offsets[2],
-                        map_index_y / 20 + noise_offsets[2],
-                    )
-                    val2 = noise_gen.noise2(
-                        map_index_x / 30 + noise_offsets[0],
-                        map_index_y / 30 + noise_offsets[0],
-                    )
-                    if -0.2 < val < 0.2:
-                        tile_value = "tile.none"
-                        wall_value = "wall.none"
-                    elif -0.4 < val < 0.4:
-                        tile_value = "tile.none"
-                        wall_value = game_data.biome_tile_vals[biome][1][1]
-                    elif val2 > 0.5:
-                        tile_value = game_data.biome_tile_vals[biome][0][1]
-                        wall_value = game_data.biome_tile_vals[biome][1][0]
-                    else:
-                        tile_value = game_data.biome_tile_vals[biome][0][2]
-                        wall_value = game_data.biome_tile_vals[biome][1][1]
+        if blit_progress:
+            blit_generation_stage("Generating Terrain")
 
-                elif map_index_y > 200 + random.randint(-2, 2):  # Tier 2 small caves
-                    val = noise_gen.noise2(
-                        map_index_x / 30 + noise_offsets[2],
-                        map_index_y / 20 + noise_offsets[2],
-                    )
-                    val2 = noise_gen.noise2(
-                        map_index_x / 30 + noise_offsets[0],
-                        map_index_y / 30 + noise_offsets[0],
-                    )
-                    if val > 0.3:
-                        tile_value = "tile.none"
-                        wall_value = game_data.biome_tile_vals[biome][1][1]
-                    elif val2 > 0.3:
-                        tile_value = game_data.biome_tile_vals[biome][0][1]
-                        wall_value = game_data.biome_tile_vals[biome][1][0]
-                    else:
-                        tile_value = game_data.biome_tile_vals[biome][0][2]
-                        wall_value = game_data.biome_tile_vals[biome][1][1]
-
-                elif map_index_y > 95:  # Tier 1 small caves
-                    val = (
-                            noise_gen.noise2(
-                                map_index_x / 100 + noise_offsets[1],
-                                map_index_y / 75 + noise_offsets[1],
-                            )
-                            + noise_gen.noise2(
-                        map_index_x / 20 + noise_offsets[1],
-                        map_index_y / 8 + noise_offsets[1],
-                    )
-                            * 0.2
-                    )
-                    val2 = noise_gen.noise2(
-                        map_index_x / 15 + noise_offsets[0],
-                        map_index_y / 15 + noise_offsets[0],
-                    )
-
-                    if -0.2 < val < 0.2:
-                        tile_value = "tile.none"
-                    elif val2 > -0.75:
-                        tile_value = game_data.biome_tile_vals[biome][0][2]
-                    else:
-                        tile_value = game_data.biome_tile_vals[biome][0][1]
-                    wall_value = game_data.biome_tile_vals[biome][1][0]
-                else:  # Surface
-                    val = noise_gen.noise2(
-                        map_index_x / 30 + noise_offsets[1],
-                        map_index_y / 20 + noise_offsets[1],
-                    )
-                    val2 = noise_gen.noise2(map_index_x / 100 + noise_offsets[2], 0.1)
-                    val3 = noise_gen.noise2(
-                        map_index_x / 15 + noise_offsets[0],
-                        map_index_y / 15 + noise_offsets[0],
-                    )
-                    val4 = (
-                            noise_gen.noise2(
-                                map_index_x / 100 + noise_offsets[1],
-                                map_index_y / 75 + noise_offsets[1],
-                            )
-                            + noise_gen.noise2(
-                        map_index_x / 20 + noise_offsets[1],
-                        map_index_y / 8 + noise_offsets[1],
-                    )
-                            * 0.2
-                    )
-                    if map_index_y >= val * 5 + 60 + val2 * 30:
-                        if -0.15 < val4 < 0.15:
-                            tile_value = "tile.none"
-                            wall_value = game_data.biome_tile_vals[biome][1][0]
-                        elif val3 > -0.6:
-                            tile_value = game_data.biome_tile_vals[biome][0][1]
-                            wall_value = game_data.biome_tile_vals[biome][1][0]
-                        else:
-                            tile_value = game_data.biome_tile_vals[biome][0][2]
-                            wall_value = game_data.biome_tile_vals[biome][1][1]
-                        if (
-                                world.tile_data[map_index_x][map_index_y - 1][0] == game_data.air_tile_id
-                                and tile_value == game_data.biome_tile_vals[biome][0][1]
-                        ):
-                            tile_value = game_data.biome_tile_vals[biome][0][0]
-                            wall_value = game_data.biome_tile_vals[biome][1][0]
-                    else:
-                        tile_value = "tile.none"
-                world.tile_data[map_index_x][map_index_y] = [
-                    game_data.get_tile_id_by_id_str(tile_value),
-                    game_data.get_wall_id_by_id_str(wall_value),
-                ]
+        world.tile_grid.tiles, world.tile_grid.walls = generator.generate_layers(0, 0, WORLD_SIZE_X, WORLD_SIZE_Y)
 
         if blit_progress:
             blit_generation_stage("Spawning ores")
@@ -698,39 +713,45 @@ def generate_terrain(gen_type, blit_progress=False) -> None:
         copper_tile_id = game_data.get_tile_id_by_id_str("tile.copper")
         silver_tile_id = game_data.get_tile_id_by_id_str("tile.silver")
 
+        ore_random = generator.get_random("ores")
         for i in range(int(WORLD_SIZE_X * WORLD_SIZE_Y / 1200)):
             create_vein(
-                random.randint(0, WORLD_SIZE_X - 1),
-                random.randint(70, 500),
+                ore_random.randint(0, WORLD_SIZE_X - 1),
+                ore_random.randint(70, 500),
                 copper_tile_id,
-                random.randint(2, 4),
+                ore_random.randint(2, 4),
+                ore_random,
             )
 
         for i in range(int(WORLD_SIZE_X * WORLD_SIZE_Y / 1200)):
             create_vein(
-                random.randint(0, WORLD_SIZE_X - 1),
-                random.randint(70, 500),
+                ore_random.randint(0, WORLD_SIZE_X - 1),
+                ore_random.randint(70, 500),
                 silver_tile_id,
-                random.randint(2, 4),
+                ore_random.randint(2, 4),
+                ore_random,
             )
 
         if blit_progress:
             blit_generation_stage("Placing Pots")
 
+        pot_random = generator.get_random("pots")
         for i in range(int((WORLD_SIZE_X * WORLD_SIZE_Y) / 300)):
             spawn_pot(
-                random.randint(0, WORLD_SIZE_X - 1),
-                random.randint(0, WORLD_SIZE_Y - 50),
+                pot_random.randint(0, WORLD_SIZE_X - 1),
+                pot_random.randint(0, WORLD_SIZE_Y - 50),
+                pot_random,
             )
 
         if blit_progress:
             blit_generation_stage("Generating Structures")
 
+        structure_random = generator.get_random("structures")
         mine_shaft_positions = []
 
         for i in range(math.ceil(WORLD_SIZE_X / 250)):
             while 1:
-                x_pos = random.randint(20, WORLD_SIZE_X - 20)
+                x_pos = structure_random.randint(20, WORLD_SIZE_X - 20)
 
                 can_place = True
 
@@ -740,8 +761,10 @@ def generate_terrain(gen_type, blit_progress=False) -> None:
 
                 if can_place:
                     for y_pos in range(80):
-                        if world.tile_data[x_pos][y_pos][0] != game_data.air_tile_id:
-                            spawn_structure(x_pos, y_pos, "structure.mineshaft_top", (3, 6), True)
+                        if world.tile_grid.get_tile(x_pos, y_pos) != game_data.air_tile_id:
+                            spawn_structure(
+                                x_pos, y_pos, "structure.mineshaft_top", (3, 6), True, rng=structure_random
+                            )
                             break
 
                     mine_shaft_positions.append(x_pos)
@@ -749,53 +772,145 @@ def generate_terrain(gen_type, blit_progress=False) -> None:
 
         for i in range(math.ceil((WORLD_SIZE_X * WORLD_SIZE_Y) / 15000)):
             spawn_structure(
-                random.randint(50, WORLD_SIZE_X - 50),
-                random.randint(100, WORLD_SIZE_Y - 50),
+                structure_random.randint(50, WORLD_SIZE_X - 50),
+                structure_random.randint(100, WORLD_SIZE_Y - 50),
                 "structure.underground_cabin_a",
                 (4, 0),
                 True,
                 check_placement_validity=True,
+                rng=structure_random,
             )
 
         if blit_progress:
             blit_generation_stage("Growing Trees")
 
+        tree_random = generator.get_random("trees")
         for i in range(1, int(WORLD_SIZE_X / 5)):
-            if random.randint(1, 2) == 1:
-                create_tree(i * 5, 0, random.randint(5, 15))
+            if tree_random.randint(1, 2) == 1:
+                create_tree(i * 5, 0, tree_random.randint(5, 15), tree_random)
 
     elif gen_type == "superflat":
-        world.tile_data = []
-        for i in range(WORLD_SIZE_X):
-            world.tile_data.append([])
-            for j in range(WORLD_SIZE_Y):
-                if j > 100:
-                    tile_value = 1
-                    wall_value = 1
-                else:
-                    tile_value = -1
-                    wall_value = -1
-                world.tile_data[i].append([tile_value, wall_value])
+        world.tile_grid = TileGrid(WORLD_SIZE_X, WORLD_SIZE_Y, -1, -1)
+        world.tile_grid.tiles[:, 101:] = 1
+        world.tile_grid.walls[:, 101:] = 1
 
-    create_grounded_spawn_position()
+    create_grounded_spawn_position(generator.get_random("spawn_position"))
 
     print("Generation complete!")
 
 
-def create_terrain_surface() -> None:
+def get_map_colors() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the average color of every tile and wall id's image, black where there is no image
+    """
+    global tile_map_colors, wall_map_colors
+    if tile_map_colors is None or wall_map_colors is None:
+        tile_map_colors = np.zeros((len(game_data.json_tile_data), 3), dtype=np.uint8)
+        for tile_id, tile_data in enumerate(game_data.json_tile_data):
+            if type(tile_data.image) is pygame.Surface:
+                tile_map_colors[tile_id] = pygame.transform.average_color(tile_data.image)[:3]
+        wall_map_colors = np.zeros((len(game_data.json_wall_data), 3), dtype=np.uint8)
+        for wall_id, wall_data in enumerate(game_data.json_wall_data):
+            if type(wall_data.surface) is pygame.Surface:
+                wall_map_colors[wall_id] = pygame.transform.average_color(wall_data.surface)[:3]
+    return tile_map_colors, wall_map_colors
+
+
+def create_world_thumbnail(tile_grid: TileGrid | PaletteTileGrid) -> pygame.Surface:
+    """
+    Draws a small map of the world by sampling tiles at even steps and coloring them by their image
+    """
+    max_width, max_height = game_constants.WORLD_THUMBNAIL_SIZE
+    step = max(1, math.ceil(max(tile_grid.width / max_width, tile_grid.height / max_height)))
+    tiles, walls = tile_grid.sample(step)
+
+    tile_colors, wall_colors = get_map_colors()
+    colors = np.empty((*tiles.shape, 3), dtype=np.uint8)
+    colors[:] = game_constants.WORLD_THUMBNAIL_SKY_COLOR
+    has_wall = walls != game_data.air_wall_id
+    colors[has_wall] = wall_colors[walls[has_wall]]
+    has_tile = tiles != game_data.air_tile_id
+    colors[has_tile] = tile_colors[tiles[has_tile]]
+    return pygame.surfarray.make_surface(colors)
+
+
+def clear_terrain_chunks() -> None:
+    """
+    Drops every rendered terrain chunk, they are rendered again when they next become visible
+    """
+    global terrain_chunks_size_bytes, terrain_revision
+    terrain_chunks.clear()
+    terrain_chunks_size_bytes = 0
+    terrain_revision += 1
+
+
+def render_terrain_chunk(chunk_x, chunk_y) -> pygame.Surface:
+    """
+    Renders all tiles in the given chunk to a new surface
+    """
+    chunk_size = game_constants.TERRAIN_CHUNK_SIZE
+    left = chunk_x * chunk_size
+    top = chunk_y * chunk_size
+    right = min(left + chunk_size, WORLD_SIZE_X)
+    bottom = min(top + chunk_size, WORLD_SIZE_Y)
+
+    chunk_surface = pygame.Surface(((right - left) * commons.BLOCK_SIZE, (bottom - top) * commons.BLOCK_SIZE))
+    chunk_surface.fill((255, 0, 255))
+    chunk_surface.set_colorkey((255, 0, 255))
+    for i in range(left, right):
+        for j in range(top, bottom):
+            if tile_mask_data[i][j] == -1 and wall_tile_mask_data[i][j] == -1:
+                update_tile_masks(i, j)
+            draw_terrain_tile(chunk_surface, i, j, ((i - left) * commons.BLOCK_SIZE, (j - top) * commons.BLOCK_SIZE))
+    return chunk_surface
+
+
+def get_terrain_chunk(chunk_x, chunk_y) -> pygame.Surface:
+    """
+    Returns the surface of the given chunk, rendering it and evicting the least recently used chunks if needed
+    """
+    global terrain_chunks_size_bytes
+    chunk_surface = terrain_chunks.get((chunk_x, chunk_y))
+    if chunk_surface is not None:
+        terrain_chunks.move_to_end((chunk_x, chunk_y))
+        return chunk_surface
+
+    chunk_surface = render_terrain_chunk(chunk_x, chunk_y)
+    terrain_chunks[(chunk_x, chunk_y)] = chunk_surface
+    terrain_chunks_size_bytes += get_surface_size_bytes(chunk_surface)
+
+    while terrain_chunks_size_bytes > game_constants.TERRAIN_CHUNK_CACHE_BUDGET_BYTES and len(terrain_chunks) > 1:
+        _, evicted_surface = terrain_chunks.popitem(last=False)
+        terrain_chunks_size_bytes -= get_surface_size_bytes(evicted_surface)
+    return chunk_surface
+
+
+def get_surface_size_bytes(surface) -> int:
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def draw_terrain(terrain_position) -> None:
     """
-    Renders all tiles in the map to a huge surface
+    Blits the terrain chunks that intersect the screen, given the screen position of the world's top left corner
     """
-    # TextureRenderX = (round(entity_manager.get_client_player().position[0] / commons.BLOCK_SIZE, 0) + 100) * commons.BLOCK_SIZE
-    # TextureRenderY = (round(entity_manager.get_client_player().position[1] / commons.BLOCK_SIZE, 0) + 100) * commons.BLOCK_SIZE
-    global terrain_surface
-    print("Creating Terrain Surface...")
-    terrain_surface = pygame.Surface((WORLD_SIZE_X * commons.BLOCK_SIZE, WORLD_SIZE_Y * commons.BLOCK_SIZE))
-    terrain_surface.fill((255, 0, 255))
-    terrain_surface.set_colorkey((255, 0, 255))
-    for i in range(WORLD_SIZE_X):
-        for j in range(WORLD_SIZE_Y):
-            update_terrain_surface(i, j, affect_others=False)
+    chunk_pixel_size = game_constants.TERRAIN_CHUNK_SIZE * commons.BLOCK_SIZE
+    chunk_count_x = math.ceil(WORLD_SIZE_X / game_constants.TERRAIN_CHUNK_SIZE)
+    chunk_count_y = math.ceil(WORLD_SIZE_Y / game_constants.TERRAIN_CHUNK_SIZE)
+
+    min_chunk_x = max(0, int(-terrain_position[0] // chunk_pixel_size))
+    min_chunk_y = max(0, int(-terrain_position[1] // chunk_pixel_size))
+    max_chunk_x = min(chunk_count_x - 1, int((commons.WINDOW_WIDTH - terrain_position[0]) // chunk_pixel_size))
+    max_chunk_y = min(chunk_count_y - 1, int((commons.WINDOW_HEIGHT - terrain_position[1]) // chunk_pixel_size))
+
+    for chunk_x in range(min_chunk_x, max_chunk_x + 1):
+        for chunk_y in range(min_chunk_y, max_chunk_y + 1):
+            commons.screen.blit(
+                get_terrain_chunk(chunk_x, chunk_y),
+                (
+                    terrain_position[0] + chunk_x * chunk_pixel_size,
+                    terrain_position[1] + chunk_y * chunk_pixel_size,
+                ),
+            )
 
 
 def place_multitile(top_left_x, top_left_y, dimensions, tile_id, update_surface) -> None:
@@ -805,8 +920,8 @@ def place_multitile(top_left_x, top_left_y, dimensions, tile_id, update_surface)
     assert world is not None
     for x in range(dimensions[0]):
         for y in range(dimensions[1]):
-            world.tile_data[top_left_x + x][top_left_y + y][0] = tile_id
-            world.tile_data[top_left_x + x][top_left_y + y].append((x, y))
+            world.tile_grid.set_tile(top_left_x + x, top_left_y + y, tile_id)
+            world.tile_grid.set_multitile_offset(top_left_x + x, top_left_y + y, (x, y))
             if update_surface:
                 update_terrain_surface(top_left_x + x, top_left_y + y)
 
@@ -815,8 +930,8 @@ def get_multitile_origin(x, y) -> tuple[int, int]:
     """
     Get the origin of a multitile
     """
-    tile_data = world.tile_data[x][y]
-    return x - tile_data[2][0], y - tile_data[2][1]
+    offset = world.tile_grid.get_multitile_offset(x, y)
+    return x - offset[0], y - offset[1]
 
 
 def remove_multitile(top_left_pos, drop_items=True, remove_chest_data=True, update_surface=True) -> None:
@@ -824,8 +939,7 @@ def remove_multitile(top_left_pos, drop_items=True, remove_chest_data=True, upda
     Uses special tile relative data to remove all tiles associated with a special tile at a given position
     """
     assert world is not None
-    tile_data = world.tile_data[top_left_pos[0]][top_left_pos[1]]
-    json_tile_data = game_data.get_tile_by_id(tile_data[0])
+    json_tile_data = game_data.get_tile_by_id(world.tile_grid.get_tile(top_left_pos[0], top_left_pos[1]))
     destroy = True
     chest_data_to_remove = -1
 
@@ -851,8 +965,8 @@ def remove_multitile(top_left_pos, drop_items=True, remove_chest_data=True, upda
             for y in range(dimensions[1]):
                 remove_x = top_left_pos[0] + x
                 remove_y = top_left_pos[1] + y
-                world.tile_data[remove_x][remove_y][0] = game_data.air_tile_id
-                world.tile_data[remove_x][remove_y].pop(2)
+                world.tile_grid.set_tile(remove_x, remove_y, game_data.air_tile_id)
+                world.tile_grid.clear_multitile_offset(remove_x, remove_y)
                 if update_surface:
                     update_terrain_surface(remove_x, remove_y)
 
@@ -873,7 +987,7 @@ def use_special_tile(i, j) -> None:
     """
     global world
     assert world is not None
-    tile_id = world.tile_data[i][j][0]
+    tile_id = world.tile_grid.get_tile(i, j)
     tile_data = game_data.get_tile_by_id(tile_id)
 
     if TileTag.CHEST in tile_data.tags:
@@ -883,8 +997,6 @@ def use_special_tile(i, j) -> None:
 
     if TileTag.WORKBENCH in tile_data.tags:
         entity_manager.get_client_player().crafting_menu_offset_y = 120
-        entity_manager.get_client_player().update_craftable_items()
-        entity_manager.get_client_player().render_craftable_items_surf()
         entity_manager.get_client_player().inventory_open = True
         entity_manager.client_prompt = None
 
@@ -927,8 +1039,7 @@ def use_special_tile(i, j) -> None:
 
                 if (
                         not testing_current_tile
-                        and world.tile_data[tile_cycle_origin[0] + x][tile_cycle_origin[1] + y][
-                    0] != game_data.air_tile_id
+                        and world.tile_grid.get_tile(check_x, check_y) != game_data.air_tile_id
                 ):
                     can_cycle = False
                     break
@@ -943,17 +1054,17 @@ def use_special_tile(i, j) -> None:
             if TileTag.MULTI_TILE in tile_data.tags:
                 for x in range(current_tile_dimensions[0]):
                     for y in range(current_tile_dimensions[1]):
-                        world.tile_data[i + x][j + y][0] = game_data.air_tile_id
-                        world.tile_data[i + x][j + y].pop(2)
+                        world.tile_grid.set_tile(i + x, j + y, game_data.air_tile_id)
+                        world.tile_grid.clear_multitile_offset(i + x, j + y)
                         update_terrain_surface(i + x, j + y)
             else:
-                world.tile_data[i][j][0] = game_data.air_tile_id
+                world.tile_grid.set_tile(i, j, game_data.air_tile_id)
 
             # Place the new one
             for x in range(tile_cycle_dimensions[0]):
                 for y in range(tile_cycle_dimensions[1]):
-                    world.tile_data[tile_cycle_origin[0] + x][tile_cycle_origin[1] + y][0] = tile_cycle_data.id
-                    world.tile_data[tile_cycle_origin[0] + x][tile_cycle_origin[1] + y].append((x, y))
+                    world.tile_grid.set_tile(tile_cycle_origin[0] + x, tile_cycle_origin[1] + y, tile_cycle_data.id)
+                    world.tile_grid.set_multitile_offset(tile_cycle_origin[0] + x, tile_cycle_origin[1] + y, (x, y))
                     update_terrain_surface(tile_cycle_origin[0] + x, tile_cycle_origin[1] + y)
 
     commons.WAIT_TO_USE = True
@@ -961,10 +1072,11 @@ def use_special_tile(i, j) -> None:
 
 def update_terrain_surface(i, j, affect_others=True) -> None:
     """
-    Updates a tile in the terrain surface and optionally, the surrounding blocks.
+    Updates a tile in the terrain chunks and optionally, the surrounding blocks.
     """
-    global terrain_surface
+    global terrain_revision
     assert world is not None
+    terrain_revision += 1
     tiles_to_update = []
     if affect_others:
         if i > 0:
@@ -977,115 +1089,178 @@ def update_terrain_surface(i, j, affect_others=True) -> None:
             tiles_to_update.append((i, j + 1))
     tiles_to_update.append((i, j))
 
+    chunk_size = game_constants.TERRAIN_CHUNK_SIZE
     for tile in tiles_to_update:
-        pygame.draw.rect(
-            terrain_surface,
-            (255, 0, 255),
-            Rect(
-                tile[0] * commons.BLOCK_SIZE,
-                tile[1] * commons.BLOCK_SIZE,
-                commons.BLOCK_SIZE,
-                commons.BLOCK_SIZE,
-            ),
-            0,
-        )
-        tile_dat = world.tile_data[tile[0]][tile[1]]
-        json_tile_dat = game_data.get_tile_by_id(tile_dat[0])
-        json_wall_dat = game_data.get_wall_by_id(tile_dat[1])
-
-        if TileTag.NO_DRAW not in json_tile_dat.tags:
-            tile_mask_data[tile[0]][tile[1]] = get_mask_index_from_pos(
-                tile[0], tile[1], tile_dat[0]
-            )  # Get the mask at i, j and store it in the tile_mask_data array
-
-            if TileTag.MULTI_TILE in json_tile_dat.tags:
-                tile_img = pygame.Surface((commons.BLOCK_SIZE, commons.BLOCK_SIZE)).convert()
-                tile_img.blit(
-                    json_tile_dat.image,
-                    (
-                        -tile_dat[2][0] * commons.BLOCK_SIZE,
-                        -tile_dat[2][1] * commons.BLOCK_SIZE,
-                    ),
-                )
-            else:
-                tile_img = json_tile_dat.image.copy()
+        update_tile_masks(tile[0], tile[1])
+
+        # Chunks that are not rendered yet pick up the change when they are
+        chunk_x = tile[0] // chunk_size
+        chunk_y = tile[1] // chunk_size
+        chunk_surface = terrain_chunks.get((chunk_x, chunk_y))
+        if chunk_surface is not None:
+            draw_terrain_tile(
+                chunk_surface,
+                tile[0],
+                tile[1],
+                (
+                    (tile[0] - chunk_x * chunk_size) * commons.BLOCK_SIZE,
+                    (tile[1] - chunk_y * chunk_size) * commons.BLOCK_SIZE,
+                ),
+            )
 
-            tile_img.set_colorkey((255, 0, 255))
 
-            if json_tile_dat.mask_type != TileMaskType.NONE:
-                tile_img.blit(
-                    tilesets.tile_masks[tile_mask_data[tile[0]][tile[1]]],
-                    (0, 0),
-                    None,
-                    pygame.BLEND_RGBA_MULT,
-                )  # Blit the block mask to the block texture using a multiply blend flag
+def update_tile_masks(i, j) -> None:
+    """
+    Picks the tile and wall masks for the tile at the given position based on its neighbors
+    """
+    tile_id = world.tile_grid.get_tile(i, j)
+    wall_id = world.tile_grid.get_wall(i, j)
+    json_tile_dat = game_data.get_tile_by_id(tile_id)
 
-            if (
-                    tile_mask_data[tile[0]][tile[1]] != 14 or TileTag.TRANSPARENT not in json_tile_dat.tags
-            ) and tile_dat[
-                1
-            ] != game_data.air_wall_id:  # If the block is not a center block (and so there is some transparency in it) and there is a wall tile behind it, blit the wall tile
-                back_img = json_wall_dat.surface.copy()  # Get the wall texture
-                wall_tile_mask_data[tile[0]][tile[1]] = get_wall_mask_index_from_pos(
-                    tile[0], tile[1], tile_dat[1]
-                )  # Get the wall mask
-                if get_mask_type_from_index(wall_tile_mask_data[tile[0]][tile[1]]) == get_mask_type_from_index(
-                        tile_mask_data[tile[0]][tile[1]]
-                ):  # If the mask of the wall and the mask of the tile are from the same type
-                    wall_tile_mask_data[tile[0]][tile[1]] = tile_mask_data[tile[0]][
-                        tile[1]
-                    ]  # Set the wall mask to the tile mask
-                back_img.blit(
-                    tilesets.tile_masks[wall_tile_mask_data[tile[0]][tile[1]]],
-                    (0, 0),
-                    None,
-                    pygame.BLEND_RGBA_MULT,
-                )  # Blit the mask onto the wall texture using a multiply blend flag
-                back_img.blit(tile_img, (0, 0))  # Blit the masked block texture to the main surface
-                terrain_surface.blit(
-                    back_img,
-                    (tile[0] * commons.BLOCK_SIZE, tile[1] * commons.BLOCK_SIZE),
-                )  # Blit the masked wall surf to the main surf
-            else:
-                terrain_surface.blit(
-                    tile_img,
-                    (tile[0] * commons.BLOCK_SIZE, tile[1] * commons.BLOCK_SIZE),
-                )  # Blit the masked wall surf to the main surf
+    if TileTag.NO_DRAW not in json_tile_dat.tags:
+        tile_mask_data[i][j] = get_mask_index_from_pos(i, j, tile_id)
+
+    if wall_id != game_data.air_wall_id:
+        wall_tile_mask_data[i][j] = get_wall_mask_index_from_pos(i, j, wall_id)
+        if TileTag.NO_DRAW not in json_tile_dat.tags and get_mask_type_from_index(
+                wall_tile_mask_data[i][j]
+        ) == get_mask_type_from_index(
+            tile_mask_data[i][j]
+        ):  # If the mask of the wall and the mask of the tile are from the same type
+            wall_tile_mask_data[i][j] = tile_mask_data[i][j]  # Set the wall mask to the tile mask
+
+
+def draw_terrain_tile(surface, i, j, position) -> None:
+    """
+    Draws the tile and wall at the given world position to the given surface position using their stored masks
+    """
+    pygame.draw.rect(surface, (255, 0, 255), Rect(position[0], position[1], commons.BLOCK_SIZE, commons.BLOCK_SIZE), 0)
+    tile_id = world.tile_grid.get_tile(i, j)
+    wall_id = world.tile_grid.get_wall(i, j)
+    json_tile_dat = game_data.get_tile_by_id(tile_id)
+
+    # Only keep the parts of the key that change how the cell looks, so equal looking cells share an image
+    if TileTag.NO_DRAW in json_tile_dat.tags:
+        tile_mask_index = -1
+    else:
+        tile_mask_index = tile_mask_data[i][j]
+    if wall_id == game_data.air_wall_id:
+        wall_mask_index = -1
+    else:
+        wall_mask_index = wall_tile_mask_data[i][j]
+    if TileTag.MULTI_TILE in json_tile_dat.tags:
+        multitile_offset = world.tile_grid.get_multitile_offset(i, j)
+    else:
+        multitile_offset = None
+
+    cell_image = get_terrain_cell_image(tile_id, wall_id, tile_mask_index, wall_mask_index, multitile_offset)
+    if cell_image is not None:
+        surface.blit(cell_image, position)
 
-        elif tile_dat[1] != game_data.air_wall_id:  # If there is no block but there is a wall
+
+def get_terrain_cell_image(tile_id, wall_id, tile_mask_index, wall_mask_index, multitile_offset) -> pygame.Surface | None:
+    """
+    Returns the composited image of a tile over a wall, creating it if it is not in the terrain cell cache
+    """
+    global terrain_cell_cache_hits, terrain_cell_cache_misses
+    key = (tile_id, wall_id, tile_mask_index, wall_mask_index, multitile_offset)
+    if key in terrain_cell_cache:
+        terrain_cell_cache_hits += 1
+        terrain_cell_cache.move_to_end(key)
+        return terrain_cell_cache[key]
+
+    terrain_cell_cache_misses += 1
+    cell_image = create_terrain_cell_image(tile_id, wall_id, tile_mask_index, wall_mask_index, multitile_offset)
+    terrain_cell_cache[key] = cell_image
+    if len(terrain_cell_cache) > game_constants.TERRAIN_CELL_CACHE_SIZE:
+        terrain_cell_cache.popitem(last=False)
+    return cell_image
+
+
+def get_terrain_cell_cache_stats() -> dict[str, int]:
+    return {
+        "size": len(terrain_cell_cache),
+        "hits": terrain_cell_cache_hits,
+        "misses": terrain_cell_cache_misses,
+    }
+
+
+def create_terrain_cell_image(tile_id, wall_id, tile_mask_index, wall_mask_index, multitile_offset) -> pygame.Surface | None:
+    """
+    Composites the masked tile image over the masked wall image, returns None if there is nothing to draw
+    """
+    json_tile_dat = game_data.get_tile_by_id(tile_id)
+    json_wall_dat = game_data.get_wall_by_id(wall_id)
+
+    if TileTag.NO_DRAW not in json_tile_dat.tags:
+        if TileTag.MULTI_TILE in json_tile_dat.tags:
+            tile_img = pygame.Surface((commons.BLOCK_SIZE, commons.BLOCK_SIZE)).convert()
+            tile_img.blit(
+                json_tile_dat.image,
+                (
+                    -multitile_offset[0] * commons.BLOCK_SIZE,
+                    -multitile_offset[1] * commons.BLOCK_SIZE,
+                ),
+            )
+        else:
+            tile_img = json_tile_dat.image.copy()
+
+        tile_img.set_colorkey((255, 0, 255))
+
+        if json_tile_dat.mask_type != TileMaskType.NONE:
+            tile_img.blit(
+                tilesets.tile_masks[tile_mask_index],
+                (0, 0),
+                None,
+                pygame.BLEND_RGBA_MULT,
+            )  # Blit the block mask to the block texture using a multiply blend flag
+
+        if (
+                tile_mask_index != 14 or TileTag.TRANSPARENT not in json_tile_dat.tags
+        ) and wall_id != game_data.air_wall_id:  # If the block is not a center block (and so there is some transparency in it) and there is a wall tile behind it, blit the wall tile
             back_img = json_wall_dat.surface.copy()  # Get the wall texture
-            wall_tile_mask_data[tile[0]][tile[1]] = get_wall_mask_index_from_pos(
-                tile[0], tile[1], tile_dat[1]
-            )  # Get the wall mask
             back_img.blit(
-                tilesets.tile_masks[wall_tile_mask_data[tile[0]][tile[1]]],
+                tilesets.tile_masks[wall_mask_index],
                 (0, 0),
                 None,
                 pygame.BLEND_RGBA_MULT,
             )  # Blit the mask onto the wall texture using a multiply blend flag
-            terrain_surface.blit(
-                back_img, (tile[0] * commons.BLOCK_SIZE, tile[1] * commons.BLOCK_SIZE)
-            )  # Blit the masked wall surf to the main surf
+            back_img.blit(tile_img, (0, 0))  # Blit the masked block texture to the main surface
+            return back_img
+        return tile_img
+
+    elif wall_id != game_data.air_wall_id:  # If there is no block but there is a wall
+        back_img = json_wall_dat.surface.copy()  # Get the wall texture
+        back_img.blit(
+            tilesets.tile_masks[wall_mask_index],
+            (0, 0),
+            None,
+            pygame.BLEND_RGBA_MULT,
+        )  # Blit the mask onto the wall texture using a multiply blend flag
+        return back_img
+
+    return None
 
 
-def create_vein(i, j, tile_id, size) -> None:
+def create_vein(i, j, tile_id, size, rng=random) -> None:
     """
     Recursively creates ore at a location
     """
     global world
     assert world is not None
     if tile_in_map(i, j):
-        if world.tile_data[i][j][0] != game_data.air_tile_id and world.tile_data[i][j][0] != tile_id and size > 0:
-            if random.randint(1, 10) == 1:
+        current_tile_id = world.tile_grid.get_tile(i, j)
+        if current_tile_id != game_data.air_tile_id and current_tile_id != tile_id and size > 0:
+            if rng.randint(1, 10) == 1:
                 size += 1
-            world.tile_data[i][j][0] = tile_id
-            create_vein(i - 1, j, tile_id, size - 1)
-            create_vein(i + 1, j, tile_id, size - 1)
-            create_vein(i, j - 1, tile_id, size - 1)
-            create_vein(i, j + 1, tile_id, size - 1)
+            world.tile_grid.set_tile(i, j, tile_id)
+            create_vein(i - 1, j, tile_id, size - 1, rng)
+            create_vein(i + 1, j, tile_id, size - 1, rng)
+            create_vein(i, j - 1, tile_id, size - 1, rng)
+            create_vein(i, j + 1, tile_id, size - 1, rng)
 
 
-def create_tree(i, j, height) -> None:
+def create_tree(i, j, height, rng=random) -> None:
     """
     Spawns a tree at the given location and with the given height
     """
@@ -1100,7 +1275,7 @@ def create_tree(i, j, height) -> None:
     grounded = False
 
     for k in range(WORLD_SIZE_Y - j - 1):
-        tile_id = world.tile_data[i][j + 1][0]
+        tile_id = world.tile_grid.get_tile(i, j + 1)
         leaf_tile = leaves_tile_id
 
         if tile_id == grass_tile_id:
@@ -1120,31 +1295,31 @@ def create_tree(i, j, height) -> None:
     if not grounded:
         return
 
-    if world.tile_data[i - 1][j + 1][0] == grass_tile_id or world.tile_data[i - 1][j + 1][0] == snow_tile_id:
-        world.tile_data[i - 1][j][0] = trunk_tile_id
-    if world.tile_data[i + 1][j + 1][0] == grass_tile_id or world.tile_data[i + 1][j + 1][0] == snow_tile_id:
-        world.tile_data[i + 1][j][0] = trunk_tile_id
+    if world.tile_grid.get_tile(i - 1, j + 1) in (grass_tile_id, snow_tile_id):
+        world.tile_grid.set_tile(i - 1, j, trunk_tile_id)
+    if world.tile_grid.get_tile(i + 1, j + 1) in (grass_tile_id, snow_tile_id):
+        world.tile_grid.set_tile(i + 1, j, trunk_tile_id)
 
     h = height
     for k in range(height):
-        world.tile_data[i][j][0] = trunk_tile_id
+        world.tile_grid.set_tile(i, j, trunk_tile_id)
         if 2 < h < height - 1:
-            if random.randint(1, 5) == 1:
-                if random.randint(0, 1) == 0:
-                    world.tile_data[i - 1][j][0] = leaf_tile
+            if rng.randint(1, 5) == 1:
+                if rng.randint(0, 1) == 0:
+                    world.tile_grid.set_tile(i - 1, j, leaf_tile)
                 else:
-                    world.tile_data[i + 1][j][0] = leaf_tile
+                    world.tile_grid.set_tile(i + 1, j, leaf_tile)
         h -= 1
         j -= 1
     # Create canopy
     for k in range(-1, 2):
-        world.tile_data[i + k][j - 2][0] = leaf_tile
+        world.tile_grid.set_tile(i + k, j - 2, leaf_tile)
     for k in range(-2, 3):
-        world.tile_data[i + k][j - 1][0] = leaf_tile
+        world.tile_grid.set_tile(i + k, j - 1, leaf_tile)
     for k in range(-2, 3):
-        world.tile_data[i + k][j][0] = leaf_tile
-    world.tile_data[i - 1][j + 1][0] = leaf_tile
-    world.tile_data[i + 1][j + 1][0] = leaf_tile
+        world.tile_grid.set_tile(i + k, j, leaf_tile)
+    world.tile_grid.set_tile(i - 1, j + 1, leaf_tile)
+    world.tile_grid.set_tile(i + 1, j + 1, leaf_tile)
 
 
 def spawn_structure(
@@ -1155,6 +1330,7 @@ def spawn_structure(
         allow_connection_connecting_from=False,
         remaining_parts=20,
         check_placement_validity=False,
+        rng=random,
 ) -> None:
     """
     Creates a structure at the given position using the data stored in the structure_tiles table and the given structure id
@@ -1196,7 +1372,7 @@ def spawn_structure(
             world_y = structure_world_top_left[1] + y
             tile_data = structure_data.tile_data[x][y]
             if tile_data[0] is not None:
-                existing_tile_data = game_data.get_tile_by_id(world.tile_data[world_x][world_y][0])
+                existing_tile_data = game_data.get_tile_by_id(world.tile_grid.get_tile(world_x, world_y))
 
                 if TileTag.MULTI_TILE in existing_tile_data.tags:
                     tile_origin = get_multitile_origin(world_x, world_y)
@@ -1226,10 +1402,10 @@ def spawn_structure(
                         False,
                     )
                 else:
-                    world.tile_data[world_x][world_y][0] = new_tile.id
+                    world.tile_grid.set_tile(world_x, world_y, new_tile.id)
 
             if tile_data[1] is not None:
-                world.tile_data[world_x][world_y][1] = game_data.get_wall_id_by_id_str(tile_data[1])
+                world.tile_grid.set_wall(world_x, world_y, game_data.get_wall_id_by_id_str(tile_data[1]))
 
     # Create chest loot
     for chest in structure_data.chest_loot:
@@ -1237,7 +1413,7 @@ def spawn_structure(
             structure_world_top_left[0] + chest[0][0],
             structure_world_top_left[1] + chest[0][1],
         )
-        item_list = item.generate_loot_items(chest[1], tile_origin, True)
+        item_list = item.generate_loot_items(chest[1], tile_origin, True, rng)
         world.chest_data.append([tile_origin, item_list])
 
     if remaining_parts == 0:
@@ -1269,7 +1445,7 @@ def spawn_structure(
                         possible_connections.pop(possible_connection_index)
 
                 if len(possible_connections) > 0:
-                    random_pick = random.randint(0, total_weight)
+                    random_pick = rng.randint(0, total_weight)
 
                     for possible_connection in possible_connections:
                         possible_structure_data = game_data.get_structure_by_id_str(possible_connection[0])
@@ -1281,6 +1457,7 @@ def spawn_structure(
                                 possible_connection[1],
                                 False,
                                 remaining_parts - 1,
+                                rng=rng,
                             )
                             break
                         else:
@@ -1309,13 +1486,13 @@ def is_structure_rect_valid(structure_rect, rect_index_to_ignore=-1) -> bool:
     return False
 
 
-def create_grounded_spawn_position() -> None:
+def create_grounded_spawn_position(rng=random) -> None:
     """
     Creates a random spawn point on the x-axis, then places it on the ground
     """
     global world
     assert world is not None
-    block_pos_x = random.randint(20, max(20, WORLD_SIZE_X - 20))
+    block_pos_x = rng.randint(20, max(20, WORLD_SIZE_X - 20))
     world.spawn_position = (commons.BLOCK_SIZE * block_pos_x, commons.BLOCK_SIZE * 1.5)
     for i in range(300):
         world.spawn_position = (
@@ -1326,8 +1503,8 @@ def create_grounded_spawn_position() -> None:
         y = int(world.spawn_position[1] + commons.BLOCK_SIZE) // commons.BLOCK_SIZE
         x2 = int(world.spawn_position[0] + commons.BLOCK_SIZE * 0.5) // commons.BLOCK_SIZE
 
-        left_tile_dat = game_data.get_tile_by_id(world.tile_data[x1][y][0])
-        right_tile_dat = game_data.get_tile_by_id(world.tile_data[x2][y][0])
+        left_tile_dat = game_data.get_tile_by_id(world.tile_grid.get_tile(x1, y))
+        right_tile_dat = game_data.get_tile_by_id(world.tile_grid.get_tile(x2, y))
 
         if TileTag.NO_COLLIDE not in left_tile_dat.tags and TileTag.NO_COLLIDE not in right_tile_dat.tags:
             world.spawn_position = (
@@ -1359,14 +1536,14 @@ def grow_grass() -> None:
     for i in range(int(WORLD_SIZE_X * 0.05)):
         random_x = random.randint(0, WORLD_SIZE_X - 1)
         for j in range(110):
-            if world.tile_data[random_x][j][0] != -1:
-                if world.tile_data[random_x][j][0] == 0:
-                    world.tile_data[random_x][j][0] = 5
+            if world.tile_grid.get_tile(random_x, j) != -1:
+                if world.tile_grid.get_tile(random_x, j) == 0:
+                    world.tile_grid.set_tile(random_x, j, 5)
                     update_terrain_surface(random_x, j)
                 break
 
 
-def spawn_pot(pos_x, pos_y) -> None:
+def spawn_pot(pos_x, pos_y, rng=random) -> None:
     """
     Checks 50 tiles below the target location for two tiles with a backwall and no block
     """
@@ -1375,12 +1552,12 @@ def spawn_pot(pos_x, pos_y) -> None:
     viable_blocks = 0
     for i in range(50):
         if tile_in_map(pos_x, pos_y):
-            if viable_blocks >= 1 and world.tile_data[pos_x][pos_y][0] != game_data.air_tile_id:
+            if viable_blocks >= 1 and world.tile_grid.get_tile(pos_x, pos_y) != game_data.air_tile_id:
                 pot_options = ["tile.pot_short_gray", "tile.pot_short_brown"]
                 if viable_blocks >= 2:
                     pot_options += ["tile.pot_tall_gray", "tile.pot_tall_brown"]
 
-                random_choice = pot_options[random.randint(0, len(pot_options) - 1)]
+                random_choice = pot_options[rng.randint(0, len(pot_options) - 1)]
                 random_choice_tile_data = game_data.get_tile_by_id_str(random_choice)
 
                 if TileTag.MULTI_TILE in random_choice_tile_data.tags:
@@ -1393,12 +1570,12 @@ def spawn_pot(pos_x, pos_y) -> None:
                         False,
                     )
                 else:
-                    world.tile_data[pos_x][pos_y - 1][0] = random_choice_tile_data.id
+                    world.tile_grid.set_tile(pos_x, pos_y - 1, random_choice_tile_data.id)
                 return
 
             if (
-                    world.tile_data[pos_x][pos_y][0] == game_data.air_tile_id
-                    and world.tile_data[pos_x][pos_y][1] != game_data.air_wall_id
+                    world.tile_grid.get_tile(pos_x, pos_y) == game_data.air_tile_id
+                    and world.tile_grid.get_wall(pos_x, pos_y) != game_data.air_wall_id
             ):
                 viable_blocks += 1
 
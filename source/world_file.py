@@ -0,0 +1,220 @@
+"""
+Binary world file format.
+
+A file starts with a fixed header, the tile and wall id string palettes the stored ids refer to and a table
+holding the offset and length of every chunk. Chunks are square blocks of cells compressed separately, so a save only
+has to append the chunks that changed and point the table at them. Since version 2 a chunk is stored as a
+PaletteChunk, a single cell when the whole chunk holds it and otherwise the chunk's distinct cells followed by an
+index into them for every cell. Version 1 chunks hold the raw tile, wall and multitile offset planes.
+"""
+import os
+import struct
+import zlib
+
+import numpy as np
+
+import game_constants
+from tile_grid import PaletteChunk, PaletteTileGrid, TileGrid
+
+WORLD_FILE_MAGIC = b"TWLD"
+HEADER_FORMAT = "<4sHIIH"  # Magic, version, width, height, chunk size
+PALETTE_LENGTH_FORMAT = "<I"
+PALETTE_ENTRY_FORMAT = "<H"
+CHUNK_ENTRY_FORMAT = "<QI"  # Offset, compressed length
+CHUNK_ENTRY_SIZE = struct.calcsize(CHUNK_ENTRY_FORMAT)
+CELL_DTYPE = np.dtype("<i2")
+
+
+class WorldFileHeader:
+    """
+    Everything in a world file that comes before the chunk data
+    """
+
+    def __init__(self, version: int, width: int, height: int, chunk_size: int, tile_palette: list[str], wall_palette: list[str]):
+        self.version = version
+        self.width = width
+        self.height = height
+        self.chunk_size = chunk_size
+        self.tile_palette = tile_palette
+        self.wall_palette = wall_palette
+        self.chunk_table_offset = 0
+        self.chunk_entries: list[tuple[int, int]] = []
+
+    @property
+    def chunks_x(self) -> int:
+        return -(-self.width // self.chunk_size)
+
+    @property
+    def chunks_y(self) -> int:
+        return -(-self.height // self.chunk_size)
+
+    def get_chunk_index(self, chunk_x: int, chunk_y: int) -> int:
+        return chunk_x * self.chunks_y + chunk_y
+
+    def get_data_offset(self) -> int:
+        return self.chunk_table_offset + len(self.chunk_entries) * CHUNK_ENTRY_SIZE
+
+
+def write_palette(file, palette: list[str]) -> None:
+    file.write(struct.pack(PALETTE_LENGTH_FORMAT, len(palette)))
+    for id_str in palette:
+        encoded = id_str.encode("utf-8")
+        file.write(struct.pack(PALETTE_ENTRY_FORMAT, len(encoded)))
+        file.write(encoded)
+
+
+def read_palette(file) -> list[str]:
+    (length,) = struct.unpack(PALETTE_LENGTH_FORMAT, file.read(struct.calcsize(PALETTE_LENGTH_FORMAT)))
+    palette = []
+    for _ in range(length):
+        (entry_length,) = struct.unpack(PALETTE_ENTRY_FORMAT, file.read(struct.calcsize(PALETTE_ENTRY_FORMAT)))
+        palette.append(file.read(entry_length).decode("utf-8"))
+    return palette
+
+
+def is_world_file(path: str) -> bool:
+    """
+    Checks whether the file at the given path is in this format rather than an older pickled world
+    """
+    with open(path, "rb") as file:
+        return file.read(len(WORLD_FILE_MAGIC)) == WORLD_FILE_MAGIC
+
+
+def read_header(file) -> WorldFileHeader:
+    """
+    Reads the header, palettes and chunk table from the start of a world file
+    """
+    magic, version, width, height, chunk_size = struct.unpack(HEADER_FORMAT, file.read(struct.calcsize(HEADER_FORMAT)))
+    if magic != WORLD_FILE_MAGIC:
+        raise ValueError("Not a world file")
+    if version > game_constants.WORLD_FILE_VERSION:
+        raise ValueError(f"World file version {version} is newer than this game supports")
+    header = WorldFileHeader(version, width, height, chunk_size, read_palette(file), read_palette(file))
+    header.chunk_table_offset = file.tell()
+    chunk_table = file.read(header.chunks_x * header.chunks_y * CHUNK_ENTRY_SIZE)
+    header.chunk_entries = list(struct.iter_unpack(CHUNK_ENTRY_FORMAT, chunk_table))
+    return header
+
+
+def encode_chunk(tile_grid: TileGrid | PaletteTileGrid, chunk_x: int, chunk_y: int, chunk_size: int) -> bytes:
+    """
+    Compresses the cells of a chunk into one block
+    """
+    return tile_grid.get_chunk(chunk_x, chunk_y, chunk_size).encode(game_constants.WORLD_FILE_COMPRESSION_LEVEL)
+
+
+def decode_chunk(header: WorldFileHeader, data: bytes, width: int, height: int) -> PaletteChunk | np.ndarray:
+    """
+    Decompresses a chunk, version 1 chunks come back as their stacked tile, wall and multitile offset planes
+    """
+    if header.version == 1:
+        return np.frombuffer(zlib.decompress(data), dtype=CELL_DTYPE).reshape(3, width, height)
+    return PaletteChunk.decode(data, width, height)
+
+
+def write_full(path: str, tile_grid: TileGrid | PaletteTileGrid, tile_palette: list[str], wall_palette: list[str]) -> None:
+    """
+    Writes every chunk of the grid to a new file that replaces the old one once complete
+    """
+    header = WorldFileHeader(
+        game_constants.WORLD_FILE_VERSION,
+        tile_grid.width,
+        tile_grid.height,
+        game_constants.WORLD_FILE_CHUNK_SIZE,
+        tile_palette,
+        wall_palette,
+    )
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(struct.pack(HEADER_FORMAT, WORLD_FILE_MAGIC, header.version, header.width, header.height, header.chunk_size))
+        write_palette(file, tile_palette)
+        write_palette(file, wall_palette)
+        header.chunk_table_offset = file.tell()
+        chunk_count = header.chunks_x * header.chunks_y
+        file.write(bytes(chunk_count * CHUNK_ENTRY_SIZE))
+
+        chunk_table = bytearray()
+        for chunk_x in range(header.chunks_x):
+            for chunk_y in range(header.chunks_y):
+                data = encode_chunk(tile_grid, chunk_x, chunk_y, header.chunk_size)
+                chunk_table += struct.pack(CHUNK_ENTRY_FORMAT, file.tell(), len(data))
+                file.write(data)
+
+        file.seek(header.chunk_table_offset)
+        file.write(chunk_table)
+    os.replace(temporary_path, path)
+
+
+def write_dirty(path: str, tile_grid: TileGrid | PaletteTileGrid, tile_palette: list[str], wall_palette: list[str]) -> bool:
+    """
+    Appends the chunks changed since the last save to an existing file and points its table at them,
+    returns False if the file has to be written in full instead
+    """
+    with open(path, "r+b") as file:
+        try:
+            header = read_header(file)
+        except (ValueError, struct.error):
+            return False
+        if (
+                header.version != game_constants.WORLD_FILE_VERSION
+                or (header.width, header.height) != (tile_grid.width, tile_grid.height)
+                or header.chunk_size != game_constants.WORLD_FILE_CHUNK_SIZE
+                or header.tile_palette != tile_palette
+                or header.wall_palette != wall_palette
+        ):
+            return False
+
+        # Rewrite the file once replaced chunks take up more space than the live ones
+        file_size = file.seek(0, os.SEEK_END)
+        live_size = sum(length for _, length in header.chunk_entries)
+        if file_size - header.get_data_offset() > live_size * 2:
+            return False
+
+        for chunk_x, chunk_y in sorted(tile_grid.dirty_chunks):
+            data = encode_chunk(tile_grid, chunk_x, chunk_y, header.chunk_size)
+            offset = file.seek(0, os.SEEK_END)
+            file.write(data)
+            file.seek(header.chunk_table_offset + header.get_chunk_index(chunk_x, chunk_y) * CHUNK_ENTRY_SIZE)
+            file.write(struct.pack(CHUNK_ENTRY_FORMAT, offset, len(data)))
+    return True
+
+
+def save_tile_grid(path: str, tile_grid: TileGrid | PaletteTileGrid, tile_palette: list[str], wall_palette: list[str]) -> None:
+    """
+    Saves the grid, only writing the chunks that changed when the file on disk allows it
+    """
+    if tile_grid.all_dirty or not os.path.isfile(path) or not write_dirty(path, tile_grid, tile_palette, wall_palette):
+        write_full(path, tile_grid, tile_palette, wall_palette)
+    tile_grid.clear_dirty()
+
+
+def load_tile_grid(path: str, compact: bool = False) -> tuple[TileGrid | PaletteTileGrid, list[str], list[str]]:
+    """
+    Loads a grid along with the tile and wall palettes its ids refer to, keeping it as palette chunks if compact
+    """
+    with open(path, "rb") as file:
+        header = read_header(file)
+        compact = compact and header.chunk_size == game_constants.WORLD_FILE_CHUNK_SIZE
+        planes = None if compact else np.empty((3, header.width, header.height), dtype=np.int16)
+        chunks = []
+        for chunk_x in range(header.chunks_x):
+            column = []
+            for chunk_y in range(header.chunks_y):
+                offset, length = header.chunk_entries[header.get_chunk_index(chunk_x, chunk_y)]
+                file.seek(offset)
+                left, top = chunk_x * header.chunk_size, chunk_y * header.chunk_size
+                width = min(header.chunk_size, header.width - left)
+                height = min(header.chunk_size, header.height - top)
+                chunk = decode_chunk(header, file.read(length), width, height)
+                if compact:
+                    column.append(PaletteChunk.from_planes(*chunk) if type(chunk) is np.ndarray else chunk)
+                else:
+                    planes[:, left:left + width, top:top + height] = chunk if type(chunk) is np.ndarray else chunk.to_planes()
+            chunks.append(column)
+    if compact:
+        tile_grid = PaletteTileGrid(header.width, header.height, chunks)
+    else:
+        tile_grid = TileGrid(header.width, header.height)
+        tile_grid.tiles, tile_grid.walls, tile_grid.multitile_offsets = planes
+    tile_grid.clear_dirty()
+    return tile_grid, header.tile_palette, header.wall_palette